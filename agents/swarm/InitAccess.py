@@ -7,8 +7,10 @@ except ModuleNotFoundError:
 from src.prompts.prompt_loader import load_prompt
 from src.tools.handoff import handoff_to_planner, handoff_to_reconnaissance, handoff_to_summary
 from src.utils.llm.config_manager import get_current_llm
-from src.utils.memory import get_store 
+from src.utils.memory import create_memory_namespace, get_store 
 from src.utils.mcp.mcp_loader import load_mcp_tools
+from src.utils.hooks import create_pre_model_hook
+from src.utils.llm.prompt_cache import build_cached_prompt
 
 async def make_initaccess_agent():
     llm = get_current_llm()
@@ -40,8 +42,8 @@ async def make_initaccess_agent():
         mem_tools = []
     else:
         mem_tools = [
-            create_manage_memory_tool(namespace=("memories",), store=store),
-            create_search_memory_tool(namespace=("memories",), store=store)
+            create_manage_memory_tool(namespace=create_memory_namespace(), store=store),
+            create_search_memory_tool(namespace=create_memory_namespace(), store=store)
         ]
 
     tools = mcp_tools + swarm_tools + mem_tools
@@ -51,6 +53,7 @@ async def make_initaccess_agent():
         tools=tools,
         store=store,
         name="Initial_Access",
-        prompt=load_prompt("initial_access", "swarm"),
+        prompt=build_cached_prompt(llm, load_prompt("initial_access", "swarm")),
+        pre_model_hook=create_pre_model_hook("Initial_Access"),
     )
     return agent
\ No newline at end of file
@@ -5,10 +5,14 @@ except ModuleNotFoundError:
     create_manage_memory_tool = None
     create_search_memory_tool = None
 from src.prompts.prompt_loader import load_prompt
-from src.tools.handoff import handoff_to_initial_access, handoff_to_reconnaissance, handoff_to_summary
+from src.tools.handoff import handoff_to_initial_access, handoff_to_reconnaissance, handoff_to_summary, dispatch_parallel_tasks
+from src.prompts.tools.swarm_handoff_tools import PARALLEL_DISPATCH_TOOL_PROMPT
 from src.utils.llm.config_manager import get_current_llm
-from src.utils.memory import get_store 
+from src.utils.memory import create_memory_namespace, get_store 
 from src.utils.mcp.mcp_loader import load_mcp_tools
+from src.utils.hooks import create_pre_model_hook
+from src.utils.llm.prompt_cache import build_cached_prompt
+from src.utils.swarm.swarm import get_max_parallel_branches
 
 async def make_planner_agent():
     # planner 에이전트에 연결된 mcp_tools가 없을 수도 있으므로 예외처리 가능
@@ -36,12 +40,18 @@ async def make_planner_agent():
         handoff_to_summary,
     ]
 
+    # 병렬 분기가 활성화된 경우에만 fan-out 도구 제공
+    prompt = load_prompt("planner", "swarm")
+    if get_max_parallel_branches() > 0:
+        swarm_tools.append(dispatch_parallel_tasks)
+        prompt += PARALLEL_DISPATCH_TOOL_PROMPT
+
     if create_manage_memory_tool is None or create_search_memory_tool is None:
         mem_tools = []
     else:
         mem_tools = [
-            create_manage_memory_tool(namespace=("memories",), store=store),
-            create_search_memory_tool(namespace=("memories",), store=store)
+            create_manage_memory_tool(namespace=create_memory_namespace(), store=store),
+            create_search_memory_tool(namespace=create_memory_namespace(), store=store)
         ]
 
     tools = mcp_tools + swarm_tools + mem_tools
@@ -51,6 +61,7 @@ async def make_planner_agent():
         tools=tools,
         store=store,
         name="Planner",
-        prompt=load_prompt("planner", "swarm")
+        prompt=build_cached_prompt(llm, prompt),
+        pre_model_hook=create_pre_model_hook("Planner")
     )
     return agent
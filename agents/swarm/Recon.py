@@ -7,9 +7,11 @@ except ModuleNotFoundError:
     create_manage_memory_tool = None
     create_search_memory_tool = None
 from src.utils.llm.config_manager import get_current_llm
-from src.utils.memory import get_store 
+from src.utils.memory import create_memory_namespace, get_store 
 
 from src.utils.mcp.mcp_loader import load_mcp_tools
+from src.utils.hooks import create_pre_model_hook
+from src.utils.llm.prompt_cache import build_cached_prompt
 
 async def make_recon_agent():
     # reconnaissance 서버만 MCP 도구 로드
@@ -35,8 +37,8 @@ async def make_recon_agent():
         mem_tools = []
     else:
         mem_tools = [
-            create_manage_memory_tool(namespace=("memories",), store=store),
-            create_search_memory_tool(namespace=("memories",), store=store)
+            create_manage_memory_tool(namespace=create_memory_namespace(), store=store),
+            create_search_memory_tool(namespace=create_memory_namespace(), store=store)
         ]
 
         
@@ -48,6 +50,7 @@ async def make_recon_agent():
         tools=tools,
         store=store,
         name="Reconnaissance",
-        prompt=load_prompt("reconnaissance", "swarm")
+        prompt=build_cached_prompt(llm, load_prompt("reconnaissance", "swarm")),
+        pre_model_hook=create_pre_model_hook("Reconnaissance")
     )
     return agent
\ No newline at end of file
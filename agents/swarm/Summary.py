@@ -7,9 +7,11 @@ except ModuleNotFoundError:
 from src.prompts.prompt_loader import load_prompt
 from src.tools.handoff import handoff_to_initial_access, handoff_to_reconnaissance, handoff_to_planner
 from src.utils.llm.config_manager import get_current_llm
-from src.utils.memory import get_store
+from src.utils.memory import create_memory_namespace, get_store
 
 from src.utils.mcp.mcp_loader import load_mcp_tools
+from src.utils.hooks import create_pre_model_hook
+from src.utils.llm.prompt_cache import build_cached_prompt
 
 async def make_summary_agent():
     # 메모리에서 LLM 로드 (없으면 기본값 사용)
@@ -34,8 +36,8 @@ async def make_summary_agent():
         mem_tools = []
     else:
         mem_tools = [
-            create_manage_memory_tool(namespace=("memories",), store=store),
-            create_search_memory_tool(namespace=("memories",), store=store)
+            create_manage_memory_tool(namespace=create_memory_namespace(), store=store),
+            create_search_memory_tool(namespace=create_memory_namespace(), store=store)
         ]
 
     tools = mcp_tools + swarm_tools + mem_tools
@@ -45,6 +47,7 @@ async def make_summary_agent():
         tools=tools,
         store=store,
         name="Summary",
-        prompt=load_prompt("summary", "swarm")
+        prompt=build_cached_prompt(llm, load_prompt("summary", "swarm")),
+        pre_model_hook=create_pre_model_hook("Summary")
     )
     return agent
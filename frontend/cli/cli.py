@@ -51,6 +51,7 @@ from src.utils.llm.config_manager import (
 from src.utils.message import (
     extract_message_content,
     extract_tool_calls,
+    extract_token_usage,
     parse_tool_call,
     get_agent_name,
     parse_tool_name
@@ -64,6 +65,8 @@ from src.utils.memory import (
 )
 # 로깅 시스템 사용 - 재현에 필요한 정보만
 from src.utils.logging.logger import get_logger
+from src.utils.supervisor import RunStoppedError
+from src.utils.mcp.tool_memo import get_tool_memo
 # 리팩토링된 에이전트 관리자
 from src.utils.agents import AgentManager
 
@@ -92,7 +95,8 @@ class DecepticonCLI:
         
         # Persistence 초기화
         self.user_id = self._generate_user_id()
-        self.memory_namespace = create_memory_namespace(self.user_id, "memories")
+        # 에이전트는 ("memories", thread_id)를 사용 - setup_session의 thread config와 같은 대화 ID
+        self.memory_namespace = create_memory_namespace(self.user_id, "memories", conversation_id="cli_session")
         
         # 로깅 시스템 초기화 - 재현에 필요한 정보만
         self.logger = get_logger()
@@ -176,6 +180,7 @@ class DecepticonCLI:
             "[green]• mcp-info[/green] - Show MCP tools information",
             "[green]• memory-info[/green] - Show persistence and memory status",
             "[green]• logs[/green] - Show conversation logs and statistics",
+            "[green]• log-search <terms>[/green] - Search past session logs",
             "[green]• clear[/green] - Clear the screen",
             "[green]• quit/exit[/green] - Exit the program",
             "",
@@ -581,17 +586,16 @@ class DecepticonCLI:
                     title="[bold yellow]📝 Logging Status[/bold yellow]"
                 ))
             
-            # 로깅 통계
-            sessions = self.logger.list_sessions(limit=50)
-            
-            total_events = sum(s['event_count'] for s in sessions)
-            avg_events = total_events / len(sessions) if sessions else 0
+            # 로깅 통계 (인덱스/집계 테이블만 읽음)
+            stats = self.logger.get_session_stats()
             
             stats_panel = Panel(
                 f"[bold magenta]📊 Overall Statistics[/bold magenta]\n\n"
-                f"[cyan]Total Sessions:[/cyan] [bold]{len(sessions)}[/bold]\n"
-                f"[cyan]Total Events:[/cyan] [bold]{total_events}[/bold]\n"
-                f"[cyan]Avg Events/Session:[/cyan] [bold]{avg_events:.1f}[/bold]\n\n"
+                f"[cyan]Total Sessions:[/cyan] [bold]{stats.get('total_sessions', 0)}[/bold]\n"
+                f"[cyan]Total Events:[/cyan] [bold]{stats.get('total_events', 0)}[/bold]\n"
+                f"[cyan]Avg Events/Session:[/cyan] [bold]{stats.get('avg_events_per_session', 0):.1f}[/bold]\n"
+                f"[cyan]Tokens:[/cyan] [bold]{stats.get('total_tokens', 0):,}[/bold] "
+                f"[dim](reported in {stats.get('input_tokens', 0):,} / out {stats.get('output_tokens', 0):,})[/dim]\n\n"
                 f"[cyan]Platform:[/cyan] [bold]CLI[/bold]\n"
                 f"[cyan]Logging Type:[/cyan] [bold]Minimal (Replay-focused)[/bold]",
                 box=box.ROUNDED,
@@ -600,13 +604,25 @@ class DecepticonCLI:
             )
             self.console.print(stats_panel)
             
+            # 에이전트/도구별 통계 (이벤트 수 상위 5개)
+            for title, key, name_key in (("🤖 Agents", "agents", "agent_name"), ("🛠️ Tools", "tools", "tool_name")):
+                rows = stats.get(key, [])[:5]
+                if not rows:
+                    continue
+                self.console.print(f"\n[bold green]{title}[/bold green]")
+                for row in rows:
+                    self.console.print(
+                        f"  [cyan]{row[name_key]}[/cyan] - [blue]{row['event_count']} events[/blue], "
+                        f"{row['duration_ms'] / 1000:.1f}s, ~{row['tokens']:,} tokens"
+                    )
+            
             # 최근 세션 목록
-            recent_sessions = sessions[:10]  # 최대 10개
+            recent_sessions = self.logger.list_sessions(limit=5)
             
             if recent_sessions:
-                self.console.print(f"\n[bold green]📅 Recent Sessions ({len(recent_sessions)} sessions)[/bold green]\n")
+                self.console.print(f"\n[bold green]📅 Recent Sessions ({len(recent_sessions)} of {stats.get('total_sessions', 0)} sessions)[/bold green]\n")
                 
-                for i, session in enumerate(recent_sessions[:5]):  # 최대 5개만 표시
+                for i, session in enumerate(recent_sessions):
                     start_time = session['start_time'][:19].replace('T', ' ')
                     
                     session_info = f"💻 [cyan]{start_time}[/cyan] - "
@@ -620,9 +636,6 @@ class DecepticonCLI:
                         session_info += f"\n    [dim]{session['preview']}[/dim]"
                     
                     self.console.print(f"  {i+1}. {session_info}")
-                
-                if len(recent_sessions) > 5:
-                    self.console.print(f"  [dim]... and {len(recent_sessions) - 5} more sessions[/dim]")
             else:
                 self.console.print("\n[yellow]📅 No recent sessions found[/yellow]")
             
@@ -639,6 +652,41 @@ class DecepticonCLI:
                 border_style="red",
                 title="Logs Error"
             ))
+    
+    def display_log_search(self, query: str):
+        """세션 로그 전문 검색 결과 표시"""
+        try:
+            results = self.logger.search_sessions(query, limit=10)
+            
+            if not results:
+                self.console.print(f"\n[yellow]🔍 No sessions matching '{query}'[/yellow]")
+                return
+            
+            self.console.print(f"\n[bold green]🔍 {len(results)} sessions matching '{query}'[/bold green]\n")
+            
+            for i, session in enumerate(results):
+                start_time = (session.get('start_time') or '')[:19].replace('T', ' ')
+                
+                session_info = f"💻 [cyan]{start_time}[/cyan] - "
+                session_info += f"[bold]{session['session_id'][:8]}...[/bold] "
+                session_info += f"([blue]{session['hit_count']} hits[/blue])"
+                
+                if session.get('model'):
+                    session_info += f" - [yellow]{session['model']}[/yellow]"
+                
+                if session.get('snippet'):
+                    session_info += f"\n    [dim]{markup.escape(session['snippet'])}[/dim]"
+                
+                self.console.print(f"  {i+1}. {session_info}")
+            
+        except Exception as e:
+            self.console.print(Panel(
+                f"[red]❌ Error searching conversation logs[/red]\n\n"
+                f"[yellow]Error:[/yellow] {str(e)}",
+                box=box.ROUNDED,
+                border_style="red",
+                title="Search Error"
+            ))
             
     async def change_model(self):
         """세션 도중 모델 변경"""
@@ -782,6 +830,7 @@ class DecepticonCLI:
     • [green]mcp-info[/green] - Show MCP tools information
     • [green]memory-info[/green] - Show persistence and memory status
     • [green]logs[/green] - Show conversation logs and statistics
+    • [green]log-search <terms>[/green] - Search past session logs (e.g. log-search 10.0.0.5 ssh)
     • [green]clear[/green] - Clear the screen
     • [green]quit/exit[/green] - Exit the program
 
@@ -859,6 +908,10 @@ class DecepticonCLI:
         # 메시지 ID 추적 초기화 (새로운 워크플로우 시작)
         self.processed_message_ids = set()
         
+        # 새 실행 - 도구 호출 메모 테이블 초기화
+        if self.thread_id:
+            get_tool_memo().start_run(self.thread_id)
+        
         inputs = {"messages": [HumanMessage(content=user_input)]}
         
         # 워크플로우 실행
@@ -916,7 +969,8 @@ class DecepticonCLI:
                                             self.logger.log_agent_response(
                                                 agent_name=agent_name,
                                                 content=original_content,
-                                                tool_calls=tool_calls if tool_calls else None
+                                                tool_calls=tool_calls if tool_calls else None,
+                                                usage=extract_token_usage(latest_message)
                                             )
 
                                             try:
@@ -1040,6 +1094,24 @@ class DecepticonCLI:
 
                 return True
 
+            except RunStoppedError as e:
+                # 감독자가 루프/예산 초과를 감지하여 조기 종료
+                progress.stop()
+                self.logger.save_session()
+
+                stopped_panel = Panel(
+                    f"[bold yellow]⚠️ Run stopped early[/bold yellow]\n\n"
+                    f"[cyan]🤖 Agent:[/cyan] {e.agent_name}\n"
+                    f"[cyan]📝 Reason:[/cyan] {markup.escape(e.reason)}\n"
+                    f"[cyan]🔄 Steps:[/cyan] {step_count}",
+                    box=box.ROUNDED,
+                    border_style="yellow",
+                    title="[bold yellow]🛑 Supervisor[/bold yellow]"
+                )
+                self.console.print(stopped_panel)
+
+                return True
+
             except Exception as e:
                 progress.update(main_task, description=f"[bold red]❌ Error: {str(e)}")
                 time.sleep(2)
@@ -1110,6 +1182,8 @@ class DecepticonCLI:
                     self.display_memory_info()
                 elif user_input.lower() in ['logs', 'log-info', 'conversation-logs']:
                     self.display_conversation_logs()
+                elif user_input.lower().startswith('log-search '):
+                    self.display_log_search(user_input[len('log-search '):].strip())
                 elif user_input.lower() == 'clear':
                     self.console.clear()
                     self.display_banner()
@@ -40,6 +40,7 @@ def main():
         "on_back": _handle_back_button,
         "on_new_chat": _handle_new_chat,
         "on_replay": _handle_replay,
+        "on_search": _search_sessions,
         "get_export_data": _get_export_data
     }
     
@@ -53,8 +54,13 @@ def _display_history_interface(callbacks):
     # 로딩 상태 표시
     chat_history.show_loading_state("Loading sessions...")
     
-    # 세션 데이터 로드
-    sessions_result = history_manager.load_sessions(limit=20)
+    # 세션 데이터 로드 (선택된 필터/정렬/페이지)
+    list_options = chat_history.get_list_options()
+    sessions_result = history_manager.load_sessions(**list_options)
+    if sessions_result["success"] and not sessions_result["sessions"] and list_options["offset"]:
+        # 세션이 삭제되어 현재 페이지가 범위를 벗어나면 첫 페이지로
+        st.session_state.history_page = 0
+        sessions_result = history_manager.load_sessions(**{**list_options, "offset": 0})
     
     if not sessions_result["success"]:
         # 에러 상태 처리
@@ -66,7 +72,7 @@ def _display_history_interface(callbacks):
     sessions = sessions_result["sessions"]
     
     # 완전한 히스토리 페이지 렌더링
-    chat_history.render_complete_history_page(sessions, callbacks)
+    chat_history.render_complete_history_page(sessions, callbacks, sessions_result.get("total_count"))
 
 
 def _handle_back_button():
@@ -105,14 +111,29 @@ def _handle_replay(session_id: str):
         st.error(f"Failed to start replay: {replay_result['error']}")
 
 
-def _get_export_data(session_id: str) -> str:
+def _search_sessions(query: str):
+    """세션 로그 전문 검색
+    
+    Args:
+        query: 검색어
+        
+    Returns:
+        List: 관련도 순 세션 목록
+    """
+    search_result = history_manager.search_sessions(query)
+    if not search_result["success"]:
+        st.error(f"Search failed: {search_result['error']}")
+    return search_result["sessions"]
+
+
+def _get_export_data(session_id: str):
     """익스포트 데이터 가져오기
     
     Args:
         session_id: 세션 ID
         
     Returns:
-        str: JSON 형태의 익스포트 데이터
+        JSON 익스포트 데이터를 담은 파일 객체 (download_button에 그대로 전달)
     """
     try:
         export_data = history_manager.prepare_export_data(session_id)
@@ -10,9 +10,21 @@ from typing import Dict, Any, List, Optional, Callable
 from frontend.web.utils.constants import ICON, ICON_TEXT, COMPANY_LINK
 import time
 
+DATE_FILTERS = ["All", "Today", "Last 7 days", "Last 30 days"]
+SORT_OPTIONS = ["Newest First", "Oldest First", "Most Events"]
+
+
+def _reset_history_page():
+    """필터/정렬이 바뀌면 첫 페이지로"""
+    st.session_state.history_page = 0
+
+
 class ChatHistoryComponent:
     """채팅 히스토리 UI 컴포넌트"""
     
+    # 한 페이지에 표시할 세션 수
+    PAGE_SIZE = 20
+    
     def __init__(self):
         """컴포넌트 초기화"""
         pass
@@ -58,6 +70,28 @@ class ChatHistoryComponent:
                 return True
         return False
     
+    def render_search_box(self) -> str:
+        """세션 로그 전문 검색 입력창 렌더링
+        
+        Returns:
+            str: 검색어 (없으면 빈 문자열)
+        """
+        return st.text_input(
+            "🔎 Search sessions",
+            key="history_search_query",
+            placeholder="Host, service, agent or tool name (e.g. 10.0.0.5 ssh)"
+        ).strip()
+    
+    def render_search_results_header(self, query: str, result_count: int):
+        """검색 결과 헤더 렌더링
+        
+        Args:
+            query: 검색어
+            result_count: 결과 세션 수
+        """
+        st.subheader(f"🔎 Results for \"{query}\"")
+        st.caption(f"{result_count} matching sessions, most relevant first")
+    
     def render_sessions_header(self, session_count: int, total_count: int = None):
         """세션 목록 헤더 렌더링
         
@@ -67,12 +101,27 @@ class ChatHistoryComponent:
         """
         st.subheader("📋 Recent Sessions")
         if total_count and total_count > session_count:
-            st.caption(f"Showing {session_count} of {total_count} sessions")
+            start = st.session_state.get("history_page", 0) * self.PAGE_SIZE
+            st.caption(f"Showing {start + 1}-{start + session_count} of {total_count} sessions")
         else:
             st.caption(f"Showing {session_count} recent sessions")
     
+    def get_list_options(self) -> Dict[str, Any]:
+        """현재 필터/정렬/페이지 - 위젯 값은 session_state에 남아 있으므로 세션 목록을 로드하기 전에 읽음
+        
+        Returns:
+            Dict: date_filter, sort_option, limit, offset (load_sessions 인자)
+        """
+        page = st.session_state.get("history_page", 0)
+        return {
+            "date_filter": st.session_state.get("history_date_filter", DATE_FILTERS[0]),
+            "sort_option": st.session_state.get("history_sort_option", SORT_OPTIONS[0]),
+            "limit": self.PAGE_SIZE,
+            "offset": page * self.PAGE_SIZE
+        }
+    
     def render_filter_options(self) -> Dict[str, str]:
-        """필터 옵션 렌더링
+        """필터 옵션 렌더링 (바꾸면 첫 페이지부터 다시 로드)
         
         Returns:
             Dict: 선택된 필터 옵션들
@@ -83,15 +132,17 @@ class ChatHistoryComponent:
             with col1:
                 date_filter = st.selectbox(
                     "Filter by Date",
-                    options=["All", "Today", "Last 7 days", "Last 30 days"],
-                    index=0
+                    options=DATE_FILTERS,
+                    key="history_date_filter",
+                    on_change=_reset_history_page
                 )
             
             with col2:
                 sort_option = st.selectbox(
                     "Sort by",
-                    options=["Newest First", "Oldest First", "Most Events"],
-                    index=0
+                    options=SORT_OPTIONS,
+                    key="history_sort_option",
+                    on_change=_reset_history_page
                 )
         
         return {
@@ -99,6 +150,30 @@ class ChatHistoryComponent:
             "sort_option": sort_option
         }
     
+    def render_pagination(self, total_count: int):
+        """페이지 이동 버튼 렌더링
+        
+        Args:
+            total_count: 필터에 맞는 전체 세션 수
+        """
+        page_count = max((total_count + self.PAGE_SIZE - 1) // self.PAGE_SIZE, 1)
+        page = min(st.session_state.get("history_page", 0), page_count - 1)
+        if page_count <= 1:
+            return
+        
+        def go_to(target: int):
+            st.session_state.history_page = target
+        
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            st.button("◀ Previous", key="history_prev_page", disabled=page == 0,
+                      on_click=go_to, args=(page - 1,), use_container_width=True)
+        with col2:
+            st.caption(f"Page {page + 1} of {page_count}")
+        with col3:
+            st.button("Next ▶", key="history_next_page", disabled=page >= page_count - 1,
+                      on_click=go_to, args=(page + 1,), use_container_width=True)
+    
     def format_session_time(self, session_time: str) -> str:
         """세션 시간 포맷팅
         
@@ -145,11 +220,14 @@ class ChatHistoryComponent:
                 st.markdown(f"**🕒 {time_str}**")
                 st.caption(f"Session: {session_id[:16]}...")
                 
-                # 내용 미리보기
-                preview_text = session.get('preview', "No user input found")
-                if len(preview_text) > 100:
-                    preview_text = preview_text[:100] + "..."
-                st.caption(f"💬 {preview_text}")
+                # 내용 미리보기 (검색 결과면 일치 부분)
+                if session.get('snippet'):
+                    st.caption(f"🔎 {session['snippet']} ({session.get('hit_count', 1)} hits)")
+                else:
+                    preview_text = session.get('preview', "No user input found")
+                    if len(preview_text) > 100:
+                        preview_text = preview_text[:100] + "..."
+                    st.caption(f"💬 {preview_text}")
                 
                 # 모델 정보 표시
                 model_info = session.get('model')
@@ -176,7 +254,13 @@ class ChatHistoryComponent:
             with col4:
                 export_filename = f"session_{session_id[:8]}_{datetime.now().strftime('%Y%m%d')}.json"
                 
-                if "get_export_data" in callbacks:
+                # 익스포트는 버튼을 누른 세션만 준비 (목록을 그릴 때마다 모든 세션을 읽지 않도록)
+                export_key = f"export_requested_{session_id}"
+                if "get_export_data" in callbacks and not st.session_state.get(export_key):
+                    if st.button("💾 Export", key=f"export_prepare_{index}", use_container_width=True):
+                        st.session_state[export_key] = True
+                        st.rerun()
+                elif "get_export_data" in callbacks:
                     export_data = callbacks["get_export_data"](session_id)
                     if export_data:
                         st.download_button(
@@ -231,16 +315,10 @@ class ChatHistoryComponent:
             sessions: 세션 목록
             callbacks: 콜백 함수들
         """
-        # 필터 옵션
-        filter_options = self.render_filter_options()
-        
-        # 실제 필터링은 비즈니스 로직에서 처리하고, 여기서는 UI만 표시
-        filtered_sessions = sessions  # 필터링된 세션들
-        
         st.divider()
         
-        # 세션 카드들
-        for i, session in enumerate(filtered_sessions):
+        # 세션 카드들 (필터/정렬/페이지는 load_sessions에서 이미 적용됨)
+        for i, session in enumerate(sessions):
             action = self.render_session_card(session, i, callbacks)
             
             # 세션 상세 정보 표시
@@ -250,13 +328,15 @@ class ChatHistoryComponent:
     def render_complete_history_page(
         self,
         sessions: List[Dict[str, Any]] = None,
-        callbacks: Optional[Dict[str, Callable]] = None
+        callbacks: Optional[Dict[str, Callable]] = None,
+        total_count: Optional[int] = None
     ):
         """완전한 히스토리 페이지 렌더링
         
         Args:
-            sessions: 세션 목록
+            sessions: 세션 목록 (get_list_options()의 필터/정렬/페이지로 로드한 한 페이지)
             callbacks: 콜백 함수들
+            total_count: 필터에 맞는 전체 세션 수 (페이지 이동에 사용)
         """
         # 사이드바 숨김
         self.hide_sidebar()
@@ -269,17 +349,39 @@ class ChatHistoryComponent:
             if callbacks and "on_back" in callbacks:
                 callbacks["on_back"]()
         
+        # 전문 검색 - 검색어가 있으면 목록 대신 검색 결과 표시
+        query = self.render_search_box() if callbacks and "on_search" in callbacks else ""
+        if query:
+            results = callbacks["on_search"](query)
+            self.render_search_results_header(query, len(results))
+            if results:
+                self.render_sessions_list(results, callbacks)
+            else:
+                st.info("No sessions match this search")
+            return
+        
         # 세션 목록 처리
-        if not sessions:
-            if self.render_empty_state():
+        if not sessions and not total_count:
+            options = self.get_list_options()
+            if options["date_filter"] != DATE_FILTERS[0]:
+                # 필터 때문에 비어 있으면 필터를 바꿀 수 있도록 옵션은 그대로 표시
+                self.render_filter_options()
+                st.info("No sessions match this filter")
+            elif self.render_empty_state():
                 if callbacks and "on_new_chat" in callbacks:
                     callbacks["on_new_chat"]()
         else:
             # 세션 목록 헤더
-            self.render_sessions_header(len(sessions))
+            self.render_sessions_header(len(sessions or []), total_count)
+            
+            # 필터 옵션
+            self.render_filter_options()
             
             # 세션 목록 표시
-            self.render_sessions_list(sessions, callbacks)
+            self.render_sessions_list(sessions or [], callbacks)
+            
+            # 페이지 이동
+            self.render_pagination(total_count or len(sessions or []))
     
     def hide_sidebar(self):
         """사이드바 숨기기"""
@@ -197,6 +197,12 @@ class AppStateManager:
                 user_id=st.session_state.user_id,
                 conversation_id=new_conversation_id
             )
+            # 에이전트 메모리는 thread_id별 namespace이므로 함께 갱신
+            st.session_state.memory_namespace = create_memory_namespace(
+                user_id=st.session_state.user_id,
+                namespace_type="memories",
+                conversation_id=new_conversation_id
+            )
         except BaseException as e:
             if StopException is None or not isinstance(e, StopException):
                 raise
@@ -256,6 +262,7 @@ class AppStateManager:
             debug_info["logging"] = {
                 "session_id": current_session.session_id,
                 "events_count": len(current_session.events),
+                "event_bus": st.session_state.logger.bus.get_stats(),
             }
         
         return debug_info
@@ -6,8 +6,9 @@
 import streamlit as st
 import asyncio
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional
 
+from src.utils.events import Event, EventType, WorkflowEvent
 from src.utils.logging.replay import get_replay_system
 from frontend.web.core.message_processor import MessageProcessor
 
@@ -56,7 +57,7 @@ class ReplayManager:
         """단순화된 재현 실행 - 세션 상태에서 데이터 가져오기"""
         # 세션 데이터는 ReplaySystem.start_replay()에서 이미 세션 상태에 저장됨
         session = st.session_state.get("replay_session")
-        if not session or not session.events:
+        if not session or not session.event_count:
             st.error("재현할 세션 데이터가 없습니다.")
             return
         
@@ -67,11 +68,14 @@ class ReplayManager:
             terminal_messages = []
             event_history = []
             agent_activity = {}
+            # 중복 검사용 (MessageProcessor.is_duplicate_message와 같은 기준, 메시지마다 전체 목록을 훑지 않도록)
+            seen_ids = set()
+            seen_contents = set()
             
-            status.update(label=f"Processing {len(session.events)} events...", state="running")
+            status.update(label=f"Processing {session.event_count} events...", state="running")
             
-            # 이벤트 처리
-            for i, event in enumerate(session.events):
+            # 이벤트 처리 - 파일에서 하나씩 읽으며 변환
+            for i, event in enumerate(session.iter_events()):
                 try:
                     # 이벤트를 Executor 스타일 이벤트로 변환
                     executor_event = self._convert_to_executor_event(event)
@@ -81,9 +85,16 @@ class ReplayManager:
                         frontend_message = self.message_processor.process_cli_event(executor_event)
                         
                         # 중복 확인
-                        if not self.message_processor.is_duplicate_message(
-                            frontend_message, replay_messages
-                        ):
+                        message_id = frontend_message.get("id")
+                        content_key = (
+                            frontend_message.get("agent_id"),
+                            frontend_message.get("type"),
+                            frontend_message.get("content", "")
+                        )
+                        if not message_id or (message_id not in seen_ids and content_key not in seen_contents):
+                            if message_id:
+                                seen_ids.add(message_id)
+                            seen_contents.add(content_key)
                             replay_messages.append(frontend_message)
                             
                             # tool 메시지인 경우 터미널 메시지에도 추가
@@ -100,7 +111,7 @@ class ReplayManager:
                     
                     # 진행 상황 업데이트
                     if (i + 1) % 10 == 0:
-                        status.update(label=f"Processed {i + 1}/{len(session.events)} events...", state="running")
+                        status.update(label=f"Processed {i + 1}/{session.event_count} events...", state="running")
                         
                 except Exception as e:
                     print(f"Error processing event {i}: {e}")
@@ -175,52 +186,50 @@ class ReplayManager:
                 state="complete"
             )
     
-    def _convert_to_executor_event(self, event) -> Optional[Dict[str, Any]]:
+    def _convert_to_executor_event(self, event: Event) -> Optional[WorkflowEvent]:
         """이벤트를 Executor 스타일 이벤트로 변환"""
         timestamp = datetime.now().isoformat()
         
-        if event.event_type.value == "user_input":
-            return {
-                "type": "message",
-                "message_type": "user",
-                "agent_name": "User",
-                "content": event.content,
-                "timestamp": timestamp
-            }
+        if event.event_type is EventType.USER_INPUT:
+            return WorkflowEvent(
+                type="message",
+                message_type="user",
+                agent_name="User",
+                content=event.content,
+                timestamp=timestamp
+            )
         
-        elif event.event_type.value == "agent_response":
-            executor_event = {
-                "type": "message",
-                "message_type": "ai",
-                "agent_name": event.agent_name or "Agent",
-                "content": event.content,
-                "timestamp": timestamp
-            }
-            
+        elif event.event_type is EventType.AGENT_RESPONSE:
             # Tool calls 정보 복원
-            if hasattr(event, 'tool_calls') and event.tool_calls:
+            executor_event = WorkflowEvent(
+                type="message",
+                message_type="ai",
+                agent_name=event.agent_name or "Agent",
+                content=event.content,
+                timestamp=timestamp
+            )
+            if event.tool_calls:
                 executor_event["tool_calls"] = event.tool_calls
-            
             return executor_event
         
-        elif event.event_type.value == "tool_command":
-            return {
-                "type": "message",
-                "message_type": "tool",
-                "agent_name": "Tool",
-                "tool_name": event.tool_name or "Unknown Tool",
-                "content": f"Command: {event.content}",
-                "timestamp": timestamp
-            }
+        elif event.event_type is EventType.TOOL_COMMAND:
+            return WorkflowEvent(
+                type="message",
+                message_type="tool",
+                agent_name="Tool",
+                tool_name=event.tool_name or "Unknown Tool",
+                content=f"Command: {event.content}",
+                timestamp=timestamp
+            )
         
-        elif event.event_type.value == "tool_output":
-            return {
-                "type": "message",
-                "message_type": "tool",
-                "agent_name": "Tool",
-                "tool_name": event.tool_name or "Tool Output",
-                "content": event.content,
-                "timestamp": timestamp
-            }
+        elif event.event_type is EventType.TOOL_OUTPUT:
+            return WorkflowEvent(
+                type="message",
+                message_type="tool",
+                agent_name="Tool",
+                tool_name=event.tool_name or "Tool Output",
+                content=event.content,
+                timestamp=timestamp
+            )
         
         return None
@@ -4,10 +4,20 @@ Chat History Business Logic (리팩토링됨)
 """
 
 import json
-from datetime import datetime
+import tempfile
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import IO, Dict, Any, Iterator, List, Optional, Tuple
 from frontend.web.utils.validation import validate_file_path
+from src.utils.logging.session_log import SessionReader, read_session_file, session_id_from_path
+
+# 익스포트 데이터가 이 크기를 넘으면 메모리 대신 임시 파일에 기록
+EXPORT_SPOOL_BYTES = 8 * 1024 * 1024
+
+
+def _indent_json(value: Any, level: int = 1) -> str:
+    """json.dumps(indent=2) 결과를 level 단계 들여쓴 위치에 끼워 넣을 수 있도록 변환"""
+    return json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n" + "  " * level)
 
 
 class ChatHistoryManager:
@@ -26,11 +36,20 @@ class ChatHistoryManager:
         except ImportError:
             self.logger = None
     
-    def load_sessions(self, limit: int = 20) -> Dict[str, Any]:
-        """세션 목록 로드
+    def load_sessions(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        date_filter: str = "All",
+        sort_option: str = "Newest First"
+    ) -> Dict[str, Any]:
+        """세션 목록 로드 (필터/정렬/페이지는 세션 인덱스에서 처리)
         
         Args:
             limit: 로드할 세션 수 제한
+            offset: 건너뛸 세션 수 (페이지)
+            date_filter: 날짜 필터 ("All", "Today", "Last 7 days", "Last 30 days")
+            sort_option: 정렬 옵션 ("Newest First", "Oldest First", "Most Events")
             
         Returns:
             Dict: 로드 결과
@@ -43,7 +62,11 @@ class ChatHistoryManager:
             }
         
         try:
-            sessions = self.logger.list_sessions(limit=limit)
+            filters = self._index_filters(date_filter)
+            sort_by, descending = self._index_sorting(sort_option)
+            sessions = self.logger.list_sessions(
+                limit=limit, offset=offset, sort_by=sort_by, descending=descending, **filters
+            )
             
             # 세션 데이터 처리
             processed_sessions = []
@@ -54,7 +77,7 @@ class ChatHistoryManager:
             return {
                 "success": True,
                 "sessions": processed_sessions,
-                "total_count": len(sessions)
+                "total_count": self.logger.count_sessions(**filters)
             }
             
         except Exception as e:
@@ -64,6 +87,40 @@ class ChatHistoryManager:
                 "sessions": []
             }
     
+    def search_sessions(self, query: str, limit: int = 20) -> Dict[str, Any]:
+        """세션 로그 전문 검색 (관련도 순)
+        
+        Args:
+            query: 검색어 (공백으로 구분된 단어는 모두 포함, 끝에 *를 붙이면 접두어 검색)
+            limit: 최대 결과 세션 수
+            
+        Returns:
+            Dict: 검색 결과 (load_sessions와 같은 형식, 세션마다 snippet/hit_count 포함)
+        """
+        if not self.logger:
+            return {"success": False, "error": "Logger not available", "sessions": []}
+        
+        sessions = [self._process_session_data(session) for session in self.logger.search_sessions(query, limit=limit)]
+        return {"success": True, "sessions": sessions, "total_count": len(sessions)}
+    
+    def _index_filters(self, date_filter: str) -> Dict[str, Any]:
+        """날짜 필터 → 세션 인덱스 조건"""
+        now = datetime.now()
+        if date_filter == "Today":
+            return {"date_from": now.replace(hour=0, minute=0, second=0, microsecond=0).isoformat()}
+        days = {"Last 7 days": 7, "Last 30 days": 30}.get(date_filter)
+        if days:
+            return {"date_from": (now - timedelta(days=days)).isoformat()}
+        return {}
+    
+    def _index_sorting(self, sort_option: str) -> Tuple[str, bool]:
+        """정렬 옵션 → (정렬 컬럼, 내림차순 여부)"""
+        if sort_option == "Oldest First":
+            return "start_time", False
+        if sort_option == "Most Events":
+            return "event_count", True
+        return "start_time", True
+    
     def _process_session_data(self, session: Dict[str, Any]) -> Dict[str, Any]:
         """세션 데이터 처리
         
@@ -187,71 +244,80 @@ class ChatHistoryManager:
         
         return sessions
     
-    def prepare_export_data(self, session_id: str) -> Optional[str]:
-        """세션 익스포트 데이터 준비
+    def prepare_export_data(self, session_id: str) -> Optional[IO[bytes]]:
+        """세션 익스포트 데이터 준비 - 이벤트를 하나씩 임시 파일에 스트리밍 (큰 세션은 디스크로 넘어감)
         
         Args:
             session_id: 세션 ID
             
         Returns:
-            Optional[str]: JSON 형태의 익스포트 데이터
+            Optional[IO[bytes]]: JSON 익스포트 데이터를 담은 파일 객체 (st.download_button에 그대로 전달)
         """
-        if not self.logger:
+        chunks = self.iter_export_data(session_id)
+        if chunks is None:
             return None
         
         try:
-            # 세션 데이터 로드
-            session = self.logger.load_session(session_id)
-            if not session:
-                # 직접 파일 검색 시도
-                session = self._load_session_from_file(session_id)
-                
-                if not session:
-                    return None
-            
-            # session이 MinimalSession 객체인 경우와 dict인 경우 모두 처리
-            if hasattr(session, 'events'):  # MinimalSession 객체
-                events_data = [
-                    event.to_dict() if hasattr(event, 'to_dict') else event 
-                    for event in session.events
-                ]
-                session_info = {
-                    "session_id": session.session_id,
-                    "start_time": session.start_time,
-                    "total_events": len(session.events)
-                }
-                # 모델 정보 추가
-                if hasattr(session, 'model') and session.model:
-                    session_info["model"] = session.model
-            else:  # dict 데이터
-                events_data = session.get('events', [])
-                session_info = {
-                    "session_id": session.get('session_id', session_id),
-                    "start_time": session.get('start_time', 'Unknown'),
-                    "total_events": len(events_data)
-                }
-                # 모델 정보 추가
-                if session.get('model'):
-                    session_info["model"] = session.get('model')
-            
-            # 익스포트용 데이터 구조 생성
-            export_data = {
-                "session_info": session_info,
-                "events": events_data,
-                "export_metadata": {
-                    "exported_at": datetime.now().isoformat(),
-                    "exported_by": "Decepticon Log Manager",
-                    "version": "1.0"
-                }
-            }
-            
-            # JSON 문자열로 변환
-            return json.dumps(export_data, indent=2, ensure_ascii=False)
-            
+            export_file = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_BYTES)
+            self.write_export(chunks, export_file)
+            export_file.seek(0)
+            return export_file
         except Exception as e:
             print(f"Export error: {e}")
             return None
     
+    def write_export(self, chunks: Iterator[str], file_obj: IO[bytes]):
+        """익스포트 JSON 조각을 파일(바이너리)에 기록"""
+        for chunk in chunks:
+            file_obj.write(chunk.encode("utf-8"))
+    
+    def iter_export_data(self, session_id: str) -> Optional[Iterator[str]]:
+        """세션 익스포트 JSON을 조각(str) 단위로 생성하는 제너레이터
+        세션 전체나 전체 JSON 문자열을 메모리에 만들지 않음
+        
+        Args:
+            session_id: 세션 ID
+            
+        Returns:
+            Optional[Iterator[str]]: JSON 조각 - 이어 붙이면 하나의 JSON 문서
+        """
+        if not self.logger:
+            return None
+        
+        reader = self.logger.open_session(session_id)
+        if reader is None:
+            session_file = self._find_session_file(session_id)
+            if session_file is None:
+                return None
+            reader = SessionReader(session_file)
+        
+        return self._export_chunks(session_id, reader)
+    
+    def _export_chunks(self, session_id: str, reader: SessionReader) -> Iterator[str]:
+        header = reader.header
+        info = self.logger.index.get(session_id)
+        session_info = {
+            "session_id": header.get('session_id', session_id),
+            "start_time": header.get('start_time', 'Unknown'),
+            "total_events": info["event_count"] if info else reader.count()
+        }
+        # 모델 정보 추가
+        if header.get('model'):
+            session_info["model"] = header.get('model')
+        
+        yield '{\n  "session_info": ' + _indent_json(session_info) + ',\n  "events": ['
+        separator = "\n    "
+        for event in reader.events():
+            yield separator + _indent_json(event, level=2)
+            separator = ",\n    "
+        
+        export_metadata = {
+            "exported_at": datetime.now().isoformat(),
+            "exported_by": "Decepticon Log Manager",
+            "version": "1.0"
+        }
+        yield '\n  ],\n  "export_metadata": ' + _indent_json(export_metadata) + '\n}'
+    
     def _load_session_from_file(self, session_id: str) -> Optional[Dict[str, Any]]:
         """파일에서 세션 데이터 직접 로드
         
@@ -262,16 +328,23 @@ class ChatHistoryManager:
             Optional[Dict]: 세션 데이터
         """
         try:
-            # logs 폴더에서 세션 파일 검색
-            logs_path = Path("logs")
-            for session_file in logs_path.rglob(f"session_{session_id}.json"):
-                with open(session_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            session_file = self._find_session_file(session_id)
+            if session_file is not None:
+                return read_session_file(session_file)
         except Exception as e:
             print(f"Error loading session file: {e}")
         
         return None
     
+    def _find_session_file(self, session_id: str) -> Optional[Path]:
+        """세션 인덱스로 경로 조회, 없으면 logs 폴더에서 세션 파일 검색"""
+        if self.logger:
+            return self.logger.index.find_path(session_id)
+        for session_file in Path("logs").rglob(f"session_{session_id}.json*"):
+            if session_id_from_path(session_file) == session_id:
+                return session_file
+        return None
+    
     def start_replay(self, session_id: str) -> Dict[str, Any]:
         """세션 재현 시작
         
@@ -4,7 +4,7 @@ CLI 메시지를 프론트엔드 메시지로 변환하는 핵심 로직
 """
 
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
 import os
 import sys
 
@@ -13,6 +13,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
 
 # CLI 메시지 유틸리티 직접 import
 from src.utils.message import parse_tool_name, extract_tool_calls
+from src.utils.events import ChatMessage, WorkflowEvent
 # 리팩토링된 에이전트 관리자
 from src.utils.agents import AgentManager
 
@@ -24,14 +25,14 @@ class MessageProcessor:
         """메시지 프로세서 초기화"""
         self.default_avatar = "🤖"
     
-    def process_cli_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+    def process_cli_event(self, event_data: Union[WorkflowEvent, Dict[str, Any]]) -> ChatMessage:
         """CLI 이벤트를 프론트엔드 메시지로 변환
         
         Args:
             event_data: CLI에서 온 이벤트 데이터
             
         Returns:
-            Dict: 변환된 프론트엔드 메시지
+            ChatMessage: 변환된 프론트엔드 메시지
         """
         message_type = event_data.get("message_type", "")
         agent_name = event_data.get("agent_name", "Unknown")
@@ -63,29 +64,25 @@ class MessageProcessor:
         avatar: str, 
         content: str, 
         raw_message: Any,
-        event_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        event_data: Union[WorkflowEvent, Dict[str, Any]]
+    ) -> ChatMessage:
         """AI 메시지 생성"""
         if self._is_initial_access_agent(agent_name):
             content = self._sanitize_initial_access_output(content)
         elif self._is_summary_agent(agent_name):
             content = self._sanitize_summary_output(content)
 
-        message = {
-            "type": "ai",
-            "agent_id": agent_name.lower(),
-            "display_name": display_name,
-            "avatar": avatar,
-            "content": content,
-            "id": f"ai_{agent_name.lower()}_{hash(content[:100])}_{datetime.now().timestamp()}"
-        }
-        
-        # Tool calls 정보 추출
-        tool_calls = extract_tool_calls(raw_message, event_data)
-        if tool_calls:
-            message["tool_calls"] = tool_calls
-        
-        return message
+        agent_id = agent_name.lower()
+        return ChatMessage(
+            type="ai",
+            agent_id=agent_id,
+            display_name=display_name,
+            avatar=avatar,
+            content=content,
+            id=f"ai_{agent_id}_{hash(content[:100])}_{datetime.now().timestamp()}",
+            # Tool calls 정보 추출
+            tool_calls=extract_tool_calls(raw_message, event_data)
+        )
 
     def _is_initial_access_agent(self, agent_name: str) -> bool:
         val = (agent_name or "").strip().lower()
@@ -205,26 +202,26 @@ class MessageProcessor:
             "Proceed with prioritized remediation validation and security control review to reduce exposure and confirm risk reduction."
         )
     
-    def _create_tool_message(self, event_data: Dict[str, Any], content: str) -> Dict[str, Any]:
+    def _create_tool_message(self, event_data: Union[WorkflowEvent, Dict[str, Any]], content: str) -> ChatMessage:
         """도구 메시지 생성"""
         tool_name = event_data.get("tool_name", "Unknown Tool")
-        tool_display_name = event_data.get("tool_display_name", parse_tool_name(tool_name))
+        tool_display_name = event_data.get("tool_display_name") or parse_tool_name(tool_name)
         
-        return {
-            "type": "tool",
-            "tool_name": tool_name,
-            "tool_display_name": tool_display_name,
-            "content": content,
-            "id": f"tool_{tool_name}_{hash(content[:100])}_{datetime.now().timestamp()}"
-        }
+        return ChatMessage(
+            type="tool",
+            tool_name=tool_name,
+            tool_display_name=tool_display_name,
+            content=content,
+            id=f"tool_{tool_name}_{hash(content[:100])}_{datetime.now().timestamp()}"
+        )
     
-    def _create_user_message(self, content: str) -> Dict[str, Any]:
+    def _create_user_message(self, content: str) -> ChatMessage:
         """사용자 메시지 생성"""
-        return {
-            "type": "user",
-            "content": content,
-            "id": f"user_{hash(content)}_{datetime.now().timestamp()}"
-        }
+        return ChatMessage(
+            type="user",
+            content=content,
+            id=f"user_{hash(content)}_{datetime.now().timestamp()}"
+        )
     
     def extract_agent_status(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
         """이벤트들에서 에이전트 상태 정보 추출"""
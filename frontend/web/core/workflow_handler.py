@@ -20,6 +20,8 @@ except Exception:
 # 프로젝트 루트 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 
+from src.utils.events import ChatMessage, WorkflowEvent
+from src.utils.message import extract_token_usage
 from frontend.web.core.message_processor import MessageProcessor
 from frontend.web.core.executor_manager import get_executor_manager
 
@@ -52,14 +54,14 @@ class WorkflowHandler:
         
         return {"can_execute": True, "error_message": ""}
     
-    def prepare_user_input(self, user_input: str) -> Dict[str, Any]:
+    def prepare_user_input(self, user_input: str) -> ChatMessage:
         """사용자 입력을 워크플로우용으로 준비
         
         Args:
             user_input: 사용자 입력 텍스트
             
         Returns:
-            Dict: 처리된 사용자 메시지
+            ChatMessage: 처리된 사용자 메시지
         """
         user_message = self.message_processor._create_user_message(user_input)
         st.session_state.structured_messages.append(user_message)
@@ -134,6 +136,8 @@ class WorkflowHandler:
                         ui_callbacks,
                         terminal_ui
                     )
+                    # 변환이 끝난 원본 메시지는 event_history에 남기지 않음
+                    event.release()
                     
                     if not success:
                         break
@@ -176,7 +180,7 @@ class WorkflowHandler:
     
     async def _process_event_logic(
         self,
-        event: Dict[str, Any],
+        event: WorkflowEvent,
         agent_activity: Dict[str, int],
         ui_callbacks: Dict[str, Callable],
         terminal_ui = None
@@ -211,7 +215,7 @@ class WorkflowHandler:
     
     async def _process_message_event_logic(
         self,
-        event: Dict[str, Any],
+        event: WorkflowEvent,
         agent_activity: Dict[str, int],
         ui_callbacks: Dict[str, Callable],
         terminal_ui = None
@@ -273,7 +277,7 @@ class WorkflowHandler:
     
     def _process_terminal_message_logic(
         self, 
-        frontend_message: Dict[str, Any], 
+        frontend_message: ChatMessage, 
         ui_callbacks: Dict[str, Callable]
     ):
         """터미널 메시지 처리 순수 로직 (간소화된 버전)"""
@@ -292,7 +296,7 @@ class WorkflowHandler:
             if tool_name and content:
                 ui_callbacks["on_terminal_message"](tool_name, content)
     
-    def _log_message_event(self, event: Dict[str, Any], frontend_message: Dict[str, Any]):
+    def _log_message_event(self, event: WorkflowEvent, frontend_message: ChatMessage):
         """메시지 이벤트 로깅 로직"""
         if "logger" not in st.session_state or not st.session_state.logger:
             return
@@ -306,7 +310,8 @@ class WorkflowHandler:
             logger.log_agent_response(
                 agent_name=agent_name,
                 content=content,
-                tool_calls=frontend_message.get("tool_calls")
+                tool_calls=frontend_message.get("tool_calls"),
+                usage=extract_token_usage(event.get("raw_message"))
             )
         elif message_type == "tool":
             tool_name = event.get("tool_name", "Unknown Tool")
@@ -75,7 +75,8 @@ PROVIDERS = [
     "Gemini",
     "Groq",
     "Ollama",
-    "OpenRouter"
+    "OpenRouter",
+    "Fake"
 ]
 
 # 터미널 명령어 정리 프리픽스
@@ -2,7 +2,7 @@ from src.agents.swarm.Recon import make_recon_agent
 from src.agents.swarm.InitAccess import make_initaccess_agent
 from src.agents.swarm.Planner import make_planner_agent
 from src.agents.swarm.Summary import make_summary_agent
-from src.utils.swarm.swarm import create_swarm
+from src.utils.swarm.swarm import create_swarm, get_max_parallel_branches
 from src.utils.memory import get_checkpointer, get_store
 import asyncio
 import logging
@@ -48,6 +48,7 @@ async def create_dynamic_swarm():
     workflow = create_swarm(
         agents=agents,
         default_active_agent="Planner",
+        max_parallel_branches=get_max_parallel_branches(),
     )
     
     compiled_workflow = workflow.compile(
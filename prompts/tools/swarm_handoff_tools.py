@@ -43,3 +43,21 @@ SWARM_HANDOFF_TOOLS_PROMPT = """
 Use handoffs to leverage specialized expertise while maintaining operational flow.
 </swarm_handoff_tools>
 """
+
+PARALLEL_DISPATCH_TOOL_PROMPT = """
+<parallel_dispatch_tool>
+## Parallel Dispatch Tool:
+
+### dispatch_parallel_tasks(tasks)
+**When to use**: Several work items are independent of each other and can run at the same time
+**Examples**:
+- Reconnaissance of several lab hosts
+- Enumeration of unrelated services on different targets
+
+**Rules**:
+- Each task is `{"agent": "<Reconnaissance|Initial_Access>", "task": "<self-contained task description>"}`
+- Each branch only sees its own task description, so include the target and all context it needs
+- Branches cannot hand off; results of every branch are returned to you together
+- Use regular handoffs for work that depends on previous results
+</parallel_dispatch_tool>
+"""
@@ -0,0 +1,109 @@
+"""
+오프라인 swarm 벤치마크 - 스크립트 모델(provider "fake")과 stand-in 도구로
+create_dynamic_swarm + Executor.execute_workflow를 네트워크 없이 끝까지 실행하여
+그래프 오버헤드, 체크포인트 수, UI 메시지 변환 처리량을 측정
+
+사용법:
+    python -m src.utils.benchmark --runs 5 --steps 200 --latency 0
+"""
+
+import os
+import json
+import time
+import asyncio
+import argparse
+import statistics
+from typing import Dict, Any, List
+
+
+def _configure_environment(args: argparse.Namespace):
+    """벤치마크용 환경변수 설정 (Executor/에이전트 import 전에 호출)"""
+    os.environ["FAKE_LLM"] = "true"
+    os.environ["MCP_STANDIN"] = "true"
+    os.environ["FAKE_LLM_STEPS"] = str(args.steps)
+    os.environ["FAKE_LLM_HANDOFF_EVERY"] = str(args.handoff_every)
+    os.environ["FAKE_LLM_LATENCY"] = str(args.latency)
+    os.environ["FAKE_LLM_OUTPUT_TOKENS"] = str(args.output_tokens)
+    os.environ["STANDIN_TOOL_LATENCY"] = str(args.tool_latency)
+    # 수천 스텝 실행을 위해 전역 한도와 감독 예산을 스텝 수에 맞춤
+    os.environ.setdefault("RECURSION_LIMIT", str(args.steps * 4 + 50))
+    os.environ.setdefault("SUPERVISOR_MAX_STEPS", str(args.steps + 10))
+    os.environ.setdefault("RUN_SUPERVISOR", "false")
+    # 스크립트 모델은 입력 메시지로 진행 단계를 계산하므로 요약으로 접지 않음
+    os.environ.setdefault("CONTEXT_MANAGEMENT", "false")
+
+
+async def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    from src.utils.executor import Executor
+    from src.utils.memory import create_thread_config, get_checkpointer
+    from frontend.web.core.message_processor import MessageProcessor
+
+    executor = Executor()
+    init_started = time.perf_counter()
+    await executor.initialize_swarm(
+        model_info={
+            "model_name": "scripted-engagement",
+            "provider": "fake",
+            "display_name": "Scripted Engagement (Offline)",
+        },
+        thread_config=create_thread_config("benchmark", "init"),
+    )
+    init_seconds = time.perf_counter() - init_started
+
+    processor = MessageProcessor()
+    runs: List[Dict[str, Any]] = []
+    for run_index in range(args.runs):
+        config = create_thread_config("benchmark", f"run_{run_index}")
+        events = 0
+        ui_seconds = 0.0
+        started = time.perf_counter()
+        async for event in executor.execute_workflow(args.prompt, config=config):
+            if event.get("type") == "error":
+                raise RuntimeError(event.get("error"))
+            if event.get("type") == "message":
+                events += 1
+                ui_started = time.perf_counter()
+                processor.process_cli_event(event)
+                ui_seconds += time.perf_counter() - ui_started
+        elapsed = time.perf_counter() - started
+
+        thread_config = {"configurable": {"thread_id": config["configurable"]["thread_id"]}}
+        checkpoints = sum(1 for _ in get_checkpointer().list(thread_config))
+        simulated = args.steps * (args.latency + args.tool_latency)
+        runs.append({
+            "run": run_index,
+            "seconds": elapsed,
+            "events": events,
+            "events_per_second": events / elapsed if elapsed else 0.0,
+            "checkpoints": checkpoints,
+            "ui_seconds": ui_seconds,
+            # 설정된 모델/도구 지연을 뺀 프레임워크 자체 시간 (스텝당)
+            "overhead_per_step_ms": max(elapsed - simulated, 0.0) / max(args.steps, 1) * 1000,
+        })
+
+    return {
+        "init_seconds": init_seconds,
+        "runs": runs,
+        "mean_seconds": statistics.mean(run["seconds"] for run in runs),
+        "mean_overhead_per_step_ms": statistics.mean(run["overhead_per_step_ms"] for run in runs),
+        "mean_events_per_second": statistics.mean(run["events_per_second"] for run in runs),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline swarm benchmark with the scripted fake model")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--steps", type=int, default=50, help="LLM steps per run")
+    parser.add_argument("--handoff-every", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.0, help="fake LLM latency per call (seconds)")
+    parser.add_argument("--tool-latency", type=float, default=0.0, help="stand-in tool latency (seconds)")
+    parser.add_argument("--output-tokens", type=int, default=32)
+    parser.add_argument("--prompt", default="Run a full engagement against 127.0.0.1")
+    args = parser.parse_args()
+
+    _configure_environment(args)
+    print(json.dumps(asyncio.run(run_benchmark(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
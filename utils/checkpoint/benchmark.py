@@ -0,0 +1,114 @@
+"""
+체크포인트 직렬화 벤치마크 - 전체 직렬화(SqliteCheckpointSaver)와 delta 인코딩(DeltaCheckpointSaver) 비교
+스텝마다 메시지가 추가되는 대화를 합성해 put 시간, 저장 용량, 최신 체크포인트 조회 시간을 측정
+
+사용법:
+    python -m src.utils.checkpoint.benchmark --steps 1000 --message-chars 600
+"""
+
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+from typing import Any, Dict, List
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from langgraph.checkpoint.base import empty_checkpoint
+
+from src.utils.checkpoint.delta import DeltaCheckpointSaver
+from src.utils.checkpoint.sqlite import SqliteCheckpointSaver
+
+
+def _step_messages(step: int, chars: int) -> List[BaseMessage]:
+    """스텝당 추가되는 도구 호출 + 결과 메시지"""
+    call_id = f"call_{step}"
+    body = (f"step {step} output " * (chars // 16 + 1))[:chars]
+    return [
+        AIMessage(content=f"Running scan {step}", id=f"ai_{step}",
+                  tool_calls=[{"name": "nmap", "args": {"target": "127.0.0.1"}, "id": call_id, "type": "tool_call"}]),
+        ToolMessage(content=body, tool_call_id=call_id, id=f"tool_{step}", name="nmap"),
+    ]
+
+
+def _run(saver: Any, steps: int, chars: int, sample_every: int) -> Dict[str, Any]:
+    thread_id = "benchmark"
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    messages: List[BaseMessage] = [HumanMessage(content="Run a full engagement against 127.0.0.1", id="human_0")]
+    version = None
+    put_times: List[float] = []
+    samples: List[Dict[str, Any]] = []
+
+    for step in range(steps):
+        messages = messages + _step_messages(step, chars)
+        version = saver.get_next_version(version, None)
+        checkpoint = empty_checkpoint()
+        checkpoint["channel_values"] = {"messages": messages, "active_agent": "Recon"}
+        checkpoint["channel_versions"] = {"messages": version, "active_agent": version}
+
+        started = time.perf_counter()
+        config = saver.put(config, checkpoint, {"source": "loop", "step": step, "writes": None}, {"messages": version})
+        put_times.append(time.perf_counter() - started)
+
+        if (step + 1) % sample_every == 0:
+            samples.append({
+                "messages": len(messages),
+                "put_ms": statistics.mean(put_times[-sample_every:]) * 1000,
+            })
+
+    saver.flush()
+    read_started = time.perf_counter()
+    latest = saver.get_tuple({"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}})
+    read_ms = (time.perf_counter() - read_started) * 1000
+    assert latest is not None and len(latest.checkpoint["channel_values"]["messages"]) == len(messages)
+
+    stored = saver.conn.execute("SELECT SUM(LENGTH(checkpoint)) FROM checkpoints").fetchone()[0] or 0
+    return {
+        "total_put_seconds": sum(put_times),
+        "mean_put_ms": statistics.mean(put_times) * 1000,
+        "last_put_ms": samples[-1]["put_ms"] if samples else 0.0,
+        "checkpoint_bytes": stored,
+        "db_bytes": Path(saver.path).stat().st_size,
+        "read_latest_ms": read_ms,
+        "samples": samples,
+    }
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    workdir = Path(tempfile.mkdtemp(prefix="checkpoint-bench-"))
+    try:
+        full = SqliteCheckpointSaver(str(workdir / "full.sqlite"), batch_size=10_000)
+        delta = DeltaCheckpointSaver(
+            str(workdir / "delta.sqlite"), batch_size=10_000,
+            snapshot_every=args.snapshot_every, compression=args.compression,
+        )
+        results = {
+            "full": _run(full, args.steps, args.message_chars, args.sample_every),
+            "delta": _run(delta, args.steps, args.message_chars, args.sample_every),
+        }
+        results["delta"]["stats"] = delta.get_stats()["delta"]
+        full.close()
+        delta.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    results["speedup_total_put"] = results["full"]["total_put_seconds"] / max(results["delta"]["total_put_seconds"], 1e-9)
+    results["storage_ratio"] = results["full"]["checkpoint_bytes"] / max(results["delta"]["checkpoint_bytes"], 1)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare full vs delta-encoded checkpoint serialization")
+    parser.add_argument("--steps", type=int, default=1000, help="checkpoints to write (2 messages per step)")
+    parser.add_argument("--message-chars", type=int, default=600)
+    parser.add_argument("--sample-every", type=int, default=100)
+    parser.add_argument("--snapshot-every", type=int, default=32)
+    parser.add_argument("--compression", default="zlib", choices=["zlib", "zstd", "none"])
+    args = parser.parse_args()
+    print(json.dumps(run_benchmark(args), indent=2))
+
+
+if __name__ == "__main__":
+    main()
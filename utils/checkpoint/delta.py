@@ -0,0 +1,262 @@
+"""
+Delta 인코딩 체크포인터
+매 스텝마다 전체 messages 리스트를 다시 직렬화하지 않도록, list 채널은 부모 체크포인트와의
+공통 prefix 길이와 새로 추가된 tail만 저장 (CHECKPOINT_SNAPSHOT_EVERY 스텝마다 전체 스냅샷)
+
+- 쓰기 시간/저장 용량이 대화 길이가 아니라 변경 크기에 비례
+- 직렬화는 기존 serde(msgpack) 그대로 사용하고 CHECKPOINT_COMPRESSION(zlib/zstd/none)으로 선택적 압축
+- type 컬럼 접두사로 형식을 구분하므로 기존 SqliteCheckpointSaver DB를 그대로 읽을 수 있음
+
+환경변수:
+- CHECKPOINT_DELTA: delta 인코딩 사용 여부 (기본 true)
+- CHECKPOINT_SNAPSHOT_EVERY: delta 체인 최대 길이 (기본 32)
+- CHECKPOINT_COMPRESSION: zlib (기본) / zstd / none
+- CHECKPOINT_COMPRESS_MIN_BYTES: 이보다 작은 값은 압축하지 않음 (기본 1024)
+- CHECKPOINT_DELTA_CACHE: 복원된 list 채널 캐시 크기 (체크포인트 수, 기본 128)
+"""
+
+import os
+import zlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from langgraph.checkpoint.base import Checkpoint
+
+from src.utils.checkpoint.sqlite import SqliteCheckpointSaver
+
+try:
+    import zstandard
+except ImportError:  # zstd는 선택 의존성
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+DELTA_PREFIX = "delta:"
+COMPRESSIONS = ("zlib", "zstd")
+
+
+def is_delta_enabled() -> bool:
+    return os.getenv("CHECKPOINT_DELTA", "true").lower() == "true"
+
+
+def _common_prefix(old: Optional[List[Any]], new: List[Any]) -> int:
+    """두 리스트의 공통 prefix 길이 (같은 객체면 비교 생략)"""
+    if not old:
+        return 0
+    limit = min(len(old), len(new))
+    n = 0
+    while n < limit and (old[n] is new[n] or old[n] == new[n]):
+        n += 1
+    return n
+
+
+def _list_channels(channel_values: Dict[str, Any]) -> Dict[str, List[Any]]:
+    return {channel: list(value) for channel, value in channel_values.items() if isinstance(value, list)}
+
+
+@dataclass
+class _ResolvedLists:
+    """특정 체크포인트 시점의 list 채널 값과 delta 체인 깊이"""
+    depth: int
+    lists: Dict[str, List[Any]]
+
+
+class DeltaCheckpointSaver(SqliteCheckpointSaver):
+    """list 채널을 부모 대비 delta로 저장하는 SQLite 체크포인터"""
+
+    def __init__(self, path: Optional[str] = None, *, snapshot_every: Optional[int] = None,
+                 compression: Optional[str] = None, **kwargs: Any):
+        super().__init__(path, **kwargs)
+        self.snapshot_every = max(snapshot_every or int(os.getenv("CHECKPOINT_SNAPSHOT_EVERY", "32")), 1)
+        self.compression = (compression or os.getenv("CHECKPOINT_COMPRESSION", "zlib")).lower()
+        if self.compression == "zstd" and zstandard is None:
+            logger.warning("zstandard not installed, falling back to zlib checkpoint compression")
+            self.compression = "zlib"
+        self.compress_min_bytes = int(os.getenv("CHECKPOINT_COMPRESS_MIN_BYTES", "1024"))
+        self._cache_size = int(os.getenv("CHECKPOINT_DELTA_CACHE", "128"))
+        self._cache: "OrderedDict[Tuple[str, str, str], _ResolvedLists]" = OrderedDict()
+        self._delta_stats = {"snapshots": 0, "deltas": 0, "bytes_written": 0, "cache_hits": 0, "cache_misses": 0}
+
+    # ------------------------------------------------------------------
+    # 바이너리 인코딩 + 압축
+    # ------------------------------------------------------------------
+    def _encode(self, value: Any) -> Tuple[str, bytes]:
+        type_, data = self.serde.dumps_typed(value)
+        if self.compression in COMPRESSIONS and len(data) >= self.compress_min_bytes:
+            if self.compression == "zstd":
+                data = zstandard.ZstdCompressor(level=3).compress(data)
+            else:
+                data = zlib.compress(data, 1)
+            type_ = f"{self.compression}:{type_}"
+        return type_, data
+
+    def _decode(self, type_: str, data: bytes) -> Any:
+        codec, _, inner = type_.partition(":")
+        if codec == "zlib":
+            return self.serde.loads_typed((inner, zlib.decompress(data)))
+        if codec == "zstd":
+            if zstandard is None:
+                raise RuntimeError("zstandard is required to read zstd-compressed checkpoints")
+            return self.serde.loads_typed((inner, zstandard.ZstdDecompressor().decompress(data)))
+        return self.serde.loads_typed((type_, data))
+
+    # ------------------------------------------------------------------
+    # list 채널 캐시 (스레드, namespace, 체크포인트 ID -> 복원된 리스트)
+    # ------------------------------------------------------------------
+    def _remember(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str,
+                  resolved: _ResolvedLists) -> _ResolvedLists:
+        key = (thread_id, checkpoint_ns, checkpoint_id)
+        self._cache[key] = resolved
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return resolved
+
+    def _fetch(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> Optional[Tuple[str, bytes]]:
+        return self.conn.execute(
+            "SELECT type, checkpoint FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchone()
+
+    def _resolve_lists(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> _ResolvedLists:
+        """체크포인트 시점의 list 채널 값 (캐시 또는 가장 가까운 스냅샷에서 delta를 순서대로 적용)"""
+        with self._lock:
+            chain: List[Tuple[str, Dict[str, Any]]] = []
+            current = checkpoint_id
+            while True:
+                cached = self._cache.get((thread_id, checkpoint_ns, current))
+                if cached is not None:
+                    self._delta_stats["cache_hits"] += 1
+                    resolved = cached
+                    break
+                self._delta_stats["cache_misses"] += 1
+                row = self._fetch(thread_id, checkpoint_ns, current)
+                if row is None:
+                    raise ValueError(f"Delta base checkpoint {current} not found for thread {thread_id}")
+                type_, blob = row
+                if not type_.startswith(DELTA_PREFIX):
+                    snapshot = self._decode(type_, blob)
+                    resolved = self._remember(
+                        thread_id, checkpoint_ns, current,
+                        _ResolvedLists(0, _list_channels(snapshot["channel_values"])),
+                    )
+                    break
+                payload = self._decode(type_[len(DELTA_PREFIX):], blob)
+                chain.append((current, payload))
+                current = payload["base"]
+
+            for delta_id, payload in reversed(chain):
+                resolved = self._remember(thread_id, checkpoint_ns, delta_id, _ResolvedLists(
+                    payload["depth"], self._apply(resolved.lists, payload),
+                ))
+            return resolved
+
+    @staticmethod
+    def _apply(base_lists: Dict[str, List[Any]], payload: Dict[str, Any]) -> Dict[str, List[Any]]:
+        tails = payload["checkpoint"]["channel_values"]
+        return {
+            channel: base_lists.get(channel, [])[:prefix] + list(tails.get(channel, []))
+            for channel, prefix in payload["prefix"].items()
+        }
+
+    # ------------------------------------------------------------------
+    # SqliteCheckpointSaver 저장 형식 hook
+    # ------------------------------------------------------------------
+    def _dump_checkpoint(self, thread_id: str, checkpoint_ns: str, checkpoint: Checkpoint,
+                         parent_checkpoint_id: Optional[str]) -> Tuple[str, bytes]:
+        lists = _list_channels(checkpoint["channel_values"])
+        base: Optional[_ResolvedLists] = None
+        if lists and parent_checkpoint_id:
+            try:
+                base = self._resolve_lists(thread_id, checkpoint_ns, parent_checkpoint_id)
+            except ValueError:
+                base = None
+
+        if base is None or base.depth + 1 >= self.snapshot_every:
+            type_, blob = self._encode(checkpoint)
+            depth = 0
+            self._delta_stats["snapshots"] += 1
+        else:
+            depth = base.depth + 1
+            prefix: Dict[str, int] = {}
+            channel_values = dict(checkpoint["channel_values"])
+            for channel, value in lists.items():
+                prefix[channel] = _common_prefix(base.lists.get(channel), value)
+                channel_values[channel] = value[prefix[channel]:]
+            type_, blob = self._encode({
+                "base": parent_checkpoint_id,
+                "depth": depth,
+                "prefix": prefix,
+                "checkpoint": {**checkpoint, "channel_values": channel_values},
+            })
+            type_ = DELTA_PREFIX + type_
+            self._delta_stats["deltas"] += 1
+
+        self._remember(thread_id, checkpoint_ns, checkpoint["id"], _ResolvedLists(depth, lists))
+        self._delta_stats["bytes_written"] += len(blob)
+        return type_, blob
+
+    def _load_checkpoint(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str,
+                         type_: str, blob: bytes, parent_checkpoint_id: Optional[str]) -> Checkpoint:
+        if not type_.startswith(DELTA_PREFIX):
+            checkpoint = self._decode(type_, blob)
+            self._remember(thread_id, checkpoint_ns, checkpoint_id,
+                           _ResolvedLists(0, _list_channels(checkpoint["channel_values"])))
+            return checkpoint
+
+        payload = self._decode(type_[len(DELTA_PREFIX):], blob)
+        base = self._resolve_lists(thread_id, checkpoint_ns, payload["base"])
+        lists = self._apply(base.lists, payload)
+        self._remember(thread_id, checkpoint_ns, checkpoint_id, _ResolvedLists(payload["depth"], lists))
+        checkpoint = payload["checkpoint"]
+        return {**checkpoint, "channel_values": {**checkpoint["channel_values"], **lists}}
+
+    # ------------------------------------------------------------------
+    # 보존 정책: 삭제될 체크포인트를 base로 참조하는 delta는 스냅샷으로 다시 저장
+    # ------------------------------------------------------------------
+    def prune_thread(self, thread_id: str, keep_last: int) -> int:
+        with self._lock:
+            namespaces = [row[0] for row in self.conn.execute(
+                "SELECT DISTINCT checkpoint_ns FROM checkpoints WHERE thread_id = ?", (thread_id,)
+            )]
+            for checkpoint_ns in namespaces:
+                keep = set(self._kept_checkpoint_ids(thread_id, checkpoint_ns, keep_last))
+                rows = self.conn.execute(
+                    "SELECT checkpoint_id, type, checkpoint FROM checkpoints "
+                    "WHERE thread_id = ? AND checkpoint_ns = ? AND type LIKE ? ORDER BY checkpoint_id",
+                    (thread_id, checkpoint_ns, DELTA_PREFIX + "%"),
+                ).fetchall()
+                for checkpoint_id, type_, blob in rows:
+                    if checkpoint_id not in keep:
+                        continue
+                    payload = self._decode(type_[len(DELTA_PREFIX):], blob)
+                    if payload["base"] in keep:
+                        continue
+                    checkpoint = self._load_checkpoint(thread_id, checkpoint_ns, checkpoint_id, type_, blob, None)
+                    snapshot_type, snapshot = self._encode(checkpoint)
+                    self._begin_write()
+                    self.conn.execute(
+                        "UPDATE checkpoints SET type = ?, checkpoint = ? "
+                        "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                        (snapshot_type, snapshot, thread_id, checkpoint_ns, checkpoint_id),
+                    )
+                    self._remember(thread_id, checkpoint_ns, checkpoint_id,
+                                   _ResolvedLists(0, _list_channels(checkpoint["channel_values"])))
+            return super().prune_thread(thread_id, keep_last)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            super().delete_thread(thread_id)
+            for key in [key for key in self._cache if key[0] == thread_id]:
+                del self._cache[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        stats["delta"] = {
+            "snapshot_every": self.snapshot_every,
+            "compression": self.compression,
+            **self._delta_stats,
+        }
+        return stats
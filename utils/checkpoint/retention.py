@@ -0,0 +1,331 @@
+"""
+체크포인트 보존 정책 - 장시간 실행되는 프로세스(웹 UI)에서 체크포인터가 무한히 커지지 않도록
+thread별 최근 K개만 유지하고, 오래 사용하지 않은 thread를 삭제하며, 전체 용량이 한도를 넘으면
+가장 오래전에 사용한 thread부터 제거 (백그라운드 compactor 스레드가 주기적으로 실행)
+
+환경변수:
+- CHECKPOINT_RETENTION: 보존 정책 사용 여부 (기본 true)
+- CHECKPOINT_KEEP_LAST: thread/namespace별 보존할 최근 체크포인트 수 (기본 20, 최소 2)
+- CHECKPOINT_IDLE_TTL: 이 시간(초) 동안 사용하지 않은 thread 삭제 (기본 86400, 0이면 사용 안 함)
+- CHECKPOINT_MAX_MB: 전체 체크포인트 용량 한도 (MB, 기본 256, 0이면 사용 안 함)
+- CHECKPOINT_COMPACT_INTERVAL: compactor 실행 주기 (초, 기본 60)
+- CHECKPOINT_ACTIVE_GRACE: 최근 이 시간(초) 안에 사용한 thread는 LRU 삭제에서 제외 (기본 60)
+"""
+
+import os
+import time
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, CheckpointMetadata, CheckpointTuple
+from langgraph.checkpoint.memory import InMemorySaver
+
+logger = logging.getLogger(__name__)
+
+# 부모 체크포인트의 pending sends 복원을 위해 항상 최소 2개는 보존
+MIN_KEEP_LAST = 2
+
+
+@dataclass
+class RetentionPolicy:
+    """체크포인트 보존 정책"""
+    keep_last: int = 20
+    idle_ttl: float = 86400.0
+    max_bytes: int = 256 * 1024 * 1024
+    interval: float = 60.0
+    active_grace: float = 60.0
+
+
+def is_retention_enabled() -> bool:
+    return os.getenv("CHECKPOINT_RETENTION", "true").lower() == "true"
+
+
+def get_retention_policy() -> RetentionPolicy:
+    """환경변수에서 보존 정책 로드"""
+    return RetentionPolicy(
+        keep_last=max(int(os.getenv("CHECKPOINT_KEEP_LAST", "20")), MIN_KEEP_LAST),
+        idle_ttl=float(os.getenv("CHECKPOINT_IDLE_TTL", "86400")),
+        max_bytes=int(float(os.getenv("CHECKPOINT_MAX_MB", "256")) * 1024 * 1024),
+        interval=float(os.getenv("CHECKPOINT_COMPACT_INTERVAL", "60")),
+        active_grace=float(os.getenv("CHECKPOINT_ACTIVE_GRACE", "60")),
+    )
+
+
+class RetainingMemorySaver(InMemorySaver):
+    """
+    보존 정책을 적용할 수 있는 InMemorySaver
+
+    compactor 스레드와 이벤트 루프가 같은 dict를 다루므로 모든 접근을 lock으로 보호하고
+    thread별 마지막 접근 시각을 기록
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._lock = threading.RLock()
+        self._last_access: Dict[str, float] = {}
+
+    def _touch(self, config: RunnableConfig) -> None:
+        thread_id = config.get("configurable", {}).get("thread_id")
+        if thread_id is not None:
+            self._last_access[str(thread_id)] = time.time()
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        with self._lock:
+            self._touch(config)
+            return super().get_tuple(config)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        # 제너레이터가 lock 밖에서 소비되지 않도록 결과를 먼저 만듦
+        with self._lock:
+            items = list(super().list(config, filter=filter, before=before, limit=limit))
+        yield from items
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        with self._lock:
+            self._touch(config)
+            return super().put(config, checkpoint, metadata, new_versions)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        with self._lock:
+            super().put_writes(config, writes, task_id, task_path)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            super().delete_thread(thread_id)
+            self._last_access.pop(thread_id, None)
+
+    # ------------------------------------------------------------------
+    # 보존 정책 (CheckpointCompactor에서 사용)
+    # ------------------------------------------------------------------
+    def thread_activity(self) -> Dict[str, float]:
+        """thread별 마지막 접근 시각"""
+        with self._lock:
+            now = time.time()
+            return {thread_id: self._last_access.setdefault(thread_id, now) for thread_id in self.storage}
+
+    def prune_thread(self, thread_id: str, keep_last: int) -> int:
+        """namespace별 최근 keep_last개만 남기고 오래된 체크포인트, 쓰기, 참조되지 않는 blob 삭제"""
+        removed = 0
+        with self._lock:
+            for checkpoint_ns, checkpoints in self.storage.get(thread_id, {}).items():
+                if len(checkpoints) <= keep_last:
+                    continue
+                ordered = sorted(checkpoints, reverse=True)
+                keep = set(ordered[:keep_last])
+                # 가장 오래된 보존 체크포인트의 부모는 pending sends 복원에 필요
+                parent_id = checkpoints[ordered[keep_last - 1]][2]
+                if parent_id:
+                    keep.add(parent_id)
+                for checkpoint_id in ordered[keep_last:]:
+                    if checkpoint_id in keep:
+                        continue
+                    del checkpoints[checkpoint_id]
+                    self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+                    removed += 1
+                self._drop_unreferenced_blobs(thread_id, checkpoint_ns, checkpoints)
+        return removed
+
+    def _drop_unreferenced_blobs(self, thread_id: str, checkpoint_ns: str, checkpoints: Dict[str, Any]) -> None:
+        referenced = set()
+        for typed_checkpoint, _, _ in checkpoints.values():
+            checkpoint = self.serde.loads_typed(typed_checkpoint)
+            referenced.update(checkpoint["channel_versions"].items())
+        for key in [
+            key for key in self.blobs
+            if key[0] == thread_id and key[1] == checkpoint_ns and (key[2], key[3]) not in referenced
+        ]:
+            del self.blobs[key]
+
+    def estimate_bytes(self) -> Dict[str, int]:
+        """thread별 직렬화된 체크포인트/쓰기/blob 크기"""
+        with self._lock:
+            sizes: Dict[str, int] = {}
+            for thread_id, namespaces in self.storage.items():
+                sizes[thread_id] = sum(
+                    len(typed_checkpoint[1]) + len(typed_metadata[1])
+                    for checkpoints in namespaces.values()
+                    for typed_checkpoint, typed_metadata, _ in checkpoints.values()
+                )
+            for (thread_id, _, _), task_writes in self.writes.items():
+                sizes[thread_id] = sizes.get(thread_id, 0) + sum(
+                    len(write[2][1]) for write in task_writes.values()
+                )
+            for (thread_id, _, _, _), typed_value in self.blobs.items():
+                sizes[thread_id] = sizes.get(thread_id, 0) + len(typed_value[1])
+        return sizes
+
+
+class CheckpointCompactor:
+    """
+    백그라운드 compactor - 주기적으로 보존 정책을 적용
+
+    1. CHECKPOINT_IDLE_TTL 이상 사용하지 않은 thread 삭제
+    2. 남은 thread는 최근 keep_last개 체크포인트만 보존
+    3. 전체 용량이 max_bytes를 넘으면 가장 오래전에 사용한 thread부터 삭제
+       (최근 active_grace초 안에 사용한 thread는 제외)
+    """
+
+    def __init__(self, saver: Any, policy: Optional[RetentionPolicy] = None):
+        self.saver = saver
+        self.policy = policy or get_retention_policy()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._run_lock = threading.Lock()
+        self.stats: Dict[str, Any] = {
+            "runs": 0,
+            "idle_evicted_threads": 0,
+            "lru_evicted_threads": 0,
+            "pruned_checkpoints": 0,
+            "bytes_before": 0,
+            "bytes_after": 0,
+            "threads": 0,
+            "last_run_at": None,
+            "last_run_seconds": 0.0,
+            "errors": 0,
+        }
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._loop, name="checkpoint-compactor", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Checkpoint compactor started (keep_last={self.policy.keep_last}, "
+            f"idle_ttl={self.policy.idle_ttl}s, max_bytes={self.policy.max_bytes})"
+        )
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.policy.interval):
+            try:
+                self.run_once()
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"Checkpoint compaction failed: {e}")
+
+    def run_once(self) -> Dict[str, Any]:
+        """보존 정책 1회 적용 후 이번 실행의 통계 반환"""
+        with self._run_lock:
+            started = time.perf_counter()
+            now = time.time()
+            policy = self.policy
+            activity = self.saver.thread_activity()
+            sizes = self.saver.estimate_bytes()
+            bytes_before = sum(sizes.values())
+
+            idle_evicted: List[str] = []
+            if policy.idle_ttl > 0:
+                for thread_id, accessed in activity.items():
+                    if now - accessed > policy.idle_ttl:
+                        self.saver.delete_thread(thread_id)
+                        idle_evicted.append(thread_id)
+            for thread_id in idle_evicted:
+                activity.pop(thread_id, None)
+
+            pruned = sum(self.saver.prune_thread(thread_id, policy.keep_last) for thread_id in activity)
+
+            lru_evicted: List[str] = []
+            sizes = self.saver.estimate_bytes()
+            total = sum(sizes.values())
+            if policy.max_bytes > 0 and total > policy.max_bytes:
+                candidates = sorted(
+                    (accessed, thread_id) for thread_id, accessed in activity.items()
+                    if now - accessed > policy.active_grace
+                )
+                for _, thread_id in candidates:
+                    if total <= policy.max_bytes:
+                        break
+                    self.saver.delete_thread(thread_id)
+                    total -= sizes.get(thread_id, 0)
+                    lru_evicted.append(thread_id)
+
+            if (idle_evicted or pruned or lru_evicted) and hasattr(self.saver, "after_compaction"):
+                self.saver.after_compaction()
+
+            elapsed = time.perf_counter() - started
+            self.stats["runs"] += 1
+            self.stats["idle_evicted_threads"] += len(idle_evicted)
+            self.stats["lru_evicted_threads"] += len(lru_evicted)
+            self.stats["pruned_checkpoints"] += pruned
+            self.stats["bytes_before"] = bytes_before
+            self.stats["bytes_after"] = total
+            self.stats["threads"] = len(activity) - len(lru_evicted)
+            self.stats["last_run_at"] = now
+            self.stats["last_run_seconds"] = elapsed
+
+            if idle_evicted or pruned or lru_evicted:
+                logger.info(
+                    f"Checkpoint compaction: {len(idle_evicted)} idle / {len(lru_evicted)} LRU threads evicted, "
+                    f"{pruned} checkpoints pruned, {bytes_before} -> {total} bytes"
+                )
+            return {
+                "idle_evicted": idle_evicted,
+                "lru_evicted": lru_evicted,
+                "pruned_checkpoints": pruned,
+                "bytes_before": bytes_before,
+                "bytes_after": total,
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "policy": {
+                "keep_last": self.policy.keep_last,
+                "idle_ttl": self.policy.idle_ttl,
+                "max_bytes": self.policy.max_bytes,
+                "interval": self.policy.interval,
+            },
+            **self.stats,
+        }
+
+
+# 전역 compactor (get_checkpointer에서 시작)
+_compactor: Optional[CheckpointCompactor] = None
+
+
+def start_compactor(saver: Any) -> Optional[CheckpointCompactor]:
+    """보존 정책을 지원하는 체크포인터에 대해 백그라운드 compactor 시작"""
+    global _compactor
+    if not is_retention_enabled() or not hasattr(saver, "prune_thread"):
+        return None
+    stop_compactor()
+    _compactor = CheckpointCompactor(saver)
+    _compactor.start()
+    return _compactor
+
+
+def stop_compactor() -> None:
+    global _compactor
+    if _compactor is not None:
+        _compactor.stop()
+        _compactor = None
+
+
+def get_retention_stats() -> Optional[Dict[str, Any]]:
+    return _compactor.get_stats() if _compactor is not None else None
@@ -0,0 +1,433 @@
+"""
+SQLite 체크포인터 (WAL 모드)
+InMemorySaver를 대체하는 파일 기반 체크포인터 - 프로세스 메모리를 일정하게 유지하고
+재시작 후에도 (thread_id, checkpoint_id) 인덱스로 대화를 빠르게 이어갈 수 있음
+
+- WAL 저널 + synchronous=NORMAL
+- 쓰기는 하나의 트랜잭션에 모아 CHECKPOINT_SQLITE_BATCH개 또는 CHECKPOINT_SQLITE_FLUSH_INTERVAL초마다 commit
+  (같은 연결에서 읽으므로 commit 전 데이터도 즉시 조회됨)
+"""
+
+import os
+import atexit
+import random
+import sqlite3
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+)
+from langgraph.constants import TASKS
+
+try:
+    from langgraph.checkpoint.base import get_checkpoint_metadata
+except ImportError:  # 구버전 langgraph-checkpoint
+    def get_checkpoint_metadata(config: RunnableConfig, metadata: CheckpointMetadata) -> CheckpointMetadata:
+        return metadata
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    type TEXT,
+    checkpoint BLOB,
+    metadata_type TEXT,
+    metadata BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    task_path TEXT NOT NULL DEFAULT '',
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT,
+    value BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+CREATE TABLE IF NOT EXISTS threads (
+    thread_id TEXT PRIMARY KEY,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+class SqliteCheckpointSaver(BaseCheckpointSaver[str]):
+    """WAL 모드 SQLite 기반 체크포인터 (배치 commit)"""
+
+    def __init__(self, path: Optional[str] = None, batch_size: Optional[int] = None,
+                 flush_interval: Optional[float] = None, *, serde=None):
+        super().__init__(serde=serde)
+        self.path = Path(path or os.getenv("CHECKPOINT_DB_PATH", "cache/checkpoints.sqlite"))
+        self.batch_size = batch_size or int(os.getenv("CHECKPOINT_SQLITE_BATCH", "32"))
+        self.flush_interval = flush_interval if flush_interval is not None else float(
+            os.getenv("CHECKPOINT_SQLITE_FLUSH_INTERVAL", "1.0")
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._pending = 0
+        self._closed = False
+        self._stop = threading.Event()
+        # thread별 마지막 접근 시각 (조회는 메모리에만, 저장 시 threads 테이블에 기록)
+        self._last_access: Dict[str, float] = {}
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        # threads 테이블 이전에 저장된 thread도 보존 정책 대상에 포함
+        self.conn.execute(
+            "INSERT OR IGNORE INTO threads (thread_id, updated_at) "
+            "SELECT DISTINCT thread_id, ? FROM checkpoints",
+            (time.time(),),
+        )
+
+        self._flusher = threading.Thread(target=self._flush_loop, name="checkpoint-flush", daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
+        logger.info(f"SQLite checkpointer initialized at {self.path}")
+
+    # ------------------------------------------------------------------
+    # 배치 commit
+    # ------------------------------------------------------------------
+    def _begin_write(self):
+        """쓰기 트랜잭션 시작 (이미 열려 있으면 이어서 사용)"""
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN")
+
+    def _after_write(self):
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """보류 중인 쓰기 commit"""
+        with self._lock:
+            if self.conn.in_transaction:
+                self.conn.execute("COMMIT")
+            self._pending = 0
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            if self._pending:
+                try:
+                    self.flush()
+                except sqlite3.Error as e:
+                    logger.warning(f"Checkpoint flush failed: {e}")
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._stop.set()
+            try:
+                self.flush()
+                self.conn.close()
+            except sqlite3.Error:
+                pass
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def _load_writes(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> List[Tuple[str, str, Any]]:
+        rows = self.conn.execute(
+            "SELECT task_id, channel, type, value FROM writes "
+            "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+        return [(task_id, channel, self.serde.loads_typed((type_, value))) for task_id, channel, type_, value in rows]
+
+    def _load_checkpoint(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str,
+                         type_: str, blob: bytes, parent_checkpoint_id: Optional[str]) -> Checkpoint:
+        """체크포인트 역직렬화 (하위 클래스에서 저장 형식 변경 가능)"""
+        return self.serde.loads_typed((type_, blob))
+
+    def _dump_checkpoint(self, thread_id: str, checkpoint_ns: str, checkpoint: Checkpoint,
+                         parent_checkpoint_id: Optional[str]) -> Tuple[str, bytes]:
+        """체크포인트 직렬화 (하위 클래스에서 저장 형식 변경 가능)"""
+        return self.serde.dumps_typed(checkpoint)
+
+    def _row_to_tuple(self, row: Tuple) -> CheckpointTuple:
+        (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id,
+         type_, blob, metadata_type, metadata) = row
+        checkpoint = self._load_checkpoint(thread_id, checkpoint_ns, checkpoint_id, type_, blob, parent_checkpoint_id)
+        if not checkpoint.get("pending_sends") and parent_checkpoint_id:
+            # 부모 체크포인트의 TASKS 쓰기에서 pending sends 복원 (InMemorySaver와 동일)
+            sends = [
+                value for _, channel, value in self._load_writes(thread_id, checkpoint_ns, parent_checkpoint_id)
+                if channel == TASKS
+            ]
+            checkpoint = {**checkpoint, "pending_sends": sends}
+        return CheckpointTuple(
+            config={"configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint_id,
+            }},
+            checkpoint=checkpoint,
+            metadata=self.serde.loads_typed((metadata_type, metadata)) if metadata is not None else {},
+            parent_config={"configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": parent_checkpoint_id,
+            }} if parent_checkpoint_id else None,
+            pending_writes=self._load_writes(thread_id, checkpoint_ns, checkpoint_id),
+        )
+
+    _COLUMNS = ("thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, "
+                "type, checkpoint, metadata_type, metadata")
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        with self._lock:
+            self._last_access[thread_id] = time.time()
+            if checkpoint_id := get_checkpoint_id(config):
+                row = self.conn.execute(
+                    f"SELECT {self._COLUMNS} FROM checkpoints "
+                    "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    (thread_id, checkpoint_ns, checkpoint_id),
+                ).fetchone()
+            else:
+                row = self.conn.execute(
+                    f"SELECT {self._COLUMNS} FROM checkpoints "
+                    "WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT 1",
+                    (thread_id, checkpoint_ns),
+                ).fetchone()
+            return self._row_to_tuple(row) if row else None
+
+    def list(self, config: Optional[RunnableConfig], *, filter: Optional[Dict[str, Any]] = None,
+             before: Optional[RunnableConfig] = None, limit: Optional[int] = None) -> Iterator[CheckpointTuple]:
+        clauses, params = [], []
+        if config is not None:
+            configurable = config["configurable"]
+            clauses.append("thread_id = ?")
+            params.append(configurable["thread_id"])
+            if "checkpoint_ns" in configurable:
+                clauses.append("checkpoint_ns = ?")
+                params.append(configurable["checkpoint_ns"])
+            if checkpoint_id := get_checkpoint_id(config):
+                clauses.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if before is not None and (before_id := get_checkpoint_id(before)):
+            clauses.append("checkpoint_id < ?")
+            params.append(before_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        # 메타데이터 필터가 없으면 LIMIT을 SQL에서 처리
+        limit_clause = f" LIMIT {int(limit)}" if limit is not None and not filter else ""
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT {self._COLUMNS} FROM checkpoints {where} ORDER BY checkpoint_id DESC{limit_clause}", params
+            ).fetchall()
+            results = []
+            for row in rows:
+                checkpoint_tuple = self._row_to_tuple(row)
+                if filter and not all(checkpoint_tuple.metadata.get(k) == v for k, v in filter.items()):
+                    continue
+                results.append(checkpoint_tuple)
+                if limit is not None and len(results) >= limit:
+                    break
+        yield from results
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+    def put(self, config: RunnableConfig, checkpoint: Checkpoint, metadata: CheckpointMetadata,
+            new_versions: ChannelVersions) -> RunnableConfig:
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        parent_checkpoint_id = configurable.get("checkpoint_id")
+        with self._lock:
+            type_, blob = self._dump_checkpoint(thread_id, checkpoint_ns, checkpoint, parent_checkpoint_id)
+            metadata_type, metadata_blob = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+            self._begin_write()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO checkpoints "
+                "(thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata_type, metadata) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (thread_id, checkpoint_ns, checkpoint["id"], parent_checkpoint_id,
+                 type_, blob, metadata_type, metadata_blob),
+            )
+            now = time.time()
+            self._last_access[thread_id] = now
+            self.conn.execute(
+                "INSERT OR REPLACE INTO threads (thread_id, updated_at) VALUES (?, ?)", (thread_id, now)
+            )
+            self._after_write()
+        return {"configurable": {
+            "thread_id": thread_id,
+            "checkpoint_ns": checkpoint_ns,
+            "checkpoint_id": checkpoint["id"],
+        }}
+
+    def put_writes(self, config: RunnableConfig, writes: Sequence[Tuple[str, Any]],
+                   task_id: str, task_path: str = "") -> None:
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        checkpoint_id = configurable["checkpoint_id"]
+        # 특수 채널(에러/인터럽트 등)은 덮어쓰고 일반 쓰기는 최초 1회만 저장
+        query = (
+            "INSERT OR REPLACE INTO writes" if all(w[0] in WRITES_IDX_MAP for w in writes)
+            else "INSERT OR IGNORE INTO writes"
+        )
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            type_, blob = self.serde.dumps_typed(value)
+            rows.append((thread_id, checkpoint_ns, checkpoint_id, task_id, task_path,
+                         WRITES_IDX_MAP.get(channel, idx), channel, type_, blob))
+        with self._lock:
+            self._begin_write()
+            self.conn.executemany(
+                f"{query} (thread_id, checkpoint_ns, checkpoint_id, task_id, task_path, idx, channel, type, value) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._after_write()
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            self._begin_write()
+            self.conn.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
+            self.conn.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
+            self.conn.execute("DELETE FROM threads WHERE thread_id = ?", (thread_id,))
+            self._last_access.pop(thread_id, None)
+            self.flush()
+
+    # ------------------------------------------------------------------
+    # 보존 정책 (CheckpointCompactor에서 사용)
+    # ------------------------------------------------------------------
+    def thread_activity(self) -> Dict[str, float]:
+        """thread별 마지막 접근 시각"""
+        with self._lock:
+            activity = dict(self.conn.execute("SELECT thread_id, updated_at FROM threads").fetchall())
+            for thread_id, accessed in self._last_access.items():
+                if thread_id in activity:
+                    activity[thread_id] = max(activity[thread_id], accessed)
+        return activity
+
+    def prune_thread(self, thread_id: str, keep_last: int) -> int:
+        """namespace별 최근 keep_last개만 남기고 오래된 체크포인트와 쓰기 삭제"""
+        removed = 0
+        with self._lock:
+            namespaces = [row[0] for row in self.conn.execute(
+                "SELECT DISTINCT checkpoint_ns FROM checkpoints WHERE thread_id = ?", (thread_id,)
+            )]
+            self._begin_write()
+            for checkpoint_ns in namespaces:
+                keep = self._kept_checkpoint_ids(thread_id, checkpoint_ns, keep_last)
+                if not keep:
+                    continue
+                marks = ",".join("?" * len(keep))
+                cursor = self.conn.execute(
+                    f"DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? "
+                    f"AND checkpoint_id NOT IN ({marks})",
+                    (thread_id, checkpoint_ns, *keep),
+                )
+                removed += cursor.rowcount
+                self.conn.execute(
+                    f"DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? "
+                    f"AND checkpoint_id NOT IN ({marks})",
+                    (thread_id, checkpoint_ns, *keep),
+                )
+            self.flush()
+        return removed
+
+    def _kept_checkpoint_ids(self, thread_id: str, checkpoint_ns: str, keep_last: int) -> List[str]:
+        """보존할 체크포인트 ID (최근 keep_last개 + 가장 오래된 것의 부모 - pending sends 복원용)"""
+        rows = self.conn.execute(
+            "SELECT checkpoint_id, parent_checkpoint_id FROM checkpoints "
+            "WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT ?",
+            (thread_id, checkpoint_ns, keep_last),
+        ).fetchall()
+        keep = [checkpoint_id for checkpoint_id, _ in rows]
+        if rows and rows[-1][1]:
+            keep.append(rows[-1][1])
+        return keep
+
+    def estimate_bytes(self) -> Dict[str, int]:
+        """thread별 저장 용량 (체크포인트 + 쓰기)"""
+        with self._lock:
+            sizes: Dict[str, int] = {}
+            for query in (
+                "SELECT thread_id, SUM(LENGTH(checkpoint) + IFNULL(LENGTH(metadata), 0)) FROM checkpoints GROUP BY thread_id",
+                "SELECT thread_id, SUM(IFNULL(LENGTH(value), 0)) FROM writes GROUP BY thread_id",
+            ):
+                for thread_id, size in self.conn.execute(query):
+                    sizes[thread_id] = sizes.get(thread_id, 0) + int(size or 0)
+        return sizes
+
+    def after_compaction(self) -> None:
+        """삭제 후 WAL 파일 정리"""
+        with self._lock:
+            self.flush()
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def get_next_version(self, current: Optional[str], channel: Any) -> str:
+        """InMemorySaver와 같은 문자열 버전 형식"""
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    # ------------------------------------------------------------------
+    # 비동기 API - SQLite 호출은 짧고 배치 commit이므로 이벤트 루프에서 바로 실행
+    # ------------------------------------------------------------------
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return self.get_tuple(config)
+
+    async def alist(self, config: Optional[RunnableConfig], *, filter: Optional[Dict[str, Any]] = None,
+                    before: Optional[RunnableConfig] = None, limit: Optional[int] = None) -> AsyncIterator[CheckpointTuple]:
+        for item in self.list(config, filter=filter, before=before, limit=limit):
+            yield item
+
+    async def aput(self, config: RunnableConfig, checkpoint: Checkpoint, metadata: CheckpointMetadata,
+                   new_versions: ChannelVersions) -> RunnableConfig:
+        return self.put(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(self, config: RunnableConfig, writes: Sequence[Tuple[str, Any]],
+                          task_id: str, task_path: str = "") -> None:
+        self.put_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        self.delete_thread(thread_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """디버깅용 통계"""
+        with self._lock:
+            threads, checkpoints = self.conn.execute(
+                "SELECT COUNT(DISTINCT thread_id), COUNT(*) FROM checkpoints"
+            ).fetchone()
+            writes = self.conn.execute("SELECT COUNT(*) FROM writes").fetchone()[0]
+        size = self.path.stat().st_size if self.path.exists() else 0
+        return {
+            "path": str(self.path),
+            "threads": threads,
+            "checkpoints": checkpoints,
+            "writes": writes,
+            "db_bytes": size,
+            "pending_writes": self._pending,
+        }
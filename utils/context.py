@@ -0,0 +1,288 @@
+"""
+에이전트별 컨텍스트 윈도우 관리자
+create_react_agent의 pre_model_hook(utils/hooks.py)에서 호출되어 최근 턴은 그대로 두고
+오래된 턴은 캐시된 rolling summary로 접어서 LLM 입력만 줄임 (공유 state의 messages는 변경하지 않음)
+"""
+
+import os
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
+
+from langchain_core.messages import BaseMessage, HumanMessage, ToolMessage, AIMessage
+from langchain_core.messages.utils import count_tokens_approximately
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_PREFIX = "[Summary of earlier conversation]"
+
+SUMMARY_PROMPT = """You maintain a running summary of a red team engagement conversation between multiple agents.
+Update the existing summary with the new messages below. Keep every concrete fact that later steps may need:
+targets, hosts, open ports, services and versions, findings, decisions, handoffs and pending tasks.
+Drop pleasantries and repeated output. Answer with the updated summary only, at most {max_tokens} tokens.
+
+<existing_summary>
+{summary}
+</existing_summary>
+
+<new_messages>
+{messages}
+</new_messages>"""
+
+
+@dataclass
+class ContextBudget:
+    """에이전트별 토큰 예산"""
+    max_tokens: int = 24000          # LLM에 전달할 메시지 전체 예산 (시스템 프롬프트 제외)
+    keep_recent_tokens: int = 8000   # 요약 시 원문으로 유지할 최근 메시지 토큰
+    summary_max_tokens: int = 1000   # rolling summary 최대 길이
+
+
+@dataclass
+class RollingSummary:
+    """스레드별 누적 요약"""
+    text: str = ""
+    folded_count: int = 0            # 요약에 포함된 앞쪽 메시지 수
+    folded_tokens: int = 0           # 요약된 원문 메시지 토큰 합
+    boundary_id: Optional[str] = None  # 마지막으로 요약된 메시지 ID (히스토리 변경 감지용)
+
+
+@dataclass
+class ContextStats:
+    """토큰 절감 통계"""
+    calls: int = 0
+    managed_calls: int = 0
+    summary_updates: int = 0
+    tokens_in: int = 0
+    tokens_sent: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_in - self.tokens_sent
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "managed_calls": self.managed_calls,
+            "summary_updates": self.summary_updates,
+            "tokens_in": self.tokens_in,
+            "tokens_sent": self.tokens_sent,
+            "tokens_saved": self.tokens_saved,
+        }
+
+
+def get_context_budget(agent_name: str) -> ContextBudget:
+    """환경변수에서 토큰 예산 로드 - CONTEXT_MAX_TOKENS_<AGENT>로 에이전트별 override"""
+    suffix = agent_name.upper()
+
+    def _read(key: str, default: int) -> int:
+        return int(os.getenv(f"{key}_{suffix}", os.getenv(key, str(default))))
+
+    defaults = ContextBudget()
+    return ContextBudget(
+        max_tokens=_read("CONTEXT_MAX_TOKENS", defaults.max_tokens),
+        keep_recent_tokens=_read("CONTEXT_KEEP_RECENT_TOKENS", defaults.keep_recent_tokens),
+        summary_max_tokens=_read("CONTEXT_SUMMARY_MAX_TOKENS", defaults.summary_max_tokens),
+    )
+
+
+def is_context_management_enabled() -> bool:
+    return os.getenv("CONTEXT_MANAGEMENT", "true").lower() == "true"
+
+
+def _render_message(message: BaseMessage, limit: int = 2000) -> str:
+    """요약 입력용 메시지 텍스트"""
+    text = message.text() if hasattr(message, "text") else str(message.content)
+    if len(text) > limit:
+        text = text[:limit] + " ...[truncated]"
+    label = message.type
+    if getattr(message, "name", None):
+        label += f"({message.name})"
+    if isinstance(message, AIMessage) and message.tool_calls:
+        calls = ", ".join(f"{c['name']}({c['args']})" for c in message.tool_calls)
+        text = f"{text}\n[tool calls: {calls}]" if text else f"[tool calls: {calls}]"
+    return f"{label}: {text}"
+
+
+class ContextWindowManager:
+    """rolling summary 기반 컨텍스트 윈도우 관리자 (에이전트당 1개)"""
+
+    def __init__(self, agent_name: str, budget: Optional[ContextBudget] = None,
+                 summarizer: Optional[Any] = None, max_threads: int = 256):
+        self.agent_name = agent_name
+        self.budget = budget or get_context_budget(agent_name)
+        self._summarizer = summarizer
+        self._max_threads = max_threads
+        self._summaries: "OrderedDict[Tuple[str, str], RollingSummary]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = ContextStats()
+
+    # ------------------------------------------------------------------
+    # 요약 캐시
+    # ------------------------------------------------------------------
+    def _get_summary(self, key: Tuple[str, str], messages: List[BaseMessage]) -> RollingSummary:
+        with self._lock:
+            summary = self._summaries.get(key)
+            if summary is not None:
+                self._summaries.move_to_end(key)
+        if summary is None or summary.folded_count > len(messages):
+            return RollingSummary()
+        if summary.folded_count and messages[summary.folded_count - 1].id != summary.boundary_id:
+            # 히스토리가 바뀌었으면 (예: 동일 thread 재사용) 처음부터 다시 요약
+            return RollingSummary()
+        return summary
+
+    def _put_summary(self, key: Tuple[str, str], summary: RollingSummary):
+        with self._lock:
+            self._summaries[key] = summary
+            self._summaries.move_to_end(key)
+            while len(self._summaries) > self._max_threads:
+                self._summaries.popitem(last=False)
+
+    def _find_cut(self, messages: List[BaseMessage], start: int) -> int:
+        """최근 keep_recent_tokens 만큼 남기는 절단 위치 (tool 호출/결과 쌍을 끊지 않음)"""
+        kept_tokens = 0
+        cut = len(messages)
+        for index in range(len(messages) - 1, start - 1, -1):
+            kept_tokens += count_tokens_approximately([messages[index]])
+            if kept_tokens > self.budget.keep_recent_tokens:
+                break
+            cut = index
+        # 마지막 메시지는 항상 유지
+        cut = min(cut, len(messages) - 1)
+        # 남길 구간이 tool 결과로 시작하지 않도록 그 결과를 요청한 AI 메시지까지 되돌림
+        # (start까지 되돌아가면 접을 메시지가 없으므로 요약하지 않음)
+        while cut > start and isinstance(messages[cut], ToolMessage):
+            cut -= 1
+        return max(cut, start)
+
+    # ------------------------------------------------------------------
+    # 요약 생성
+    # ------------------------------------------------------------------
+    def _build_prompt(self, previous: str, messages: List[BaseMessage]) -> str:
+        return SUMMARY_PROMPT.format(
+            max_tokens=self.budget.summary_max_tokens,
+            summary=previous or "(empty)",
+            messages="\n".join(_render_message(m) for m in messages),
+        )
+
+    def _fallback_summary(self, previous: str, messages: List[BaseMessage]) -> str:
+        """LLM 없이 만드는 추출 요약 (요약 모델 호출 실패 시)"""
+        lines = [previous] if previous else []
+        lines.extend(_render_message(m, limit=300) for m in messages)
+        text = "\n".join(lines)
+        max_chars = self.budget.summary_max_tokens * 4
+        return text[-max_chars:] if len(text) > max_chars else text
+
+    def _get_summarizer(self):
+        if self._summarizer is None:
+            from src.utils.llm.config_manager import get_current_llm
+            self._summarizer = get_current_llm()
+        return self._summarizer
+
+    def _summarize(self, previous: str, messages: List[BaseMessage]) -> str:
+        try:
+            summarizer = self._get_summarizer()
+            if summarizer is not None:
+                return summarizer.invoke(self._build_prompt(previous, messages)).text()
+        except Exception as e:
+            logger.warning(f"Context summarization failed for {self.agent_name}: {e}")
+        return self._fallback_summary(previous, messages)
+
+    async def _asummarize(self, previous: str, messages: List[BaseMessage]) -> str:
+        try:
+            summarizer = self._get_summarizer()
+            if summarizer is not None:
+                response = await summarizer.ainvoke(self._build_prompt(previous, messages))
+                return response.text()
+        except Exception as e:
+            logger.warning(f"Context summarization failed for {self.agent_name}: {e}")
+        return self._fallback_summary(previous, messages)
+
+    # ------------------------------------------------------------------
+    # 메인 로직
+    # ------------------------------------------------------------------
+    def _plan(self, messages: List[BaseMessage], key: Tuple[str, str]):
+        """요약 갱신이 필요한지 판단 - (summary, 새로 접을 메시지 구간 끝) 반환"""
+        summary = self._get_summary(key, messages)
+        pending = messages[summary.folded_count:]
+        summary_tokens = count_tokens_approximately([HumanMessage(content=summary.text)]) if summary.text else 0
+        if summary_tokens + count_tokens_approximately(pending) <= self.budget.max_tokens:
+            return summary, None
+        # 예산 초과 시에만 keep_recent_tokens까지 접음 (매 턴 요약하지 않도록 hysteresis)
+        cut = self._find_cut(messages, summary.folded_count)
+        return summary, (cut if cut > summary.folded_count else None)
+
+    def _apply_fold(self, summary: RollingSummary, messages: List[BaseMessage], cut: int, text: str) -> RollingSummary:
+        folded = messages[summary.folded_count:cut]
+        return RollingSummary(
+            text=text,
+            folded_count=cut,
+            folded_tokens=summary.folded_tokens + count_tokens_approximately(folded),
+            boundary_id=messages[cut - 1].id,
+        )
+
+    def _assemble(self, summary: RollingSummary, messages: List[BaseMessage]) -> List[BaseMessage]:
+        self.stats.calls += 1
+        tokens_in = count_tokens_approximately(messages)
+        if not summary.folded_count:
+            result = messages
+        else:
+            summary_message = HumanMessage(content=f"{SUMMARY_PREFIX}\n{summary.text}")
+            result = [summary_message] + messages[summary.folded_count:]
+            self.stats.managed_calls += 1
+        self.stats.tokens_in += tokens_in
+        self.stats.tokens_sent += count_tokens_approximately(result)
+        return result
+
+    def prepare(self, messages: List[BaseMessage], thread_id: str = "default") -> List[BaseMessage]:
+        """LLM 입력 메시지 준비 (동기)"""
+        if not messages:
+            return messages
+        key = (thread_id, messages[0].id or "")
+        summary, cut = self._plan(messages, key)
+        if cut is not None:
+            text = self._summarize(summary.text, messages[summary.folded_count:cut])
+            summary = self._apply_fold(summary, messages, cut, text)
+            self._put_summary(key, summary)
+            self._log_fold(summary)
+        return self._assemble(summary, messages)
+
+    async def aprepare(self, messages: List[BaseMessage], thread_id: str = "default") -> List[BaseMessage]:
+        """LLM 입력 메시지 준비 (비동기)"""
+        if not messages:
+            return messages
+        key = (thread_id, messages[0].id or "")
+        summary, cut = self._plan(messages, key)
+        if cut is not None:
+            text = await self._asummarize(summary.text, messages[summary.folded_count:cut])
+            summary = self._apply_fold(summary, messages, cut, text)
+            self._put_summary(key, summary)
+            self._log_fold(summary)
+        return self._assemble(summary, messages)
+
+    def _log_fold(self, summary: RollingSummary):
+        self.stats.summary_updates += 1
+        logger.info(
+            f"[{self.agent_name}] folded {summary.folded_count} messages "
+            f"({summary.folded_tokens} tokens) into rolling summary; "
+            f"total saved so far: {self.stats.tokens_saved} tokens"
+        )
+
+
+# 에이전트별 관리자 (프로세스 전역)
+_context_managers: Dict[str, ContextWindowManager] = {}
+
+
+def get_context_manager(agent_name: str) -> ContextWindowManager:
+    """에이전트별 컨텍스트 관리자 인스턴스 반환"""
+    if agent_name not in _context_managers:
+        _context_managers[agent_name] = ContextWindowManager(agent_name)
+    return _context_managers[agent_name]
+
+
+def get_context_stats() -> Dict[str, Dict[str, Any]]:
+    """에이전트별 토큰 절감 통계"""
+    return {name: manager.stats.to_dict() for name, manager in _context_managers.items()}
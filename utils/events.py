@@ -0,0 +1,175 @@
+"""
+공용 이벤트 모델 - executor, 로거, 재현, UI가 같은 이벤트 객체를 공유
+이벤트마다 여러 키를 가진 dict를 만드는 대신 __slots__ 클래스를 사용하고,
+에이전트/도구 이름은 intern해 모든 이벤트가 같은 문자열 객체를 가리키도록 함 (긴 세션의 이벤트당 메모리 절감)
+
+- WorkflowEvent: Executor.execute_workflow가 내보내는 이벤트 (st.session_state.event_history)
+- ChatMessage: MessageProcessor가 만드는 프론트엔드 메시지 (structured_messages, terminal_messages)
+- Event: 세션 로그에 기록/재현되는 이벤트 (Logger, ReplaySystem)
+
+기존 코드와 호환되도록 dict처럼 get() / [] / in 으로도 읽을 수 있음 (값이 None인 필드는 없는 키로 취급)
+"""
+
+import sys
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+_MISSING = object()
+
+
+def intern_name(name: Optional[str]) -> Optional[str]:
+    """에이전트/도구 이름 intern - 같은 이름은 하나의 문자열 객체를 공유"""
+    return sys.intern(name) if type(name) is str else name
+
+
+class SlotRecord:
+    """__slots__ 기반 레코드 - 자주 쓰는 키는 슬롯, 드문 키는 extra dict에 저장"""
+    __slots__ = ("extra",)
+    _fields: Tuple[str, ...] = ()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._fields:
+            value = getattr(self, key)
+            return default if value is None else value
+        if self.extra is not None:
+            return self.extra.get(key, default)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self._fields:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {key: getattr(self, key) for key in self._fields if getattr(self, key) is not None}
+        if self.extra:
+            result.update(self.extra)
+        return result
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class WorkflowEvent(SlotRecord):
+    """Executor 이벤트 (type: message / workflow_complete / error)"""
+    __slots__ = ("type", "message_type", "agent_name", "content", "timestamp", "step_count",
+                 "tool_name", "tool_display_name", "namespace", "raw_message")
+    _fields = __slots__
+
+    def __init__(self, type: str, timestamp: str, message_type: Optional[str] = None,
+                 agent_name: Optional[str] = None, content: Optional[str] = None,
+                 step_count: Optional[int] = None, tool_name: Optional[str] = None,
+                 tool_display_name: Optional[str] = None, namespace: Any = None,
+                 raw_message: Any = None, **extra):
+        self.type = type
+        self.timestamp = timestamp
+        self.message_type = message_type
+        self.agent_name = intern_name(agent_name)
+        self.content = content
+        self.step_count = step_count
+        self.tool_name = intern_name(tool_name)
+        self.tool_display_name = intern_name(tool_display_name)
+        self.namespace = namespace
+        self.raw_message = raw_message
+        self.extra = extra or None
+
+    def release(self):
+        """처리가 끝난 뒤 원본 LangChain 메시지 참조 해제 (이벤트 기록에 메시지 전체가 남지 않도록)"""
+        self.raw_message = None
+
+
+class ChatMessage(SlotRecord):
+    """프론트엔드 메시지 (type: user / ai / tool)"""
+    __slots__ = ("type", "id", "content", "agent_id", "display_name", "avatar",
+                 "tool_name", "tool_display_name", "tool_calls")
+    _fields = __slots__
+
+    def __init__(self, type: str, id: str, content: str, agent_id: Optional[str] = None,
+                 display_name: Optional[str] = None, avatar: Optional[str] = None,
+                 tool_name: Optional[str] = None, tool_display_name: Optional[str] = None,
+                 tool_calls: Optional[List[Dict[str, Any]]] = None, **extra):
+        self.type = type
+        self.id = id
+        self.content = content
+        self.agent_id = intern_name(agent_id)
+        self.display_name = intern_name(display_name)
+        self.avatar = intern_name(avatar)
+        self.tool_name = intern_name(tool_name)
+        self.tool_display_name = intern_name(tool_display_name)
+        self.tool_calls = tool_calls or None
+        self.extra = extra or None
+
+
+class EventType(Enum):
+    """재현에 필요한 최소한의 이벤트 타입"""
+    USER_INPUT = "user_input"
+    AGENT_RESPONSE = "agent_response"
+    TOOL_COMMAND = "tool_command"
+    TOOL_OUTPUT = "tool_output"
+
+
+class Event(SlotRecord):
+    """재현에 필요한 이벤트 정보 (세션 로그 한 줄)"""
+    __slots__ = ("event_type", "timestamp", "content", "agent_name", "tool_name", "tool_calls", "usage")
+    _fields = __slots__
+
+    def __init__(self, event_type: EventType, timestamp: str, content: str,
+                 agent_name: Optional[str] = None,  # agent_response에만 사용
+                 tool_name: Optional[str] = None,   # tool_command, tool_output에만 사용
+                 tool_calls: Optional[List[Dict[str, Any]]] = None,  # AI 메시지의 tool calls 정보
+                 usage: Optional[Dict[str, int]] = None):  # AI 메시지의 토큰 사용량 (input_tokens, output_tokens)
+        self.event_type = event_type
+        self.timestamp = timestamp
+        self.content = content
+        self.agent_name = intern_name(agent_name)
+        self.tool_name = intern_name(tool_name)
+        self.tool_calls = tool_calls
+        self.usage = usage
+        self.extra = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {
+            "event_type": self.event_type.value,
+            "timestamp": self.timestamp,
+            "content": self.content
+        }
+        if self.agent_name:
+            result["agent_name"] = self.agent_name
+        if self.tool_name:
+            result["tool_name"] = self.tool_name
+        if self.tool_calls:
+            result["tool_calls"] = self.tool_calls
+        if self.usage:
+            result["usage"] = self.usage
+        return result
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Event':
+        return cls(
+            event_type=EventType(data["event_type"]),
+            timestamp=data["timestamp"],
+            content=data["content"],
+            agent_name=data.get("agent_name"),
+            tool_name=data.get("tool_name"),
+            tool_calls=data.get("tool_calls"),  # 기존 로그와 호환성을 위해 optional
+            usage=data.get("usage")
+        )
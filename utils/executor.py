@@ -11,11 +11,14 @@ from typing import Optional, Dict, Any, AsyncGenerator
 # CLI 모듈들을 직접 import
 from langchain_core.messages import HumanMessage
 from src.graphs.swarm import create_dynamic_swarm
+from src.utils.supervisor import RunStoppedError
+from src.utils.mcp.tool_memo import get_tool_memo
 from src.utils.llm.config_manager import (
     update_llm_config, 
     get_current_llm_config,
     get_current_llm
 )
+from src.utils.events import WorkflowEvent, intern_name
 from src.utils.message import (
     extract_message_content,
     get_message_type,
@@ -97,7 +100,7 @@ class Executor:
             self._swarm = None
             raise Exception(f"Swarm initialization failed: {str(e)}")
     
-    async def execute_workflow(self, user_input: str, config: Optional[Dict[str, Any]] = None) -> AsyncGenerator[Dict[str, Any], None]:
+    async def execute_workflow(self, user_input: str, config: Optional[Dict[str, Any]] = None) -> AsyncGenerator[WorkflowEvent, None]:
         """
         워크플로우 실행 
         """
@@ -110,6 +113,10 @@ class Executor:
         # 메시지 ID 추적 초기화
         self._processed_message_ids = set()
         
+        # 새 실행 - 도구 호출 메모 테이블 초기화
+        if execution_config:
+            get_tool_memo().start_run(execution_config["configurable"]["thread_id"])
+        
         inputs = {"messages": [HumanMessage(content=user_input)]}
 
         stream_result = None
@@ -142,41 +149,58 @@ class Executor:
                             
                             if should_display:
                                 # 프론트엔드에서 처리할 수 있는 형태로 이벤트 생성
-                                event_data = {
-                                    "type": "message",
-                                    "message_type": message_type,
-                                    "agent_name": agent_name,
-                                    "namespace": namespace,
-                                    "content": extract_message_content(latest_message),
-                                    "raw_message": latest_message,
-                                    "step_count": step_count,
-                                    "timestamp": datetime.now().isoformat()
-                                }
+                                event_data = WorkflowEvent(
+                                    type="message",
+                                    message_type=message_type,
+                                    agent_name=agent_name,
+                                    namespace=namespace,
+                                    content=extract_message_content(latest_message),
+                                    raw_message=latest_message,
+                                    step_count=step_count,
+                                    timestamp=datetime.now().isoformat()
+                                )
                                 
                                 # 툴 메시지인 경우 추가 정보
                                 if message_type == "tool":
                                     tool_name = getattr(latest_message, 'name', 'Unknown Tool')
-                                    event_data["tool_name"] = tool_name
-                                    event_data["tool_display_name"] = parse_tool_name(tool_name)
+                                    event_data.tool_name = intern_name(tool_name)
+                                    event_data.tool_display_name = intern_name(parse_tool_name(tool_name))
                                 
                                 yield event_data
             
             # 완료 신호
-            yield {
-                "type": "workflow_complete",
-                "step_count": step_count,
-                "timestamp": datetime.now().isoformat()
-            }
+            yield WorkflowEvent(
+                type="workflow_complete",
+                step_count=step_count,
+                timestamp=datetime.now().isoformat()
+            )
             
         except asyncio.CancelledError:
             raise
 
+        except RunStoppedError as e:
+            # 감독자가 루프/예산 초과로 조기 종료 - 에이전트 메시지로 알리고 정상 종료 처리
+            yield WorkflowEvent(
+                type="message",
+                message_type="ai",
+                agent_name=e.agent_name,
+                content=str(e),
+                step_count=step_count,
+                timestamp=datetime.now().isoformat()
+            )
+            yield WorkflowEvent(
+                type="workflow_complete",
+                step_count=step_count,
+                timestamp=datetime.now().isoformat(),
+                stopped_early=True,
+            )
+
         except Exception as e:
-            yield {
-                "type": "error",
-                "error": str(e),
-                "timestamp": datetime.now().isoformat()
-            }
+            yield WorkflowEvent(
+                type="error",
+                error=str(e),
+                timestamp=datetime.now().isoformat()
+            )
 
         finally:
             if stream_result is not None:
@@ -0,0 +1,63 @@
+"""
+에이전트 pre_model_hook 구성
+LLM 호출 직전에 실행 감독(루프/예산 감지)과 컨텍스트 윈도우 관리를 순서대로 적용
+"""
+
+from typing import Dict, Any, List, Optional
+
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import RunnableConfig, RunnableLambda
+
+from src.utils.context import get_context_manager, is_context_management_enabled
+from src.utils.supervisor import (
+    RunStoppedError,
+    build_corrective_message,
+    get_run_supervisor,
+    is_supervisor_enabled,
+)
+
+
+def get_thread_id(config: Optional[RunnableConfig]) -> str:
+    return str(((config or {}).get("configurable") or {}).get("thread_id", "default"))
+
+
+def _supervise(agent_name: str, messages: List[BaseMessage], thread_id: str) -> Optional[BaseMessage]:
+    """감독 점검 - 교정 메시지 반환, 종료 판정이면 RunStoppedError 발생"""
+    if not is_supervisor_enabled():
+        return None
+    verdict = get_run_supervisor().check(agent_name, messages, thread_id)
+    if verdict.action == "stop":
+        raise RunStoppedError(agent_name, verdict.reason)
+    if verdict.action == "correct":
+        return build_corrective_message(verdict)
+    return None
+
+
+def create_pre_model_hook(agent_name: str):
+    """create_react_agent(pre_model_hook=...)에 전달할 hook 생성
+
+    공유 state의 messages는 그대로 두고 llm_input_messages로만 LLM 입력을 조정
+    """
+    manager = get_context_manager(agent_name)
+
+    def pre_model_hook(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+        messages = state["messages"]
+        thread_id = get_thread_id(config)
+        correction = _supervise(agent_name, messages, thread_id)
+        if is_context_management_enabled():
+            messages = manager.prepare(messages, thread_id)
+        if correction is not None:
+            messages = list(messages) + [correction]
+        return {"llm_input_messages": messages}
+
+    async def apre_model_hook(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+        messages = state["messages"]
+        thread_id = get_thread_id(config)
+        correction = _supervise(agent_name, messages, thread_id)
+        if is_context_management_enabled():
+            messages = await manager.aprepare(messages, thread_id)
+        if correction is not None:
+            messages = list(messages) + [correction]
+        return {"llm_input_messages": messages}
+
+    return RunnableLambda(pre_model_hook, afunc=apre_model_hook, name=f"{agent_name}_pre_model_hook")
@@ -0,0 +1,168 @@
+"""
+LLM 호출 Record/Replay 카세트
+load_llm_model이 반환하는 모델에 langchain 캐시 레이어로 연결되어
+- record: 요청 fingerprint와 응답을 JSONL 카세트 파일에 저장 (실제 LLM 호출)
+- replay: 저장된 응답만 결정적으로 반환 (네트워크 호출 없음, 없으면 CassetteMissError)
+- auto: 카세트에 있으면 재생, 없으면 호출 후 기록
+
+LLM_CASSETTE_MODE=off|record|replay|auto, LLM_CASSETTE_PATH=cassettes/llm_cassette.jsonl
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence
+
+from langchain_core.caches import BaseCache
+from langchain_core.load import dumpd, load
+from langchain_core.outputs import Generation
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_MODES = ("off", "record", "replay", "auto")
+
+# 실행마다 달라져 fingerprint에서 제외하는 메시지 필드
+VOLATILE_MESSAGE_FIELDS = ("id", "response_metadata", "usage_metadata")
+
+
+class CassetteMissError(Exception):
+    """replay 모드에서 카세트에 없는 요청이 들어온 경우"""
+
+
+def _strip_volatile(value: Any) -> Any:
+    """직렬화된 메시지에서 실행마다 달라지는 필드 제거"""
+    if isinstance(value, list):
+        return [_strip_volatile(item) for item in value]
+    if isinstance(value, dict):
+        if value.get("type") == "constructor" and isinstance(value.get("kwargs"), dict):
+            kwargs = {
+                key: _strip_volatile(item)
+                for key, item in value["kwargs"].items()
+                if key not in VOLATILE_MESSAGE_FIELDS
+            }
+            return {**value, "kwargs": kwargs}
+        return {key: _strip_volatile(item) for key, item in value.items()}
+    return value
+
+
+def fingerprint(prompt: str, llm_string: str) -> str:
+    """요청 fingerprint (메시지 내용 + 모델/도구 설정)"""
+    try:
+        normalized = json.dumps(_strip_volatile(json.loads(prompt)), sort_keys=True, ensure_ascii=False)
+    except (TypeError, ValueError):
+        normalized = prompt
+    return hashlib.sha256(f"{llm_string}\n{normalized}".encode("utf-8")).hexdigest()
+
+
+class LLMCassette(BaseCache):
+    """JSONL 파일 기반 LLM 응답 카세트"""
+
+    def __init__(self, path: str, mode: str = "auto"):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode: {mode}. Available modes: {list(CASSETTE_MODES)}")
+        self.path = Path(path)
+        self.mode = mode
+        self._lock = threading.Lock()
+        # 동일 fingerprint가 여러 번 기록되면 기록 순서대로 재생
+        self._records: Dict[str, List[List[Dict[str, Any]]]] = {}
+        self._cursors: Dict[str, int] = {}
+        self.stats = {"hits": 0, "misses": 0, "recorded": 0}
+        if mode in ("replay", "auto"):
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    self._records.setdefault(record["key"], []).append(record["generations"])
+        except FileNotFoundError:
+            if self.mode == "replay":
+                logger.warning(f"Cassette file not found: {self.path}")
+        logger.info(f"Loaded {sum(len(v) for v in self._records.values())} cassette records from {self.path}")
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        if self.mode == "record":
+            return None
+        key = fingerprint(prompt, llm_string)
+        with self._lock:
+            recorded = self._records.get(key)
+            if not recorded:
+                self.stats["misses"] += 1
+                if self.mode == "replay":
+                    raise CassetteMissError(f"No recorded LLM response for request {key[:12]} in {self.path}")
+                return None
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = cursor + 1
+            self.stats["hits"] += 1
+            generations = recorded[min(cursor, len(recorded) - 1)]
+        return [load(generation) for generation in generations]
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        if self.mode not in ("record", "auto"):
+            return
+        key = fingerprint(prompt, llm_string)
+        generations = [dumpd(generation) for generation in return_val]
+        line = json.dumps({"key": key, "generations": generations}, ensure_ascii=False)
+        with self._lock:
+            self._records.setdefault(key, []).append(generations)
+            self._cursors[key] = len(self._records[key])
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self.stats["recorded"] += 1
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._records.clear()
+            self._cursors.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"mode": self.mode, "path": str(self.path), **self.stats}
+
+
+# 전역 인스턴스 (카세트 경로/모드별 1개)
+_cassettes: Dict[tuple, LLMCassette] = {}
+
+
+def get_cassette_mode() -> str:
+    return os.getenv("LLM_CASSETTE_MODE", "off").lower()
+
+
+def get_cassette() -> Optional[LLMCassette]:
+    """환경변수 설정에 따른 카세트 인스턴스 (off면 None)"""
+    mode = get_cassette_mode()
+    if mode == "off":
+        return None
+    path = os.getenv("LLM_CASSETTE_PATH", "cassettes/llm_cassette.jsonl")
+    if (path, mode) not in _cassettes:
+        _cassettes[(path, mode)] = LLMCassette(path, mode)
+    return _cassettes[(path, mode)]
+
+
+def apply_cassette(llm: Any) -> Any:
+    """모델에 카세트 캐시 연결 (off면 그대로 반환)"""
+    cassette = get_cassette()
+    if cassette is not None:
+        llm.cache = cassette
+    return llm
+
+
+def get_cassette_stats() -> Optional[Dict[str, Any]]:
+    cassette = get_cassette()
+    return cassette.get_stats() if cassette is not None else None
+
+
+__all__ = [
+    "CassetteMissError",
+    "LLMCassette",
+    "apply_cassette",
+    "fingerprint",
+    "get_cassette",
+    "get_cassette_stats",
+]
@@ -0,0 +1,264 @@
+"""
+임베딩 캐시 + 배치 처리
+메모리 스토어의 임베딩 모델을 감싸서
+- 텍스트 내용 해시(sha256)로 벡터를 디스크(SQLite)와 메모리 LRU에 캐시
+- 동시에 요청된 임베딩을 전용 워커 스레드의 이벤트 루프에서 모아 한 번의 요청으로 처리
+  (같은 텍스트가 처리 중이면 결과 공유)
+
+query/document 임베딩은 같은 벡터로 취급 (OpenAI 임베딩은 두 경로가 동일)
+
+환경변수:
+- EMBEDDING_CACHE: 캐시 사용 여부 (기본 true)
+- EMBEDDING_CACHE_PATH: 디스크 캐시 경로 (기본 cache/embeddings.sqlite)
+- EMBEDDING_CACHE_ITEMS: 메모리 LRU 크기 (기본 10000)
+- EMBEDDING_BATCH_SIZE: 요청당 최대 텍스트 수 (기본 64)
+- EMBEDDING_BATCH_WINDOW: 배치를 모으는 대기 시간 (초, 기본 0.02)
+"""
+
+import os
+import array
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+import concurrent.futures
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Coroutine, Dict, List, Optional, Sequence
+
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key TEXT PRIMARY KEY,
+    dims INTEGER NOT NULL,
+    vector BLOB NOT NULL
+);
+"""
+
+
+def is_embedding_cache_enabled() -> bool:
+    return os.getenv("EMBEDDING_CACHE", "true").lower() == "true"
+
+
+class EmbeddingWorker:
+    """임베딩 배치와 메모리 스토어 색인을 처리하는 전용 이벤트 루프 스레드
+
+    Streamlit은 요청마다 asyncio.run으로 루프를 새로 만들기 때문에
+    백그라운드 작업은 호출한 루프가 아닌 이 루프에서 실행
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name="embedding-worker", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def in_worker(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+
+_worker: Optional[EmbeddingWorker] = None
+_worker_lock = threading.Lock()
+
+
+def get_embedding_worker() -> EmbeddingWorker:
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = EmbeddingWorker()
+        return _worker
+
+
+class CachedEmbeddings(Embeddings):
+    """내용 해시 기반 캐시와 요청 배치를 적용한 임베딩 래퍼"""
+
+    def __init__(self, embeddings: Embeddings, model_key: str, path: Optional[str] = None,
+                 batch_size: Optional[int] = None, batch_window: Optional[float] = None,
+                 memory_items: Optional[int] = None):
+        self.embeddings = embeddings
+        self.model_key = model_key
+        self.batch_size = max(batch_size or int(os.getenv("EMBEDDING_BATCH_SIZE", "64")), 1)
+        self.batch_window = batch_window if batch_window is not None else float(
+            os.getenv("EMBEDDING_BATCH_WINDOW", "0.02")
+        )
+        self.memory_items = memory_items or int(os.getenv("EMBEDDING_CACHE_ITEMS", "10000"))
+
+        self.path = Path(path or os.getenv("EMBEDDING_CACHE_PATH", "cache/embeddings.sqlite"))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(CACHE_SCHEMA)
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+
+        # 워커 루프에서만 접근
+        self._queue: List[tuple] = []
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        self.stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "requests": 0,
+            "texts_embedded": 0,
+            "coalesced": 0,
+            "errors": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # 캐시
+    # ------------------------------------------------------------------
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_key}\0{text}".encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, vector: List[float]):
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def _lookup(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            missing = []
+            for key in keys:
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[key] = self._memory[key]
+                    self.stats["memory_hits"] += 1
+                else:
+                    missing.append(key)
+            for start in range(0, len(missing), 500):
+                chunk = missing[start:start + 500]
+                rows = self.conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                for key, blob in rows:
+                    vector = array.array("f", blob).tolist()
+                    self._remember(key, vector)
+                    found[key] = vector
+                    self.stats["disk_hits"] += 1
+            self.stats["misses"] += len(set(keys) - set(found))
+        return found
+
+    def _save(self, vectors: Dict[str, List[float]]):
+        with self._lock:
+            for key, vector in vectors.items():
+                self._remember(key, vector)
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, dims, vector) VALUES (?, ?, ?)",
+                [(key, len(vector), array.array("f", vector).tobytes()) for key, vector in vectors.items()],
+            )
+            self.conn.commit()
+
+    # ------------------------------------------------------------------
+    # 동기 경로 (캐시 후 직접 호출)
+    # ------------------------------------------------------------------
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._key(text) for text in texts]
+        found = self._lookup(keys)
+        missing = {key: text for key, text in zip(keys, texts) if key not in found}
+        if missing:
+            items = list(missing.items())
+            for start in range(0, len(items), self.batch_size):
+                chunk = items[start:start + self.batch_size]
+                self.stats["requests"] += 1
+                vectors = self.embeddings.embed_documents([text for _, text in chunk])
+                embedded = {key: list(vector) for (key, _), vector in zip(chunk, vectors)}
+                self.stats["texts_embedded"] += len(embedded)
+                self._save(embedded)
+                found.update(embedded)
+        return [found[key] for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    # ------------------------------------------------------------------
+    # 비동기 경로 (워커 루프에서 배치)
+    # ------------------------------------------------------------------
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._key(text) for text in texts]
+        found = self._lookup(keys)
+        missing = {key: text for key, text in zip(keys, texts) if key not in found}
+        if missing:
+            worker = get_embedding_worker()
+            if worker.in_worker():
+                found.update(await self._batched(missing))
+            else:
+                found.update(await asyncio.wrap_future(worker.submit(self._batched(missing))))
+        return [found[key] for key in keys]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return (await self.aembed_documents([text]))[0]
+
+    async def _batched(self, missing: Dict[str, str]) -> Dict[str, List[float]]:
+        """워커 루프에서 실행 - 대기열에 넣고 배치 결과를 기다림"""
+        loop = asyncio.get_running_loop()
+        futures = {}
+        for key, text in missing.items():
+            future = self._inflight.get(key)
+            if future is None:
+                future = loop.create_future()
+                self._inflight[key] = future
+                self._queue.append((key, text))
+            else:
+                self.stats["coalesced"] += 1
+            futures[key] = future
+
+        if len(self._queue) >= self.batch_size:
+            self._flush_queue()
+        elif self._queue and self._timer is None:
+            self._timer = loop.call_later(self.batch_window, self._flush_queue)
+
+        vectors = await asyncio.gather(*futures.values())
+        return dict(zip(futures.keys(), vectors))
+
+    def _flush_queue(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        queue, self._queue = self._queue, []
+        for start in range(0, len(queue), self.batch_size):
+            asyncio.get_running_loop().create_task(self._embed_batch(queue[start:start + self.batch_size]))
+
+    async def _embed_batch(self, batch: List[tuple]):
+        try:
+            self.stats["requests"] += 1
+            vectors = await self.embeddings.aembed_documents([text for _, text in batch])
+            embedded = {key: list(vector) for (key, _), vector in zip(batch, vectors)}
+            self.stats["texts_embedded"] += len(embedded)
+            self._save(embedded)
+            for key, vector in embedded.items():
+                future = self._inflight.pop(key)
+                if not future.done():
+                    future.set_result(vector)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Embedding batch of {len(batch)} failed: {e}")
+            for key, _ in batch:
+                future = self._inflight.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            cached = self.conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        lookups = self.stats["memory_hits"] + self.stats["disk_hits"] + self.stats["misses"]
+        return {
+            "model": self.model_key,
+            "cached_vectors": cached,
+            "hit_rate": (self.stats["memory_hits"] + self.stats["disk_hits"]) / lookups if lookups else 0.0,
+            "mean_batch_size": self.stats["texts_embedded"] / self.stats["requests"] if self.stats["requests"] else 0.0,
+            **self.stats,
+        }
@@ -0,0 +1,160 @@
+"""
+결정적 스크립트 기반 Fake Chat Model - 네트워크 없이 전체 swarm을 벤치마크하기 위한 provider
+바인딩된 도구 목록을 보고 도구 호출과 transfer_to_* handoff를 정해진 순서로 생성하며
+지연 시간과 출력 토큰 수를 설정할 수 있음
+
+환경변수:
+- FAKE_LLM_SCRIPT: 스크립트 JSON 파일 ([{"content": "...", "tool_calls": [{"name": "nmap", "args": {...}}]}, ...])
+- FAKE_LLM_STEPS: 스크립트가 없을 때 실행당 LLM 스텝 수 (기본 12)
+- FAKE_LLM_HANDOFF_EVERY: 몇 스텝마다 handoff 할지 (기본 4)
+- FAKE_LLM_LATENCY: 호출당 지연 (초, 기본 0)
+- FAKE_LLM_OUTPUT_TOKENS: 응답 본문 토큰 수 (기본 32)
+- FAKE_LLM_TARGET: 생성되는 도구 인자의 기본 대상 (기본 127.0.0.1)
+"""
+
+import os
+import json
+import time
+import asyncio
+from typing import Dict, Any, List, Optional, Sequence
+
+from pydantic import Field
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.messages.utils import count_tokens_approximately
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from src.utils.context import SUMMARY_PREFIX
+from src.utils.supervisor import SUPERVISOR_PREFIX
+
+# 스크립트 생성 시 호출하지 않는 도구 (메모리/병렬 분배)
+EXCLUDED_TOOLS = ("manage_memory", "search_memory", "dispatch_parallel_tasks")
+
+# JSON schema 타입별 기본 인자 값
+_DEFAULT_ARG_VALUES = {"integer": 1, "number": 1, "boolean": False, "array": [], "object": {}}
+
+
+def _current_run(messages: Sequence[BaseMessage]) -> Sequence[BaseMessage]:
+    """마지막 사용자 입력 이후 메시지 (프레임워크가 주입한 요약/감독 메시지는 제외)"""
+    for index in range(len(messages) - 1, -1, -1):
+        message = messages[index]
+        if isinstance(message, HumanMessage):
+            text = message.content if isinstance(message.content, str) else ""
+            if not text.startswith((SUMMARY_PREFIX, SUPERVISOR_PREFIX)):
+                return messages[index:]
+    return messages
+
+
+class ScriptedChatModel(BaseChatModel):
+    """도구 호출과 handoff를 결정적으로 생성하는 오프라인 Chat Model"""
+
+    model_name: str = "scripted-engagement"
+    script: List[Dict[str, Any]] = Field(default_factory=list)
+    steps_per_run: int = 12
+    handoff_every: int = 4
+    latency: float = 0.0
+    output_tokens: int = 32
+    target: str = "127.0.0.1"
+
+    @classmethod
+    def from_env(cls, model_name: str = "scripted-engagement") -> "ScriptedChatModel":
+        script: List[Dict[str, Any]] = []
+        script_path = os.getenv("FAKE_LLM_SCRIPT")
+        if script_path:
+            with open(script_path, "r", encoding="utf-8") as f:
+                script = json.load(f)
+        return cls(
+            model_name=model_name,
+            script=script,
+            steps_per_run=int(os.getenv("FAKE_LLM_STEPS", "12")),
+            handoff_every=int(os.getenv("FAKE_LLM_HANDOFF_EVERY", "4")),
+            latency=float(os.getenv("FAKE_LLM_LATENCY", "0")),
+            output_tokens=int(os.getenv("FAKE_LLM_OUTPUT_TOKENS", "32")),
+            target=os.getenv("FAKE_LLM_TARGET", "127.0.0.1"),
+        )
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-fake"
+
+    def bind_tools(self, tools: Sequence[Any], *, tool_choice: Optional[str] = None, **kwargs: Any):
+        return self.bind(tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs)
+
+    # ------------------------------------------------------------------
+    # 응답 생성
+    # ------------------------------------------------------------------
+    def _filler(self, step: int) -> str:
+        words = ["observed", "service", "port", "banner", "version", "host", "result", "next"]
+        body = " ".join(words[i % len(words)] for i in range(max(self.output_tokens - 3, 0)))
+        return f"Step {step}: {body}".strip()
+
+    def _default_args(self, tool: Dict[str, Any]) -> Dict[str, Any]:
+        parameters = tool.get("function", {}).get("parameters", {})
+        properties = parameters.get("properties", {})
+        args = {}
+        for name in parameters.get("required", []):
+            schema = properties.get(name, {})
+            args[name] = _DEFAULT_ARG_VALUES.get(schema.get("type"), self.target)
+        return args
+
+    def _scripted_calls(self, step: int, tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """스크립트가 없을 때 바인딩된 도구로 호출 순서 생성"""
+        names = {tool["function"]["name"]: tool for tool in tools}
+        handoffs = sorted(name for name in names if name.startswith("transfer_to_"))
+        work_tools = sorted(
+            name for name in names
+            if not name.startswith("transfer_to_") and name not in EXCLUDED_TOOLS
+        )
+        handoff_turn = handoffs and (step + 1) % max(self.handoff_every, 1) == 0
+        if handoff_turn or (handoffs and not work_tools):
+            name = handoffs[(step // max(self.handoff_every, 1)) % len(handoffs)]
+            return [{"name": name, "args": {}}]
+        if work_tools:
+            name = work_tools[step % len(work_tools)]
+            return [{"name": name, "args": self._default_args(names[name])}]
+        return []
+
+    def _next_message(self, messages: List[BaseMessage], tools: List[Dict[str, Any]]) -> AIMessage:
+        step = sum(1 for message in _current_run(messages) if isinstance(message, AIMessage))
+
+        if self.script:
+            entry = self.script[step] if step < len(self.script) else {"content": "Engagement complete."}
+            content = entry.get("content", "")
+            calls = entry.get("tool_calls", []) if step < len(self.script) else []
+        elif step < self.steps_per_run and tools:
+            content = self._filler(step)
+            calls = self._scripted_calls(step, tools)
+        else:
+            content = f"Engagement complete after {step} steps. {self._filler(step)}"
+            calls = []
+
+        input_tokens = count_tokens_approximately(messages)
+        return AIMessage(
+            content=content,
+            tool_calls=[
+                {"name": call["name"], "args": call.get("args", {}), "id": f"call_{step}_{index}", "type": "tool_call"}
+                for index, call in enumerate(calls)
+            ],
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": self.output_tokens,
+                "total_tokens": input_tokens + self.output_tokens,
+            },
+            response_metadata={"model_name": self.model_name},
+        )
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        if self.latency:
+            time.sleep(self.latency)
+        message = self._next_message(messages, kwargs.get("tools") or [])
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        message = self._next_message(messages, kwargs.get("tools") or [])
+        return ChatResult(generations=[ChatGeneration(message=message)])
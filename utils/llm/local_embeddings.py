@@ -0,0 +1,97 @@
+"""
+로컬 임베딩 백엔드 - GPU/네트워크 없이 메모리 검색을 사용하기 위한 hashed n-gram 벡터
+단어 unigram/bigram과 문자 n-gram을 crc32로 고정 차원에 해싱(부호 해싱)하고
+sublinear TF(1 + log tf) 후 L2 정규화 - 배치 전체를 NumPy로 한 번에 계산
+
+crc32를 사용하므로 프로세스가 바뀌어도 같은 텍스트는 같은 벡터 (PYTHONHASHSEED 영향 없음)
+
+환경변수:
+- EMBEDDING_BACKEND: openrouter / local / auto (기본 auto: OPENROUTER_API_KEY가 없으면 local)
+- LOCAL_EMBEDDING_DIMS: 벡터 차원 (기본 512)
+- LOCAL_EMBEDDING_NGRAMS: 문자 n-gram 범위 (기본 "3,5")
+"""
+
+import os
+import re
+import zlib
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+EMBEDDING_BACKENDS = ("openrouter", "local", "auto")
+
+_TOKEN_PATTERN = re.compile(r"[\w.:/-]+", re.UNICODE)
+
+
+def get_embedding_backend(has_api_key: bool) -> str:
+    """설정된 임베딩 백엔드 ("openrouter" 또는 "local")"""
+    backend = os.getenv("EMBEDDING_BACKEND", "auto").lower()
+    if backend not in EMBEDDING_BACKENDS:
+        backend = "auto"
+    if backend == "auto":
+        return "openrouter" if has_api_key else "local"
+    return backend
+
+
+class HashedNgramEmbeddings(Embeddings):
+    """단어/문자 n-gram 해싱 기반 로컬 임베딩"""
+
+    def __init__(self, dims: Optional[int] = None, ngram_range: Optional[Tuple[int, int]] = None):
+        self.dims = dims or int(os.getenv("LOCAL_EMBEDDING_DIMS", "512"))
+        if ngram_range is None:
+            low, _, high = os.getenv("LOCAL_EMBEDDING_NGRAMS", "3,5").partition(",")
+            ngram_range = (int(low), int(high or low))
+        self.ngram_range = ngram_range
+
+    @property
+    def model_key(self) -> str:
+        return f"local:hashed-ngram:{self.dims}:{self.ngram_range[0]}-{self.ngram_range[1]}"
+
+    def _features(self, text: str) -> Iterator[str]:
+        """텍스트의 특징 (단어, 단어 bigram, 단어 경계를 포함한 문자 n-gram)"""
+        words = _TOKEN_PATTERN.findall(text.lower())
+        low, high = self.ngram_range
+        for index, word in enumerate(words):
+            yield f"w:{word}"
+            if index:
+                yield f"b:{words[index - 1]} {word}"
+            padded = f" {word} "
+            for n in range(low, high + 1):
+                for start in range(max(len(padded) - n + 1, 1)):
+                    yield f"c:{padded[start:start + n]}"
+
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        rows: List[int] = []
+        hashes: List[int] = []
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                rows.append(row)
+                hashes.append(zlib.crc32(feature.encode("utf-8")))
+
+        matrix = np.zeros((len(texts), self.dims), dtype=np.float32)
+        if hashes:
+            hashed = np.asarray(hashes, dtype=np.uint32)
+            row_index = np.asarray(rows, dtype=np.int64)
+            columns = (hashed % self.dims).astype(np.int64)
+            # 최상위 비트로 부호를 정해 해시 충돌의 편향을 상쇄
+            signs = np.where(hashed >> 31, -1.0, 1.0).astype(np.float32)
+            np.add.at(matrix, (row_index, columns), signs)
+
+        np.copysign(np.log1p(np.abs(matrix)), matrix, out=matrix)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._embed(texts).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed([text])[0].tolist()
+
+    # CPU 연산이 짧으므로 executor로 넘기지 않고 바로 계산
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embed_documents(texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return self.embed_query(text)
@@ -4,12 +4,14 @@ LLM 모델 로더 - 3개 provider 지원 (OpenAI, Anthropic, Ollama)
 
 import json
 import os
-import requests
 from enum import Enum
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from pathlib import Path
 
+from .registry import get_model_registry
+from .cassette import apply_cassette
+
 
 class ModelProvider(str, Enum):
     """지원하는 LLM Provider (3개 + OpenRouter 주석처리)"""
@@ -18,6 +20,7 @@ class ModelProvider(str, Enum):
     OPENROUTER = "openrouter"
     GEMINI = "gemini"
     OLLAMA = "ollama"
+    FAKE = "fake"
 
 
 @dataclass
@@ -27,6 +30,8 @@ class ModelInfo:
     model_name: str
     provider: ModelProvider
     api_key_available: bool = False
+    context_window: Optional[int] = None
+    supports_tools: Optional[bool] = None
 
 
 def load_cloud_models() -> List[ModelInfo]:
@@ -87,33 +92,31 @@ def get_ollama_models_with_mappings() -> List[ModelInfo]:
     # 설정 파일에서 매핑 로드
     display_name_mappings = load_local_model_mappings()
     
-    try:
-        response = requests.get("http://localhost:11434/api/tags", timeout=3)
-        if response.status_code == 200:
-            models_data = response.json().get("models", [])
-            models = []
-            
-            for model in models_data:
-                model_name = model["name"]
-                
-                # 설정 파일에 매핑이 있으면 사용, 없으면 기본 형태
-                if model_name in display_name_mappings:
-                    display_name = display_name_mappings[model_name]
-                else:
-                    display_name = f"{model_name} (Installed)"
-                
-                models.append(ModelInfo(
-                    display_name=display_name,
-                    model_name=model_name,
-                    provider=ModelProvider.OLLAMA,
-                    api_key_available=True
-                ))
-            
-            return models
-    except requests.RequestException:
-        pass
+    # 레지스트리 캐시에서 조회 (네트워크 호출 없음)
+    registry = get_model_registry()
+    status = registry.ollama_status()
+    if not status["connected"]:
+        return []
+    
+    models = []
+    for model_name in status["models"]:
+        # 설정 파일에 매핑이 있으면 사용, 없으면 기본 형태
+        if model_name in display_name_mappings:
+            display_name = display_name_mappings[model_name]
+        else:
+            display_name = f"{model_name} (Installed)"
+        
+        capability = registry.get_capability(ModelProvider.OLLAMA.value, model_name)
+        models.append(ModelInfo(
+            display_name=display_name,
+            model_name=model_name,
+            provider=ModelProvider.OLLAMA,
+            api_key_available=True,
+            context_window=capability.context_window,
+            supports_tools=capability.supports_tools
+        ))
     
-    return []
+    return models
 
 
 def get_openrouter_models() -> List[ModelInfo]:
@@ -141,6 +144,23 @@ def get_openrouter_models() -> List[ModelInfo]:
     ]
 
 
+def get_fake_models() -> List[ModelInfo]:
+    """오프라인 벤치마크용 스크립트 모델 (FAKE_LLM=true 일 때만)"""
+    if not validate_api_key(ModelProvider.FAKE):
+        return []
+    
+    return [
+        ModelInfo(
+            display_name="Scripted Engagement (Offline)",
+            model_name="scripted-engagement",
+            provider=ModelProvider.FAKE,
+            api_key_available=True,
+            context_window=200000,
+            supports_tools=True
+        )
+    ]
+
+
 def validate_api_key(provider: ModelProvider) -> bool:
     """API 키 검증"""
     key_map = {
@@ -151,12 +171,11 @@ def validate_api_key(provider: ModelProvider) -> bool:
     }
     
     if provider == ModelProvider.OLLAMA:
-        # Ollama 연결 확인
-        try:
-            response = requests.get("http://localhost:11434/api/tags", timeout=3)
-            return response.status_code == 200
-        except requests.RequestException:
-            return False
+        # Ollama 연결 확인 (레지스트리 캐시)
+        return get_model_registry().ollama_status()["connected"]
+    
+    if provider == ModelProvider.FAKE:
+        return os.getenv("FAKE_LLM", "false").lower() == "true"
     
     required_key = key_map.get(provider)
     if not required_key:
@@ -177,40 +196,36 @@ def validate_api_key(provider: ModelProvider) -> bool:
     return True
 
 
+def _cold_wait() -> float:
+    """콜드 스타트 시 첫 모델 discovery를 기다리는 최대 시간 (초)"""
+    return float(os.getenv("MODEL_REGISTRY_COLD_WAIT", "3"))
+
+
 def check_ollama_connection() -> Dict[str, Any]:
-    """Ollama 연결 상태 확인 (기존 코드와 호환성 유지)"""
-    try:
-        response = requests.get("http://localhost:11434/api/tags", timeout=3)
-        if response.status_code == 200:
-            models = response.json().get("models", [])
-            return {
-                "connected": True,
-                "url": "http://localhost:11434",
-                "models": [model.get("name", "") for model in models],
-                "count": len(models)
-            }
-        else:
-            return {
-                "connected": False,
-                "url": "http://localhost:11434",
-                "error": f"HTTP {response.status_code}",
-                "models": [],
-                "count": 0
-            }
-    except requests.RequestException as e:
-        return {
-            "connected": False,
-            "url": "http://localhost:11434",
-            "error": str(e),
-            "models": [],
-            "count": 0
-        }
+    """Ollama 연결 상태 확인 (기존 코드와 호환성 유지) - 레지스트리 캐시 사용"""
+    registry = get_model_registry()
+    # 디스크 캐시가 없는 최초 실행 시에는 기본값(미연결) 대신 첫 discovery 결과를 잠시 기다림
+    registry.ensure_loaded(timeout=_cold_wait())
+    status = registry.ollama_status()
+    result = {
+        "connected": status["connected"],
+        "url": status["url"],
+        "models": status["models"],
+        "count": status["count"]
+    }
+    if not status["connected"]:
+        result["error"] = status.get("error") or "Ollama not reachable"
+    return result
 
 
 def list_available_models() -> List[Dict[str, Any]]:
     """사용 가능한 모든 모델 목록 (CLI에서 사용) - 중복 제거 간소화"""
     all_models = []
     
+    # 디스크 캐시가 없는 최초 실행 시에만 첫 discovery를 잠시 기다림
+    registry = get_model_registry()
+    registry.ensure_loaded(timeout=_cold_wait())
+    
     # 클라우드 모델들 (OpenAI/Anthropic)
     all_models.extend(load_cloud_models())
     
@@ -220,19 +235,36 @@ def list_available_models() -> List[Dict[str, Any]]:
     # OpenRouter 모델들
     all_models.extend(get_openrouter_models())
     
-    return [
-        {
+    # 오프라인 스크립트 모델
+    all_models.extend(get_fake_models())
+    
+    models = []
+    for model in all_models:
+        if model.context_window is None or model.supports_tools is None:
+            capability = registry.get_capability(model.provider.value, model.model_name)
+            model.context_window = model.context_window or capability.context_window
+            if model.supports_tools is None:
+                model.supports_tools = capability.supports_tools
+        
+        models.append({
             "display_name": model.display_name,
             "model_name": model.model_name,
             "provider": model.provider.value,
-            "api_key_available": model.api_key_available
-        }
-        for model in all_models
-    ]
+            "api_key_available": model.api_key_available,
+            "context_window": model.context_window,
+            "supports_tools": model.supports_tools
+        })
+    
+    return models
 
 
 def load_llm_model(model_name: str, provider: str, temperature: float = 0.0):
-    """실제 LLM 모델 로드 - 각 provider별로 직접 Chat 클래스 사용"""
+    """실제 LLM 모델 로드 - LLM_CASSETTE_MODE가 설정되면 record/replay 카세트 연결"""
+    return apply_cassette(_create_llm_model(model_name, provider, temperature))
+
+
+def _create_llm_model(model_name: str, provider: str, temperature: float = 0.0):
+    """provider별로 직접 Chat 클래스 사용"""
     try:
         provider_enum = ModelProvider(provider)
     except ValueError:
@@ -254,12 +286,10 @@ def load_llm_model(model_name: str, provider: str, temperature: float = 0.0):
         )
 
     elif provider_enum == ModelProvider.GEMINI:
-        import google.generativeai as genai
-        print("\n--- AVAILABLE GEMINI MODELS ---")
-        for m in genai.list_models():
-            if 'generateContent' in m.supported_generation_methods:
-                print(m.name)
-        print("-----------------------------\n")
+        # 모델 목록은 레지스트리가 백그라운드에서 조회 (생성 시 네트워크 호출 없음)
+        capability = get_model_registry().get_capability(provider_enum.value, model_name)
+        if not capability.available:
+            print(f"Warning: Gemini model '{model_name}' was not found in the cached model list")
 
         from langchain_google_genai import ChatGoogleGenerativeAI
         return ChatGoogleGenerativeAI(
@@ -274,6 +304,10 @@ def load_llm_model(model_name: str, provider: str, temperature: float = 0.0):
             temperature=0
         )
     
+    elif provider_enum == ModelProvider.FAKE:
+        from .fake import ScriptedChatModel
+        return ScriptedChatModel.from_env(model_name)
+    
     elif provider_enum == ModelProvider.OPENROUTER:
         from langchain_openai import ChatOpenAI
         return ChatOpenAI(
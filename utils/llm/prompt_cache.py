@@ -0,0 +1,146 @@
+"""
+Provider prompt caching - 에이전트의 고정 prefix(도구 정의 + 시스템 프롬프트)를 캐시 대상으로 표시하고
+응답의 usage_metadata에서 캐시 hit/miss 토큰을 집계
+
+- Anthropic (및 OpenRouter의 anthropic/* 모델): 시스템 프롬프트 블록에 cache_control 지정
+  (Anthropic은 tools → system 순으로 prefix를 구성하므로 도구 정의도 함께 캐시됨)
+- OpenAI / Gemini: provider가 자동으로 prefix 캐싱 - 표시 없이 통계만 집계
+"""
+
+import logging
+import threading
+from typing import Dict, Any, Optional, Union
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import SystemMessage
+from langchain_core.outputs import LLMResult
+
+logger = logging.getLogger(__name__)
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def _get_model_name(llm: Any) -> str:
+    for attr in ("model", "model_name"):
+        value = getattr(llm, attr, None)
+        if isinstance(value, str) and value:
+            return value
+    return type(llm).__name__
+
+
+def supports_explicit_cache_control(llm: Any) -> bool:
+    """cache_control 블록 표시가 필요한(지원하는) 모델인지 확인"""
+    class_name = type(llm).__name__
+    if class_name == "ChatAnthropic":
+        return True
+    if class_name == "ChatOpenAI":
+        # OpenRouter를 통한 Anthropic 모델은 cache_control을 그대로 전달
+        base_url = str(getattr(llm, "openai_api_base", "") or "")
+        return "openrouter.ai" in base_url and _get_model_name(llm).startswith("anthropic/")
+    return False
+
+
+class PromptCacheStats(BaseCallbackHandler):
+    """LLM 응답의 usage_metadata에서 모델별 캐시 토큰 집계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                usage = getattr(message, "usage_metadata", None)
+                if usage:
+                    metadata = getattr(message, "response_metadata", None) or {}
+                    self.record(metadata.get("model_name") or metadata.get("model", "unknown"), usage)
+
+    def record(self, model_name: str, usage: Dict[str, Any]):
+        """usage_metadata 한 건 집계"""
+        details = usage.get("input_token_details") or {}
+        cache_read = details.get("cache_read") or 0
+        cache_creation = details.get("cache_creation") or 0
+        input_tokens = usage.get("input_tokens") or 0
+        with self._lock:
+            stats = self._stats.setdefault(model_name, {
+                "calls": 0,
+                "input_tokens": 0,
+                "cache_read_tokens": 0,
+                "cache_creation_tokens": 0,
+                "cache_hits": 0,
+            })
+            stats["calls"] += 1
+            stats["input_tokens"] += input_tokens
+            stats["cache_read_tokens"] += cache_read
+            stats["cache_creation_tokens"] += cache_creation
+            if cache_read:
+                stats["cache_hits"] += 1
+        logger.debug(
+            f"[{model_name}] input={input_tokens} cache_read={cache_read} cache_creation={cache_creation}"
+        )
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """모델별 통계 (uncached = 캐시에서 읽지 못한 입력 토큰)"""
+        with self._lock:
+            result = {}
+            for model_name, stats in self._stats.items():
+                entry = dict(stats)
+                entry["uncached_input_tokens"] = stats["input_tokens"] - stats["cache_read_tokens"]
+                entry["hit_rate"] = (
+                    stats["cache_read_tokens"] / stats["input_tokens"] if stats["input_tokens"] else 0.0
+                )
+                result[model_name] = entry
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+# 전역 인스턴스 (싱글톤)
+_prompt_cache_stats: Optional[PromptCacheStats] = None
+
+
+def get_prompt_cache_stats() -> PromptCacheStats:
+    """전역 프롬프트 캐시 통계 핸들러 반환"""
+    global _prompt_cache_stats
+    if _prompt_cache_stats is None:
+        _prompt_cache_stats = PromptCacheStats()
+    return _prompt_cache_stats
+
+
+def attach_cache_tracking(llm: Any) -> Any:
+    """모델에 캐시 통계 콜백 연결 (중복 연결 방지)"""
+    handler = get_prompt_cache_stats()
+    callbacks = getattr(llm, "callbacks", None)
+    if callbacks is None:
+        llm.callbacks = [handler]
+    elif isinstance(callbacks, list):
+        if handler not in callbacks:
+            callbacks.append(handler)
+    else:
+        # CallbackManager가 지정된 경우
+        callbacks.add_handler(handler, inherit=False)
+    return llm
+
+
+def build_cached_prompt(llm: Any, prompt: str) -> Union[SystemMessage, str]:
+    """create_react_agent(prompt=...)에 전달할 시스템 프롬프트 생성
+
+    명시적 캐시 표시를 지원하는 모델이면 cache_control 블록이 붙은 SystemMessage를,
+    그 외에는 원래 문자열을 그대로 반환
+    """
+    attach_cache_tracking(llm)
+    if not supports_explicit_cache_control(llm):
+        return prompt
+    return SystemMessage(content=[{"type": "text", "text": prompt, "cache_control": CACHE_CONTROL}])
+
+
+__all__ = [
+    "PromptCacheStats",
+    "attach_cache_tracking",
+    "build_cached_prompt",
+    "get_prompt_cache_stats",
+    "supports_explicit_cache_control",
+]
@@ -0,0 +1,334 @@
+"""
+모델 레지스트리 - 모델 가용성, 컨텍스트 윈도우, 도구 호출 지원 여부를 프로세스 전역으로 관리
+디스크에 캐시하고 TTL이 지나면 백그라운드에서 갱신하여
+모델 선택과 LLM 생성이 네트워크 조회(Ollama /api/tags, genai.list_models)에 막히지 않도록 함
+"""
+
+import json
+import os
+import threading
+import concurrent.futures
+import time
+import logging
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+OLLAMA_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+
+# 클라우드 모델 기본 컨텍스트 윈도우 (model_name prefix 기준, 긴 prefix 우선)
+KNOWN_CONTEXT_WINDOWS = {
+    "claude-": 200000,
+    "gpt-4o": 128000,
+    "gpt-4.1": 1047576,
+    "o4-mini": 200000,
+    "o3-mini": 200000,
+    "o1-mini": 128000,
+    "gemini-": 1048576,
+}
+
+# 도구 호출을 지원하지 않는 것으로 알려진 모델 prefix
+NO_TOOL_SUPPORT_PREFIXES = ("o1-mini",)
+
+
+@dataclass
+class ModelCapability:
+    """모델 능력 정보"""
+    model_name: str
+    provider: str
+    available: bool = True
+    context_window: Optional[int] = None
+    supports_tools: Optional[bool] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.provider}:{self.model_name}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ModelCapability':
+        return cls(
+            model_name=data["model_name"],
+            provider=data["provider"],
+            available=data.get("available", True),
+            context_window=data.get("context_window"),
+            supports_tools=data.get("supports_tools")
+        )
+
+
+def _lookup_known_context_window(model_name: str) -> Optional[int]:
+    """prefix 테이블에서 컨텍스트 윈도우 조회"""
+    for prefix in sorted(KNOWN_CONTEXT_WINDOWS, key=len, reverse=True):
+        if model_name.startswith(prefix):
+            return KNOWN_CONTEXT_WINDOWS[prefix]
+    return None
+
+
+class ModelRegistry:
+    """디스크 캐시 + TTL 백그라운드 갱신 모델 레지스트리"""
+
+    def __init__(self, cache_path: Optional[str] = None, ttl: Optional[float] = None):
+        self.cache_path = Path(cache_path or os.getenv("MODEL_REGISTRY_PATH", "cache/model_registry.json"))
+        self.ttl = ttl if ttl is not None else float(os.getenv("MODEL_REGISTRY_TTL", "600"))
+        self._lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._loaded = threading.Event()
+        self._updated_at: float = 0.0
+        self._ollama: Dict[str, Any] = {"connected": False, "url": OLLAMA_URL, "error": "not checked", "models": []}
+        self._models: Dict[str, ModelCapability] = {}
+        self._load_from_disk()
+
+    # ------------------------------------------------------------------
+    # 디스크 캐시
+    # ------------------------------------------------------------------
+    def _load_from_disk(self):
+        """디스크 캐시 로드 (TTL이 지났어도 일단 사용하고 백그라운드 갱신)"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._updated_at = float(data.get("updated_at", 0))
+            self._ollama = data.get("ollama", self._ollama)
+            self._models = {
+                key: ModelCapability.from_dict(value)
+                for key, value in data.get("models", {}).items()
+            }
+            self._loaded.set()
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+            pass
+
+    def _save_to_disk(self):
+        """원자적 저장 (임시 파일 작성 후 교체)"""
+        data = {
+            "updated_at": self._updated_at,
+            "ollama": self._ollama,
+            "models": {key: cap.to_dict() for key, cap in self._models.items()}
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.debug(f"Failed to persist model registry: {e}")
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def is_stale(self) -> bool:
+        return time.time() - self._updated_at > self.ttl
+
+    def refresh(self, blocking: bool = False) -> None:
+        """레지스트리 갱신 - 기본은 백그라운드 스레드에서 실행"""
+        with self._lock:
+            running = self._refresh_thread is not None and self._refresh_thread.is_alive()
+            if not running:
+                self._refresh_thread = threading.Thread(
+                    target=self._refresh_now, name="model-registry-refresh", daemon=True
+                )
+                self._refresh_thread.start()
+            thread = self._refresh_thread
+        if blocking and thread is not None:
+            thread.join()
+
+    def _refresh_if_stale(self):
+        if self.is_stale():
+            self.refresh(blocking=False)
+
+    def ensure_loaded(self, timeout: float = 3.0) -> bool:
+        """콜드 스타트(디스크 캐시 없음)일 때만 제한 시간 동안 첫 갱신을 기다림"""
+        if self._loaded.is_set():
+            self._refresh_if_stale()
+            return True
+        self.refresh(blocking=False)
+        return self._loaded.wait(timeout)
+
+    def _refresh_now(self):
+        """실제 discovery 수행 (백그라운드 스레드) - 실패해도 기다리는 호출자가 풀려나도록 _loaded는 항상 set"""
+        try:
+            models: Dict[str, ModelCapability] = {}
+            ollama = self._discover_ollama(models)
+            if not self._loaded.is_set():
+                # 콜드 스타트: 설치된 모델 목록을 먼저 공개하고 컨텍스트 길이/도구 지원은 이어서 채움
+                self._publish(models, ollama)
+                self._loaded.set()
+            self._describe_ollama_models([cap for cap in models.values() if cap.provider == "ollama"])
+            self._discover_gemini(models)
+            self._publish(models, ollama)
+        finally:
+            self._loaded.set()
+
+    def _publish(self, models: Dict[str, ModelCapability], ollama: Dict[str, Any]):
+        """조회 결과를 레지스트리에 반영하고 디스크에 저장"""
+        with self._lock:
+            # 이번 갱신에서 조회하지 못한 provider의 기존 항목은 유지
+            refreshed_providers = {cap.provider for cap in models.values()}
+            if ollama["connected"]:
+                refreshed_providers.add("ollama")
+            merged = {
+                key: cap for key, cap in self._models.items()
+                if cap.provider not in refreshed_providers
+            }
+            merged.update(models)
+            self._models = merged
+            self._ollama = ollama
+            self._updated_at = time.time()
+            self._save_to_disk()
+
+    def _discover_ollama(self, models: Dict[str, ModelCapability]) -> Dict[str, Any]:
+        """Ollama 설치 모델 조회 (/api/tags 1회, 모델별 상세 정보는 _describe_ollama_models)"""
+        status = {"connected": False, "url": OLLAMA_URL, "error": None, "models": []}
+        try:
+            response = requests.get(f"{OLLAMA_URL}/api/tags", timeout=3)
+            if response.status_code != 200:
+                status["error"] = f"HTTP {response.status_code}"
+                return status
+            tags = response.json()
+            if not isinstance(tags, dict):
+                raise ValueError("unexpected /api/tags payload")
+        except requests.RequestException as e:
+            status["error"] = str(e)
+            return status
+        except ValueError:
+            status["error"] = "Invalid response from /api/tags"
+            return status
+
+        status["connected"] = True
+        for model in tags.get("models", []):
+            model_name = model.get("name", "")
+            if not model_name:
+                continue
+            status["models"].append(model_name)
+            capability = ModelCapability(model_name=model_name, provider="ollama")
+            models[capability.key] = capability
+        return status
+
+    def _describe_ollama_models(self, capabilities: List[ModelCapability]):
+        """모델별 /api/show를 병렬로 조회 (최대 8개 동시, 모델 수만큼 timeout이 누적되지 않도록)"""
+        if not capabilities:
+            return
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(capabilities))) as executor:
+            list(executor.map(self._describe_ollama_model, capabilities))
+
+    def _describe_ollama_model(self, capability: ModelCapability):
+        """/api/show에서 컨텍스트 길이와 tools capability 추출"""
+        try:
+            response = requests.post(
+                f"{OLLAMA_URL}/api/show", json={"model": capability.model_name}, timeout=3
+            )
+            if response.status_code != 200:
+                return
+            details = response.json()
+        except (requests.RequestException, ValueError):
+            return
+
+        capabilities = details.get("capabilities")
+        if isinstance(capabilities, list):
+            capability.supports_tools = "tools" in capabilities
+        for key, value in (details.get("model_info") or {}).items():
+            if key.endswith(".context_length") and isinstance(value, int):
+                capability.context_window = value
+                break
+
+    def _discover_gemini(self, models: Dict[str, ModelCapability]):
+        """GOOGLE_API_KEY가 있을 때만 Gemini 모델 목록 조회"""
+        if not os.getenv("GOOGLE_API_KEY"):
+            return
+        try:
+            import google.generativeai as genai
+            for m in genai.list_models():
+                if 'generateContent' not in m.supported_generation_methods:
+                    continue
+                model_name = m.name.split("/", 1)[-1]
+                capability = ModelCapability(
+                    model_name=model_name,
+                    provider="gemini",
+                    context_window=getattr(m, "input_token_limit", None),
+                    supports_tools=True
+                )
+                models[capability.key] = capability
+        except Exception as e:
+            logger.debug(f"Gemini model discovery failed: {e}")
+
+    # ------------------------------------------------------------------
+    # 조회 (항상 캐시에서 즉시 반환)
+    # ------------------------------------------------------------------
+    def ollama_status(self) -> Dict[str, Any]:
+        """check_ollama_connection과 같은 형식의 Ollama 상태"""
+        self._refresh_if_stale()
+        with self._lock:
+            status = dict(self._ollama)
+            status["models"] = list(self._ollama.get("models", []))
+        status["count"] = len(status["models"])
+        return status
+
+    def get_capability(self, provider: str, model_name: str) -> ModelCapability:
+        """모델 능력 정보 - 조회된 정보가 없으면 정적 테이블 기반 추정값"""
+        self._refresh_if_stale()
+        with self._lock:
+            known = self._models.get(f"{provider}:{model_name}")
+        if known is not None:
+            if known.context_window is None:
+                known.context_window = _lookup_known_context_window(model_name)
+            return known
+
+        available = True
+        if provider == "ollama":
+            available = model_name in self.ollama_status()["models"]
+        elif provider == "gemini" and self._has_provider("gemini"):
+            available = False
+        return ModelCapability(
+            model_name=model_name,
+            provider=provider,
+            available=available,
+            context_window=_lookup_known_context_window(model_name),
+            supports_tools=not model_name.startswith(NO_TOOL_SUPPORT_PREFIXES)
+        )
+
+    def _has_provider(self, provider: str) -> bool:
+        with self._lock:
+            return any(cap.provider == provider for cap in self._models.values())
+
+    def list_capabilities(self, provider: Optional[str] = None) -> List[ModelCapability]:
+        self._refresh_if_stale()
+        with self._lock:
+            return [cap for cap in self._models.values() if provider is None or cap.provider == provider]
+
+    def get_status(self) -> Dict[str, Any]:
+        """디버깅용 상태"""
+        return {
+            "cache_path": str(self.cache_path),
+            "updated_at": self._updated_at,
+            "ttl": self.ttl,
+            "stale": self.is_stale(),
+            "model_count": len(self._models),
+            "refreshing": self._refresh_thread is not None and self._refresh_thread.is_alive(),
+        }
+
+
+# 전역 인스턴스 (싱글톤)
+_model_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """전역 모델 레지스트리 인스턴스 반환"""
+    global _model_registry
+    if _model_registry is None:
+        with _registry_lock:
+            if _model_registry is None:
+                _model_registry = ModelRegistry()
+    return _model_registry
+
+
+__all__ = [
+    "ModelCapability",
+    "ModelRegistry",
+    "get_model_registry",
+]
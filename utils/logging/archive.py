@@ -0,0 +1,172 @@
+"""
+세션 로그 압축 및 보존 정책
+종료된 세션 파일을 gzip/zstd로 압축하고, 오래되었거나 전체 용량 한도를 넘는 세션을 오래된 순으로 삭제
+(Logger가 세션 종료 시 writer 스레드에서 실행, 기존 로그는 아래 명령으로 일괄 처리)
+
+    python -m src.utils.logging.archive --compress --prune
+
+환경변수:
+- LOG_COMPRESSION: gzip (기본) / zstd / none - 종료된 세션 압축 방식
+- LOG_RETENTION_DAYS: 이 일수보다 오래된 세션 삭제 (기본 0, 0이면 사용 안 함)
+- LOG_MAX_TOTAL_MB: 세션 로그 전체 용량 한도 (MB, 기본 0, 0이면 사용 안 함)
+"""
+
+import os
+import logging
+import argparse
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Collection, Dict, Optional
+
+from src.utils.logging.session_index import SessionIndex, SessionSummary
+from src.utils.logging.session_log import (
+    COMPRESSION_SUFFIXES, compress_session_file, is_compressed, read_session_file, zstandard
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LogArchivePolicy:
+    """세션 로그 압축/보존 정책"""
+    compression: Optional[str] = "gzip"
+    max_age_days: float = 0.0
+    max_total_bytes: int = 0
+
+
+def get_log_archive_policy() -> LogArchivePolicy:
+    """환경변수에서 정책 로드"""
+    compression = os.getenv("LOG_COMPRESSION", "gzip").lower()
+    if compression == "none":
+        compression = None
+    elif compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported LOG_COMPRESSION: {compression}")
+    elif compression == "zstd" and zstandard is None:
+        logger.warning("zstandard not installed, falling back to gzip log compression")
+        compression = "gzip"
+    return LogArchivePolicy(
+        compression=compression,
+        max_age_days=float(os.getenv("LOG_RETENTION_DAYS", "0")),
+        max_total_bytes=int(float(os.getenv("LOG_MAX_TOTAL_MB", "0")) * 1024 * 1024),
+    )
+
+
+def archive_session(index: SessionIndex, summary: SessionSummary, path: Path,
+                    policy: LogArchivePolicy) -> Path:
+    """종료된 세션 압축 후 인덱스 경로 갱신"""
+    path = Path(path)
+    if policy.compression and path.exists() and not is_compressed(path):
+        path = compress_session_file(path, policy.compression)
+    index.upsert(summary, path)
+    return path
+
+
+def _delete_session(index: SessionIndex, row: Dict[str, Any]):
+    Path(row["file_path"]).unlink(missing_ok=True)
+    index.remove(row["session_id"])
+
+
+def apply_retention(index: SessionIndex, policy: LogArchivePolicy, protect: Collection[str] = (),
+                    on_remove: Optional[Callable[[str], None]] = None) -> Dict[str, int]:
+    """보존 정책 적용 - 오래된 세션부터 삭제
+
+    Args:
+        protect: 삭제하지 않을 세션 ID (현재 기록 중인 세션)
+        on_remove: 세션을 삭제할 때마다 세션 ID로 호출 (검색 색인 정리 등)
+    """
+    removed = {"sessions": 0, "bytes": 0}
+
+    def remove(row: Dict[str, Any]):
+        _delete_session(index, row)
+        if on_remove is not None:
+            on_remove(row["session_id"])
+        removed["sessions"] += 1
+        removed["bytes"] += row["file_size"]
+
+    rows = index.oldest(limit=1 << 30) if policy.max_age_days or policy.max_total_bytes else []
+
+    if policy.max_age_days:
+        cutoff = (datetime.now() - timedelta(days=policy.max_age_days)).isoformat()
+        kept = []
+        for row in rows:
+            if row["start_time"] < cutoff and row["session_id"] not in protect:
+                remove(row)
+            else:
+                kept.append(row)
+        rows = kept
+
+    if policy.max_total_bytes:
+        total = sum(row["file_size"] for row in rows)
+        for row in rows:
+            if total <= policy.max_total_bytes:
+                break
+            # 종료되지 않은 세션은 다른 프로세스가 기록 중일 수 있으므로 용량 한도로는 삭제하지 않음
+            if row["session_id"] in protect or row["end_time"] is None:
+                continue
+            remove(row)
+            total -= row["file_size"]
+
+    if removed["sessions"]:
+        logger.info(f"Log retention removed {removed['sessions']} sessions ({removed['bytes']} bytes)")
+    return removed
+
+
+def compress_existing(index: SessionIndex, policy: LogArchivePolicy) -> int:
+    """인덱스에 있는 종료된 세션 중 압축되지 않은 파일을 모두 압축 (이전 형식 .json 포함)"""
+    if not policy.compression:
+        return 0
+    compressed = 0
+    for row in index.oldest(limit=1 << 30):
+        path = Path(row["file_path"])
+        if is_compressed(path) or not path.exists():
+            continue
+        if row["end_time"] is None and path.suffix != ".json":
+            continue
+        try:
+            summary = SessionSummary.from_session_data(read_session_file(path, resolve=False))
+            archive_session(index, summary, path, policy)
+            compressed += 1
+        except Exception as e:
+            logger.warning(f"Failed to compress {path}: {e}")
+    return compressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compress and prune session logs")
+    parser.add_argument("--logs", default="logs", help="session log directory")
+    parser.add_argument("--compress", action="store_true", help="compress finished sessions")
+    parser.add_argument("--prune", action="store_true", help="apply LOG_RETENTION_DAYS / LOG_MAX_TOTAL_MB")
+    parser.add_argument("--rebuild-index", action="store_true", help="rescan the log directory first")
+    args = parser.parse_args()
+
+    index = SessionIndex(Path(args.logs))
+    policy = get_log_archive_policy()
+    if args.rebuild_index:
+        print(f"Indexed {index.rebuild()} sessions")
+    if args.compress:
+        print(f"Compressed {compress_existing(index, policy)} sessions")
+    if args.prune:
+        # 삭제되는 세션만 참조하던 blob과 검색 색인 항목도 함께 삭제
+        from src.utils.logging.blob_store import BlobStore
+        from src.utils.logging.search_index import SessionSearchIndex, is_search_enabled
+        blobs = BlobStore(Path(args.logs), index=index)
+        if blobs.created:
+            blobs.rebuild()
+        search_index = SessionSearchIndex(Path(args.logs)) if is_search_enabled() else None
+
+        def on_remove(session_id: str):
+            blobs.on_session_removed(session_id)
+            if search_index is not None:
+                search_index.remove(session_id)
+
+        removed = apply_retention(index, policy, on_remove=on_remove)
+        blobs.close()
+        if search_index is not None:
+            search_index.close()
+        print(f"Removed {removed['sessions']} sessions ({removed['bytes']} bytes)")
+    print(f"Total log size: {index.total_size()} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+세션 로그 blob 저장소 (content-addressed)
+크기가 큰 도구 출력은 세션 파일에 그대로 넣지 않고 내용의 sha256으로 한 번만 저장한 뒤
+이벤트에는 참조만 기록 - 여러 세션에서 같은 스캔 결과가 나와도 디스크에는 하나만 남음
+
+    {"event_type": "tool_output", "timestamp": ..., "tool_name": "nmap", "content_ref": "sha256:<hex>", "content_size": 18234}
+
+- 저장 위치: <logs>/blobs/<hash 앞 2자리>/<hash>.gz (같은 내용은 같은 경로이므로 다시 쓰지 않음)
+- EventBus가 이벤트를 직렬화하기 전에 externalize()로 참조로 바꿈 - 다른 sink(검색 색인, 통계)는 원래 내용을 그대로 받음
+- 읽기: SessionReader / read_session_file이 이벤트를 읽을 때 그 이벤트의 blob만 읽어 content를 채움 (재현/내보내기)
+- 참조 관계는 세션 인덱스 파일(sessions.sqlite)의 blob_refs 테이블에 기록하고,
+  보존 정책으로 세션이 삭제되면 더 이상 참조되지 않는 blob도 삭제
+  (LOG_MAX_TOTAL_MB 용량 한도는 세션 파일 크기만 계산)
+- 세션 파일을 다른 곳으로 옮길 때는 blobs/ 디렉토리도 함께 옮겨야 함
+
+환경변수:
+- LOG_BLOB_THRESHOLD: 이 바이트 수 이상인 도구 출력을 blob으로 저장 (기본 4096, 0이면 사용 안 함)
+- LOG_BLOB_COMPRESSION: gzip (기본) / none - blob 압축 방식
+- LOG_BLOB_PATH: blob 디렉토리 (기본 <logs>/blobs)
+"""
+
+import os
+import gzip
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.utils.logging.sinks import EventSink
+
+logger = logging.getLogger(__name__)
+
+REF_PREFIX = "sha256:"
+BLOB_EVENT_TYPES = ("tool_output",)
+MISSING_BLOB = "[tool output unavailable: blob {} not found]"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blob_refs (
+    digest TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    PRIMARY KEY (digest, session_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS blob_refs_session ON blob_refs (session_id);
+"""
+
+
+class BlobStore(EventSink):
+    """큰 도구 출력을 hash로 한 번만 저장하는 blob 저장소
+
+    index를 넘기면 (EventBus) 세션별 참조를 기록하고 세션 삭제 시 참조가 없어진 blob을 정리,
+    넘기지 않으면 (세션 파일 읽기) 읽기 전용으로 사용
+    """
+
+    def __init__(self, base_path: Path, path: Optional[str] = None, threshold: Optional[int] = None,
+                 compression: Optional[str] = None, index=None):
+        self.directory = Path(path or os.getenv("LOG_BLOB_PATH") or Path(base_path) / "blobs")
+        self.threshold = int(os.getenv("LOG_BLOB_THRESHOLD", "4096")) if threshold is None else threshold
+        compression = (compression or os.getenv("LOG_BLOB_COMPRESSION", "gzip")).lower()
+        if compression not in ("gzip", "none"):
+            raise ValueError(f"Unsupported LOG_BLOB_COMPRESSION: {compression}")
+        self.compression = None if compression == "none" else compression
+        self.index = index
+
+        self.written = 0
+        self.deduplicated = 0
+        self.bytes_written = 0
+        self.bytes_referenced = 0
+        self._lock = threading.RLock()
+        # 이미 디스크에 있는 것으로 확인한 blob / 아직 기록하지 않은 (digest, session_id) 참조
+        self._known: Set[str] = set()
+        self._pending: Set[Tuple[str, str]] = set()
+        self.conn = None
+        self.created = False
+        if index is not None:
+            self.conn = sqlite3.connect(str(index.path), check_same_thread=False, isolation_level=None)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.created = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'blob_refs'"
+            ).fetchone() is None
+            self.conn.executescript(SCHEMA)
+
+    @classmethod
+    def for_session_file(cls, path: Path) -> "BlobStore":
+        """세션 파일이 참조하는 blob 저장소 (읽기 전용) - 세션 파일의 상위 디렉토리 중 blobs/가 있는 가장 가까운 곳"""
+        path = Path(path).resolve()
+        for parent in path.parents:
+            if (parent / "blobs").is_dir():
+                return cls(parent)
+        return cls(path.parent)
+
+    # ------------------------------------------------------------------
+    # 저장 / 읽기
+    # ------------------------------------------------------------------
+    def _paths(self, digest: str) -> List[Path]:
+        """blob 파일 후보 경로 - 현재 압축 방식 경로가 먼저"""
+        folder = self.directory / digest[:2]
+        paths = [folder / f"{digest}.gz", folder / digest]
+        return paths if self.compression else paths[::-1]
+
+    def put(self, data: bytes) -> str:
+        """내용 저장 후 digest 반환 - 이미 있으면 다시 쓰지 않음"""
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if digest in self._known or any(path.exists() for path in self._paths(digest)):
+                self._known.add(digest)
+                self.deduplicated += 1
+                return digest
+            path = self._paths(digest)[0]
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 다른 프로세스가 같은 blob을 동시에 써도 rename은 원자적이고 내용은 같음
+            temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(temp, "wb") as raw:
+                if self.compression:
+                    with gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0) as f:
+                        f.write(data)
+                else:
+                    raw.write(data)
+                raw.flush()
+                os.fsync(raw.fileno())
+            os.replace(temp, path)
+            self._known.add(digest)
+            self.written += 1
+            self.bytes_written += path.stat().st_size
+        return digest
+
+    def get(self, digest: str) -> Optional[str]:
+        """digest → 내용 (없으면 None)"""
+        for path in self._paths(digest):
+            try:
+                if path.suffix == ".gz":
+                    with gzip.open(path, "rb") as f:
+                        return f.read().decode("utf-8")
+                return path.read_bytes().decode("utf-8")
+            except FileNotFoundError:
+                continue
+        return None
+
+    def externalize(self, session_id: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        """기록할 이벤트 - 큰 도구 출력이면 content를 blob 참조로 바꾼 사본, 아니면 record 그대로"""
+        content = record.get("content")
+        if not self.threshold or record.get("event_type") not in BLOB_EVENT_TYPES or not isinstance(content, str):
+            return record
+        # 글자 수가 기준보다 작으면 인코딩해도 기준보다 작을 수 있으므로 글자 수로 먼저 거름
+        if len(content) * 4 < self.threshold:
+            return record
+        data = content.encode("utf-8")
+        if len(data) < self.threshold:
+            return record
+
+        digest = self.put(data)
+        with self._lock:
+            self._pending.add((digest, session_id))
+        self.bytes_referenced += len(data)
+        stored = {}
+        for key, value in record.items():
+            if key == "content":
+                stored["content_ref"] = REF_PREFIX + digest
+                stored["content_size"] = len(data)
+            else:
+                stored[key] = value
+        return stored
+
+    def resolve(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """참조가 있는 이벤트의 content를 채움 (제자리 수정)"""
+        ref = record.pop("content_ref", None)
+        if ref is None:
+            return record
+        record.pop("content_size", None)
+        digest = ref[len(REF_PREFIX):] if ref.startswith(REF_PREFIX) else ref
+        content = self.get(digest)
+        if content is None:
+            logger.warning(f"Missing log blob {digest} in {self.directory}")
+            content = MISSING_BLOB.format(digest[:12])
+        record["content"] = content
+        return record
+
+    # ------------------------------------------------------------------
+    # 참조 관리 (index가 있을 때)
+    # ------------------------------------------------------------------
+    def flush(self):
+        with self._lock:
+            if not self._pending or self.conn is None:
+                return
+            rows, self._pending = self._pending, set()
+            self.conn.execute("BEGIN")
+            self.conn.executemany("INSERT OR IGNORE INTO blob_refs (digest, session_id) VALUES (?, ?)", rows)
+            self.conn.execute("COMMIT")
+
+    def on_batch_end(self):
+        self.flush()
+
+    def on_session_removed(self, session_id: str):
+        """세션의 참조를 지우고 더 이상 참조되지 않는 blob 삭제"""
+        if self.conn is None:
+            return
+        self.flush()
+        with self._lock:
+            digests = [row[0] for row in self.conn.execute(
+                "SELECT digest FROM blob_refs WHERE session_id = ?", (session_id,)
+            )]
+            self.conn.execute("DELETE FROM blob_refs WHERE session_id = ?", (session_id,))
+            for digest in digests:
+                if self.conn.execute("SELECT 1 FROM blob_refs WHERE digest = ? LIMIT 1", (digest,)).fetchone():
+                    continue
+                self._known.discard(digest)
+                for path in self._paths(digest):
+                    path.unlink(missing_ok=True)
+
+    def rebuild(self) -> int:
+        """인덱스에 있는 세션 파일을 읽어 참조 테이블을 다시 채움 (content는 읽지 않음)"""
+        from src.utils.logging.session_log import SessionReader
+
+        with self._lock:
+            self.conn.execute("DELETE FROM blob_refs")
+        scanned = 0
+        for row in self.index.oldest(limit=1 << 30):
+            try:
+                for record in SessionReader(row["file_path"], blobs=self).events(resolve=False):
+                    ref = record.get("content_ref")
+                    if ref:
+                        with self._lock:
+                            self._pending.add((ref[len(REF_PREFIX):], row["session_id"]))
+                self.flush()
+                scanned += 1
+            except Exception as e:
+                logger.warning(f"Failed to scan session {row['session_id']} for blobs: {e}")
+        return scanned
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "threshold": self.threshold,
+            "written": self.written,
+            "deduplicated": self.deduplicated,
+            "bytes_written": self.bytes_written,
+            "bytes_referenced": self.bytes_referenced,
+            "pending": len(self._pending),
+        }
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
@@ -1,16 +1,19 @@
 """
 최소한의 로거 - 재현에 필요한 정보만 기록
 간소화된 버전
+Logger와 같은 이벤트 버스에 publish하므로 같은 JSONL 형식/인덱스/검색 색인을 공유 (event_bus 참고)
 """
 
-import json
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from src.utils.logging.session_log import JSONL_SUFFIX, read_session_file
+from src.utils.logging.event_bus import SessionChannel, get_event_bus
+
 class EventType(Enum):
     """재현에 필요한 최소한의 이벤트 타입"""
     USER_INPUT = "user_input"
@@ -75,9 +78,15 @@ class ConversationSession:
         self.agents_used = list(set([e.agent_name for e in self.events if e.agent_name]))
     
     def add_event(self, event: ConversationEvent):
-        """이벤트 추가"""
+        """이벤트 추가 - 통계는 추가된 이벤트만 반영"""
         self.events.append(event)
-        self.__post_init__()  # 통계 재계산
+        self.total_events += 1
+        if event.event_type in (EventType.USER_INPUT, EventType.AGENT_RESPONSE):
+            self.total_messages += 1
+        elif event.event_type in (EventType.TOOL_COMMAND, EventType.TOOL_OUTPUT):
+            self.total_tools_used += 1
+        if event.agent_name and event.agent_name not in self.agents_used:
+            self.agents_used.append(event.agent_name)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -101,17 +110,19 @@ class ConversationLogger:
         self.base_path = Path(base_path)
         self.base_path.mkdir(exist_ok=True)
         self.current_session: Optional[ConversationSession] = None
+        self._channel: Optional[SessionChannel] = None
+        self.bus = get_event_bus(self.base_path)
+        self.index = self.bus.index
     
     def _get_session_file_path(self, session_id: str) -> Path:
-        """세션 파일 경로 생성"""
+        """세션 파일 경로 생성 (디렉토리는 첫 이벤트 기록 시 생성)"""
         date_str = datetime.now().strftime("%Y/%m/%d")
-        session_dir = self.base_path / date_str
-        session_dir.mkdir(parents=True, exist_ok=True)
-        return session_dir / f"session_{session_id}.json"
+        return self.base_path / date_str / f"session_{session_id}{JSONL_SUFFIX}"
     
     def start_session(self, user_id: str = "unknown", thread_id: str = "unknown", 
                      platform: str = "web", model_info: Optional[Dict[str, Any]] = None) -> str:
         """새 세션 시작"""
+        self.end_session()
         session_id = str(uuid.uuid4())
         start_time = datetime.now().isoformat()
         
@@ -120,6 +131,10 @@ class ConversationLogger:
             start_time=start_time,
             events=[]
         )
+        model = (model_info or {}).get("display_name") or (model_info or {}).get("model_name")
+        self._channel = self.bus.open_session(
+            session_id, start_time, self._get_session_file_path(session_id), model
+        )
         return session_id
     
     def log_event(self, event_type: EventType, content: Optional[str] = None,
@@ -138,6 +153,8 @@ class ConversationLogger:
         )
         
         self.current_session.add_event(event)
+        if not self.bus.publish(self._channel, event.to_dict()):
+            print(f"Session log queue is full, dropped {event_type.value} event.")
         return event.event_id
     
     def log_user_input(self, content: str) -> str:
@@ -197,19 +214,18 @@ class ConversationLogger:
             return None
         
         session_id = self.current_session.session_id
-        self.save_session()
+        channel, self._channel = self._channel, None
+        self.bus.close_session(channel)
         self.current_session = None
         return session_id
     
     def save_session(self) -> bool:
-        """세션 저장"""
+        """세션 저장 - 이벤트는 이미 버스로 기록 중이므로 인덱스 갱신만 요청"""
         if not self.current_session:
             return False
         
         try:
-            file_path = self._get_session_file_path(self.current_session.session_id)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.current_session.to_dict(), f, indent=2, ensure_ascii=False)
+            self.bus.checkpoint(self._channel)
             return True
         except Exception as e:
             print(f"Failed to save session: {e}")
@@ -218,69 +234,61 @@ class ConversationLogger:
     def load_session(self, session_id: str) -> Optional[ConversationSession]:
         """세션 로드"""
         try:
-            for session_file in self.base_path.rglob(f"session_{session_id}.json"):
-                if session_file.exists():
-                    with open(session_file, 'r', encoding='utf-8') as f:
-                        session_data = json.load(f)
-                    return ConversationSession.from_dict(session_data)
-            return None
+            # Logger와 같은 방식으로 조회 (인덱스, 없으면 디렉토리 검색)
+            session_file = self.index.find_path(session_id)
+            if session_file is None:
+                return None
+            return ConversationSession.from_dict(read_session_file(session_file))
         except Exception as e:
             print(f"Failed to load session {session_id}: {e}")
             return None
     
-    def list_sessions(self, user_id: Optional[str] = None, days_back: int = 30) -> List[Dict[str, Any]]:
-        """세션 목록 조회"""
-        sessions = []
-        
+    def list_sessions(self, user_id: Optional[str] = None, days_back: int = 30,
+                      limit: int = -1, offset: int = 0) -> List[Dict[str, Any]]:
+        """세션 목록 조회 - 메타데이터 인덱스에서 최근 days_back일 세션 (최신 순)"""
         try:
-            for session_file in self.base_path.rglob("session_*.json"):
-                try:
-                    with open(session_file, 'r', encoding='utf-8') as f:
-                        session_data = json.load(f)
-                    
-                    # 기본 정보만 추출
-                    session_info = {
-                        'session_id': session_data['session_id'],
-                        'user_id': session_data.get('user_id', 'unknown'),
-                        'start_time': session_data['start_time'],
-                        'end_time': session_data.get('end_time'),
-                        'platform': session_data.get('platform', 'web'),
-                        'total_events': len(session_data.get('events', [])),
-                        'total_messages': len([e for e in session_data.get('events', []) 
-                                             if e.get('event_type') in ['user_input', 'agent_response']]),
-                        'agents_used': list(set([e.get('agent_name') for e in session_data.get('events', []) 
-                                               if e.get('agent_name')])),
-                        'model_info': session_data.get('model_info'),
-                        'file_path': str(session_file)
-                    }
-                    
-                    sessions.append(session_info)
-                    
-                except Exception as e:
-                    continue
-            
-            # 시간순 정렬 (최신 순)
-            sessions.sort(key=lambda x: x['start_time'], reverse=True)
-            
+            date_from = (datetime.now() - timedelta(days=days_back)).isoformat() if days_back else None
+            rows = self.index.query(limit=limit, offset=offset, date_from=date_from)
         except Exception as e:
             print(f"Error listing sessions: {e}")
+            return []
         
-        return sessions
+        return [
+            {
+                'session_id': row['session_id'],
+                'user_id': 'unknown',
+                'start_time': row['start_time'],
+                'end_time': row['end_time'],
+                'platform': 'web',
+                'total_events': row['event_count'],
+                'total_messages': row['message_count'],
+                'agents_used': row['agents'],
+                'model_info': row['model'],
+                'file_path': row['file_path']
+            }
+            for row in rows
+        ]
     
-    def get_session_stats(self, user_id: Optional[str] = None) -> Dict[str, Any]:
-        """세션 통계 조회"""
-        sessions = self.list_sessions(user_id=user_id)
+    def get_session_stats(self, user_id: Optional[str] = None, days_back: int = 30) -> Dict[str, Any]:
+        """세션 통계 조회 - 최근 days_back일, 인덱스/집계 테이블만 읽음"""
+        date_from = (datetime.now() - timedelta(days=days_back)).isoformat() if days_back else None
+        try:
+            sessions = self.index.aggregate(group_by=(), date_from=date_from)[0]
+            models = self.index.aggregate(group_by=("model",), date_from=date_from)
+            agents = self.bus.session_stats.query(group_by=("agent_name",), date_from=date_from)
+        except Exception as e:
+            print(f"Error reading session stats: {e}")
+            return {}
         
-        total_messages = sum(s['total_messages'] for s in sessions)
-        avg_messages = total_messages / len(sessions) if sessions else 0
+        avg_messages = sessions['messages'] / sessions['sessions'] if sessions['sessions'] else 0
         
         return {
-            'total_sessions': len(sessions),
-            'total_messages': total_messages,
-            'total_events': sum(s['total_events'] for s in sessions),
-            'unique_agents': list(set().union(*[s['agents_used'] for s in sessions if s['agents_used']])),
-            'platforms_used': list(set([s['platform'] for s in sessions])),
-            'models_used': list(set([s['model_info'] for s in sessions if s.get('model_info')])),
+            'total_sessions': sessions['sessions'],
+            'total_messages': sessions['messages'],
+            'total_events': sessions['events'],
+            'unique_agents': [row['agent_name'] for row in agents],
+            'platforms_used': ['web'] if sessions['sessions'] else [],
+            'models_used': [row['model'] for row in models if row['model']],
             'avg_messages_per_session': round(avg_messages, 1)
         }
 
@@ -0,0 +1,214 @@
+"""
+세션 이벤트 버스
+로거(Logger, ConversationLogger)는 이벤트를 버스에 publish만 하고, 버스가 writer 스레드에서
+이벤트를 한 번 직렬화해 등록된 sink들에 전달 (sink 목록은 sinks 참고)
+
+    bus = get_event_bus("logs")
+    channel = bus.open_session(session_id, start_time, path, model)
+    bus.publish(channel, event.to_dict())
+    bus.checkpoint(channel)      # 인덱스 갱신 (세션 파일은 다시 쓰지 않음)
+    bus.close_session(channel)   # 푸터 기록 + fsync + 압축/보존 정책
+
+- 큰 도구 출력은 직렬화 전에 blob 참조로 바꿔 기록 (blob_store 참고, sink에는 원래 이벤트를 전달)
+- 같은 로그 디렉토리를 쓰는 로거들은 같은 버스(같은 sink, 같은 인덱스)를 공유
+- sink 하나가 실패해도 다른 sink에는 그대로 전달
+- bus.add_sink()로 sink를 추가해도 세션 파일을 다시 쓰거나 이벤트를 다시 직렬화하지 않음
+"""
+
+import atexit
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.utils.logging.session_log import encode_record
+from src.utils.logging.session_index import SessionIndex
+from src.utils.logging.log_writer import BackgroundLogWriter, get_log_writer
+from src.utils.logging.archive import get_log_archive_policy
+from src.utils.logging.blob_store import BlobStore
+from src.utils.logging.search_index import SessionSearchIndex, is_search_enabled
+from src.utils.logging.session_stats import SessionStats
+from src.utils.logging.sinks import (
+    EventSink, JsonlLogSink, MetricsSink, SessionIndexSink, TraceExportSink, get_trace_exporter
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SessionChannel:
+    """버스에 열린 세션 하나 - publish할 때 대상으로 사용"""
+
+    def __init__(self, bus: "EventBus", session_id: str, start_time: str, path: Path,
+                 model: Optional[str] = None):
+        self.bus = bus
+        self.session_id = session_id
+        self.start_time = start_time
+        self.path = Path(path)
+        self.model = model
+        # writer 스레드에서만 증가
+        self.event_count = 0
+        self.closed = False
+
+    @property
+    def header(self) -> Dict[str, Any]:
+        header = {"session_id": self.session_id, "start_time": self.start_time}
+        if self.model:
+            header["model"] = self.model
+        return header
+
+    @property
+    def trace_id(self) -> str:
+        return self.session_id.replace("-", "")
+
+
+class EventBus:
+    """이벤트를 sink들에 전달하는 버스 (전달은 BackgroundLogWriter 스레드에서)"""
+
+    def __init__(self, base_path: Path, writer: Optional[BackgroundLogWriter] = None):
+        self.base_path = Path(base_path)
+        # writer 스레드를 먼저 만들어 종료 시 (atexit은 역순) 세션 마감이 writer 종료보다 먼저 실행되도록 함
+        self.writer = writer or get_log_writer()
+        self.index = SessionIndex(self.base_path)
+        self.archive_policy = get_log_archive_policy()
+        self.sinks: List[EventSink] = []
+        self.errors = 0
+        self._channels: Dict[str, SessionChannel] = {}
+        self._lock = threading.Lock()
+
+        # 큰 도구 출력 blob 저장소 - 참조 테이블이 새로 만들어졌으면 기존 로그로 채움
+        self.blobs = self.add_sink(BlobStore(self.base_path, index=self.index))
+        if self.blobs.created:
+            self.writer.call(self.blobs.rebuild)
+        self.add_sink(JsonlLogSink())
+        self.index_sink = self.add_sink(SessionIndexSink(self.index, self.archive_policy, on_remove=self._session_removed))
+        # 전문 검색 색인 - 인덱스 파일이 새로 만들어졌으면 기존 로그로 채움
+        self.search_index: Optional[SessionSearchIndex] = None
+        if is_search_enabled():
+            self.search_index = self.add_sink(SessionSearchIndex(self.base_path))
+            if self.search_index.created:
+                self.writer.call(lambda: self.search_index.rebuild(self.index))
+        # 날짜/모델/에이전트/도구별 통계 - 집계 테이블이 새로 만들어졌으면 기존 로그로 채움
+        self.session_stats = self.add_sink(SessionStats(self.index))
+        if self.session_stats.created:
+            self.writer.call(self.session_stats.rebuild)
+        self.metrics = self.add_sink(MetricsSink())
+        exporter = get_trace_exporter()
+        if exporter != "none":
+            self.add_sink(TraceExportSink(self.base_path, exporter))
+
+        atexit.register(self.close)
+        self.writer.call(self.index_sink.apply_retention)
+
+    def add_sink(self, sink: EventSink) -> EventSink:
+        """sink 등록 - 이후 publish되는 이벤트부터 전달"""
+        if sink not in self.sinks:
+            self.sinks.append(sink)
+        return sink
+
+    # ------------------------------------------------------------------
+    # 로거 쪽 (호출한 스레드에서 바로 반환)
+    # ------------------------------------------------------------------
+    def open_session(self, session_id: str, start_time: str, path: Path,
+                     model: Optional[str] = None) -> SessionChannel:
+        channel = SessionChannel(self, session_id, start_time, path, model)
+        with self._lock:
+            self._channels[session_id] = channel
+        self.writer.call(lambda: self._each("on_session_start", channel))
+        return channel
+
+    def publish(self, channel: SessionChannel, record: Dict[str, Any]) -> bool:
+        """이벤트 하나 전달 요청 - 큐가 가득 차서 버려지면 False"""
+        return self.writer.append(channel, record)
+
+    def checkpoint(self, channel: SessionChannel):
+        """세션 저장 요청 - 지금까지 publish한 이벤트 뒤에 처리"""
+        self.writer.call(lambda: self._each("on_checkpoint", channel))
+
+    def close_session(self, channel: SessionChannel, end_time: Optional[str] = None) -> bool:
+        """세션 종료 - sink들이 마감할 때까지 (로그 파일 fsync) 대기"""
+        with self._lock:
+            if channel.closed:
+                return False
+            channel.closed = True
+            self._channels.pop(channel.session_id, None)
+        self.writer.finalize(channel, {"end_time": end_time or datetime.now().isoformat()})
+        if not self.writer.flush(timeout=self.writer.block_timeout):
+            print(f"Timed out flushing session log {channel.path}")
+            return False
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        return self.writer.flush(timeout)
+
+    def close(self):
+        """열린 세션을 모두 마감하고 sink 정리 (프로세스 종료 시)"""
+        with self._lock:
+            channels = list(self._channels.values())
+        for channel in channels:
+            self.close_session(channel)
+        self.writer.call(lambda: self._each("close"))
+        self.writer.flush(timeout=self.writer.block_timeout)
+
+    # ------------------------------------------------------------------
+    # writer 스레드 (BackgroundLogWriter가 호출)
+    # ------------------------------------------------------------------
+    def dispatch(self, channel: SessionChannel, record: Dict[str, Any]):
+        """이벤트를 한 번 직렬화해 모든 sink에 전달 (line은 blob 참조로 바꾼 기록용 형태, record는 원래 이벤트)"""
+        line = encode_record(self.blobs.externalize(channel.session_id, record))
+        index = channel.event_count
+        channel.event_count += 1
+        for sink in self.sinks:
+            try:
+                sink.on_event(channel, index, record, line)
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"{type(sink).__name__} failed on event: {e}")
+
+    def dispatch_end(self, channel: SessionChannel, footer: Dict[str, Any]):
+        self._each("on_session_end", channel, footer)
+
+    def batch_end(self):
+        self._each("on_batch_end")
+
+    def sync(self) -> int:
+        synced = 0
+        for sink in self.sinks:
+            try:
+                synced += sink.sync()
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"{type(sink).__name__} failed to sync: {e}")
+        return synced
+
+    def _session_removed(self, session_id: str):
+        self._each("on_session_removed", session_id)
+
+    def _each(self, hook: str, *args):
+        for sink in self.sinks:
+            try:
+                getattr(sink, hook)(*args)
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"{type(sink).__name__}.{hook} failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "writer": self.writer.get_stats(),
+            "errors": self.errors,
+            "open_sessions": len(self._channels),
+            "sinks": {type(sink).__name__: sink.get_stats() for sink in self.sinks},
+        }
+
+
+_event_buses: Dict[Path, EventBus] = {}
+_event_bus_lock = threading.Lock()
+
+
+def get_event_bus(base_path="logs") -> EventBus:
+    """로그 디렉토리별 이벤트 버스 인스턴스 반환"""
+    key = Path(base_path).resolve()
+    with _event_bus_lock:
+        if key not in _event_buses:
+            _event_buses[key] = EventBus(Path(base_path))
+        return _event_buses[key]
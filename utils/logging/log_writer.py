@@ -0,0 +1,231 @@
+"""
+백그라운드 배치 로그 writer
+워크플로우 이벤트 루프에서 디스크 I/O를 분리 - 로깅 호출은 큐에 넣고 바로 반환하고
+전용 writer 스레드가 모아서 이벤트 버스의 sink들에 전달 (event_bus 참고)
+
+- 제한된 크기의 메모리 큐 (LOG_QUEUE_SIZE)
+- writer 스레드가 최대 LOG_BATCH_SIZE개씩 꺼내 처리 후 배치마다 한 번 버스의 batch_end() (sink별 flush/commit)
+- fsync는 LOG_FSYNC_INTERVAL초마다 (세션 종료/flush() 시에는 즉시)
+- 큐가 가득 찼을 때(디스크가 느릴 때) 정책 LOG_BACKPRESSURE:
+  - block: 최대 LOG_BLOCK_TIMEOUT초 대기 후에도 자리가 없으면 이벤트를 버림 (기본)
+  - drop: 기다리지 않고 이벤트를 버림
+  세션 종료/동기화 같은 제어 작업은 정책과 관계없이 항상 대기
+- LOG_ASYNC=false면 호출한 스레드에서 바로 기록 (이전 동작)
+
+큐에 들어가는 대상은 세션 채널 (SessionChannel) - channel.bus의 dispatch / dispatch_end / batch_end / sync를 호출
+"""
+
+import os
+import time
+import queue
+import atexit
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+BACKPRESSURE_POLICIES = ("block", "drop")
+
+_APPEND = "append"
+_CALL = "call"
+_FINALIZE = "finalize"
+_FLUSH = "flush"
+_STOP = "stop"
+
+
+def is_async_logging_enabled() -> bool:
+    return os.getenv("LOG_ASYNC", "true").lower() == "true"
+
+
+class BackgroundLogWriter:
+    """세션 로그 기록을 전담하는 writer 스레드"""
+
+    def __init__(self, queue_size: Optional[int] = None, batch_size: Optional[int] = None,
+                 fsync_interval: Optional[float] = None, backpressure: Optional[str] = None,
+                 block_timeout: Optional[float] = None, asynchronous: Optional[bool] = None):
+        self.batch_size = batch_size or int(os.getenv("LOG_BATCH_SIZE", "256"))
+        self.fsync_interval = fsync_interval if fsync_interval is not None else float(
+            os.getenv("LOG_FSYNC_INTERVAL", "1.0")
+        )
+        self.backpressure = backpressure or os.getenv("LOG_BACKPRESSURE", "block").lower()
+        if self.backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unsupported LOG_BACKPRESSURE policy: {self.backpressure}")
+        self.block_timeout = block_timeout if block_timeout is not None else float(
+            os.getenv("LOG_BLOCK_TIMEOUT", "5.0")
+        )
+        self.asynchronous = is_async_logging_enabled() if asynchronous is None else asynchronous
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size or int(os.getenv("LOG_QUEUE_SIZE", "10000")))
+        # 동기 모드에서 여러 스레드가 동시에 기록하지 않도록 보호
+        self._inline_lock = threading.Lock()
+        # 배치는 끝났지만 아직 fsync하지 않은 이벤트 버스
+        self._unsynced: Set[Any] = set()
+        self._last_sync = time.monotonic()
+        self.stats = {"events": 0, "batches": 0, "fsyncs": 0, "dropped": 0, "blocked": 0, "errors": 0}
+
+        self._thread: Optional[threading.Thread] = None
+        if self.asynchronous:
+            self._thread = threading.Thread(target=self._run, name="session-log-writer", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+    # ------------------------------------------------------------------
+    # 호출하는 쪽 (이벤트 루프 / UI 스레드)
+    # ------------------------------------------------------------------
+    def append(self, channel, record: Dict[str, Any]) -> bool:
+        """이벤트 하나 기록 요청 - 큐가 가득 차면 backpressure 정책을 따름"""
+        item = (_APPEND, channel, record)
+        if not self.asynchronous or not self._thread.is_alive():
+            self._run_inline(item)
+            return True
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            pass
+        if self.backpressure == "block":
+            self.stats["blocked"] += 1
+            try:
+                self._queue.put(item, timeout=self.block_timeout)
+                return True
+            except queue.Full:
+                pass
+        self.stats["dropped"] += 1
+        return False
+
+    def call(self, fn: Callable[[], Any]):
+        """writer 스레드에서 함수 실행 (인덱스 갱신 등 기록 순서를 지켜야 하는 작업)"""
+        self._submit((_CALL, fn, None))
+
+    def finalize(self, channel, footer: Dict[str, Any]):
+        """세션 마감 (sink마다 on_session_end - 로그 푸터 기록 + fsync + close 등)"""
+        self._submit((_FINALIZE, channel, footer))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """지금까지 요청된 기록이 모두 디스크에 fsync될 때까지 대기"""
+        if not self.asynchronous:
+            self._run_inline((_FLUSH, None, None))
+            return True
+        if self._thread is None or not self._thread.is_alive():
+            return False
+        done = threading.Event()
+        self._queue.put((_FLUSH, done, None))
+        return done.wait(timeout)
+
+    def close(self):
+        """남은 기록을 모두 처리하고 writer 스레드 종료"""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        self._queue.put((_STOP, None, None))
+        self._thread.join(timeout=self.block_timeout + 5)
+
+    def _submit(self, item):
+        """제어 작업은 버리지 않고 자리가 날 때까지 대기 (writer 스레드가 이미 종료되었으면 직접 실행)"""
+        if self.asynchronous and self._thread.is_alive():
+            self._queue.put(item)
+        else:
+            self._run_inline(item)
+
+    def _run_inline(self, item):
+        with self._inline_lock:
+            self._process([item])
+            self._sync_all()
+
+    # ------------------------------------------------------------------
+    # writer 스레드
+    # ------------------------------------------------------------------
+    def _run(self):
+        while True:
+            timeout = max(self.fsync_interval - (time.monotonic() - self._last_sync), 0.01)
+            try:
+                batch = [self._queue.get(timeout=timeout)]
+            except queue.Empty:
+                self._sync_all()
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not self._process(batch):
+                self._sync_all()
+                return
+            if time.monotonic() - self._last_sync >= self.fsync_interval:
+                self._sync_all()
+
+    def _process(self, batch) -> bool:
+        """배치 처리 - 중지 요청이 있으면 False"""
+        running = True
+        touched: Set[Any] = set()
+        waiters = []
+        for op, target, payload in batch:
+            try:
+                if op == _APPEND:
+                    target.bus.dispatch(target, payload)
+                    touched.add(target.bus)
+                    self.stats["events"] += 1
+                elif op == _CALL:
+                    self._end_batch(touched)
+                    target()
+                elif op == _FINALIZE:
+                    target.bus.dispatch_end(target, payload)
+                    touched.add(target.bus)
+                elif op == _FLUSH:
+                    waiters.append(target)
+                elif op == _STOP:
+                    running = False
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"Session log write failed ({op}): {e}")
+        self._end_batch(touched)
+        self.stats["batches"] += 1
+        if waiters:
+            self._sync_all()
+            for waiter in waiters:
+                if waiter is not None:
+                    waiter.set()
+        return running
+
+    def _end_batch(self, touched: Set[Any]):
+        """배치에서 이벤트를 받은 버스마다 batch_end (sink별 flush/commit)"""
+        for bus in touched:
+            try:
+                bus.batch_end()
+                self._unsynced.add(bus)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"Session log batch flush failed: {e}")
+        touched.clear()
+
+    def _sync_all(self):
+        for bus in self._unsynced:
+            try:
+                self.stats["fsyncs"] += bus.sync()
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"Session log fsync failed: {e}")
+        self._unsynced.clear()
+        self._last_sync = time.monotonic()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "async": self.asynchronous,
+            "backpressure": self.backpressure,
+            "queued": self._queue.qsize(),
+            "queue_size": self._queue.maxsize,
+            **self.stats,
+        }
+
+
+_log_writer: Optional[BackgroundLogWriter] = None
+_log_writer_lock = threading.Lock()
+
+
+def get_log_writer() -> BackgroundLogWriter:
+    """전역 로그 writer 인스턴스 반환"""
+    global _log_writer
+    with _log_writer_lock:
+        if _log_writer is None:
+            _log_writer = BackgroundLogWriter()
+        return _log_writer
@@ -1,56 +1,23 @@
 """
 최소한의 로거 - 재현에 필요한 정보만 기록
+세션은 append-only JSONL(session_<id>.jsonl)로 이벤트마다 한 줄씩 기록 (형식은 session_log 참고)
+이벤트는 이벤트 버스에 publish만 하고 (event_bus 참고) 파일 기록, 인덱스, 검색 색인 등은 sink가
+백그라운드 writer 스레드에서 처리 - 로깅 호출은 큐에 넣고 바로 반환
+종료된 세션은 압축하고 보존 정책을 적용 (archive 참고) - 읽기는 압축 여부와 관계없이 동일
+이벤트는 __slots__ 기반 공용 이벤트 모델을 사용 (src.utils.events 참고)
 """
 
-import json
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from dataclasses import dataclass
-from enum import Enum
 
-class EventType(Enum):
-    """재현에 필요한 최소한의 이벤트 타입"""
-    USER_INPUT = "user_input"
-    AGENT_RESPONSE = "agent_response"
-    TOOL_COMMAND = "tool_command"
-    TOOL_OUTPUT = "tool_output"
-
-@dataclass
-class Event:
-    """재현에 필요한 이벤트 정보"""
-    event_type: EventType
-    timestamp: str
-    content: str
-    agent_name: Optional[str] = None  # agent_response에만 사용
-    tool_name: Optional[str] = None   # tool_command, tool_output에만 사용
-    tool_calls: Optional[List[Dict[str, Any]]] = None  # AI 메시지의 tool calls 정보
-    
-    def to_dict(self) -> Dict[str, Any]:
-        result = {
-            "event_type": self.event_type.value,
-            "timestamp": self.timestamp,
-            "content": self.content
-        }
-        if self.agent_name:
-            result["agent_name"] = self.agent_name
-        if self.tool_name:
-            result["tool_name"] = self.tool_name
-        if self.tool_calls:
-            result["tool_calls"] = self.tool_calls
-        return result
-    
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Event':
-        return cls(
-            event_type=EventType(data["event_type"]),
-            timestamp=data["timestamp"],
-            content=data["content"],
-            agent_name=data.get("agent_name"),
-            tool_name=data.get("tool_name"),
-            tool_calls=data.get("tool_calls")  # 기존 로그와 호환성을 위해 optional
-        )
+from src.utils.events import Event, EventType
+from src.utils.logging.session_log import (
+    SessionReader, JSONL_SUFFIX, read_session_file
+)
+from src.utils.logging.event_bus import SessionChannel, get_event_bus
 
 @dataclass
 class Session:
@@ -86,16 +53,39 @@ class Logger:
         self.base_path = Path(base_path)
         self.base_path.mkdir(exist_ok=True)
         self.current_session: Optional[Session] = None
+        self._channel: Optional[SessionChannel] = None
+        # 로그 파일/인덱스/검색 색인 등은 이벤트 버스의 sink가 처리
+        self.bus = get_event_bus(self.base_path)
+        self.log_writer = self.bus.writer
+        # 세션 목록/경로 조회용 메타데이터 인덱스, 전문 검색 색인
+        self.index = self.bus.index
+        self.search_index = self.bus.search_index
     
     def _get_session_file_path(self, session_id: str) -> Path:
-        """세션 파일 경로 생성"""
+        """세션 파일 경로 생성 (디렉토리는 첫 이벤트 기록 시 생성)"""
         date_str = datetime.now().strftime("%Y/%m/%d")
-        session_dir = self.base_path / date_str
-        session_dir.mkdir(parents=True, exist_ok=True)
-        return session_dir / f"session_{session_id}.json"
+        return self.base_path / date_str / f"session_{session_id}{JSONL_SUFFIX}"
+    
+    def _find_session_file(self, session_id: str) -> Optional[Path]:
+        """세션 ID로 파일 검색 - 인덱스 조회, 인덱스에 없으면 (직접 복사해 넣은 로그 등) 디렉토리 검색"""
+        return self.index.find_path(session_id)
+    
+    def _append_event(self, event: Event):
+        """이벤트를 메모리 세션에 추가하고 이벤트 버스에 전달 (기록은 writer 스레드에서)"""
+        self.current_session.events.append(event)
+        if not self.bus.publish(self._channel, event.to_dict()):
+            print(f"Session log queue is full, dropped {event.event_type.value} event.")
+    
+    def _close_channel(self) -> bool:
+        """현재 세션을 버스에서 마감 (푸터 기록 + fsync, 압축/보존 정책은 writer 스레드에서)"""
+        if self._channel is None:
+            return False
+        channel, self._channel = self._channel, None
+        return self.bus.close_session(channel)
     
     def start_session(self, model_info: Optional[str] = None) -> str:
         """새 세션 시작 - 모델 정보 포함"""
+        self._close_channel()
         session_id = str(uuid.uuid4())
         start_time = datetime.now().isoformat()
         
@@ -105,6 +95,9 @@ class Logger:
             events=[],
             model=model_info  # 모델 정보 저장
         )
+        self._channel = self.bus.open_session(
+            session_id, start_time, self._get_session_file_path(session_id), model_info
+        )
         return session_id
     
     def log_user_input(self, content: str):
@@ -115,19 +108,21 @@ class Logger:
                 timestamp=datetime.now().isoformat(),
                 content=content
             )
-            self.current_session.events.append(event)
+            self._append_event(event)
     
-    def log_agent_response(self, agent_name: str, content: str, tool_calls: Optional[List[Dict[str, Any]]] = None):
-        """에이전트 응답 로깅 - tool_calls 정보 포함"""
+    def log_agent_response(self, agent_name: str, content: str, tool_calls: Optional[List[Dict[str, Any]]] = None,
+                           usage: Optional[Dict[str, int]] = None):
+        """에이전트 응답 로깅 - tool_calls 정보, 토큰 사용량 포함"""
         if self.current_session:
             event = Event(
                 event_type=EventType.AGENT_RESPONSE,
                 timestamp=datetime.now().isoformat(),
                 content=content,
                 agent_name=agent_name,
-                tool_calls=tool_calls
+                tool_calls=tool_calls,
+                usage=usage
             )
-            self.current_session.events.append(event)
+            self._append_event(event)
     
     def log_tool_command(self, tool_name: str, command: str):
         """도구 명령 로깅"""
@@ -138,7 +133,7 @@ class Logger:
                 content=command,
                 tool_name=tool_name
             )
-            self.current_session.events.append(event)
+            self._append_event(event)
     
     def log_tool_output(self, tool_name: str, output: str):
         """도구 출력 로깅"""
@@ -149,10 +144,12 @@ class Logger:
                 content=output,
                 tool_name=tool_name
             )
-            self.current_session.events.append(event)
+            self._append_event(event)
     
     def save_session(self) -> bool:
-        """세션 저장 - 이벤트가 없으면 저장하지 않음"""
+        """세션 저장 - 이벤트는 이미 한 줄씩 기록 중이므로 인덱스 갱신만 요청 (대기하지 않음)
+        fsync는 writer 스레드가 주기적으로 수행하고 세션 종료 시 flush
+        이벤트가 없으면 저장하지 않음"""
         if not self.current_session:
             return False
         
@@ -162,9 +159,7 @@ class Logger:
             return False
         
         try:
-            file_path = self._get_session_file_path(self.current_session.session_id)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.current_session.to_dict(), f, indent=2, ensure_ascii=False)
+            self.bus.checkpoint(self._channel)
             print(f"Session {self.current_session.session_id} saved with {len(self.current_session.events)} events.")
             return True
         except Exception as e:
@@ -177,68 +172,119 @@ class Logger:
             return None
         
         session_id = self.current_session.session_id
-        self.save_session()
+        self._close_channel()
         self.current_session = None
         return session_id
     
     def load_session(self, session_id: str) -> Optional[Session]:
         """세션 로드"""
         try:
-            for session_file in self.base_path.rglob(f"session_{session_id}.json"):
-                if session_file.exists():
-                    with open(session_file, 'r', encoding='utf-8') as f:
-                        session_data = json.load(f)
-                    return Session.from_dict(session_data)
-            return None
+            session_file = self._find_session_file(session_id)
+            if session_file is None:
+                return None
+            return Session.from_dict(read_session_file(session_file))
         except Exception as e:
             print(f"Failed to load session {session_id}: {e}")
             return None
     
-    def list_sessions(self, limit: int = 20) -> List[Dict[str, Any]]:
-        """세션 목록 조회"""
-        sessions = []
+    def open_session(self, session_id: str) -> Optional[SessionReader]:
+        """세션 스트리밍 reader - 이벤트를 필요할 때만 읽음 (긴 세션의 재현/익스포트용)"""
+        session_file = self._find_session_file(session_id)
+        return SessionReader(session_file) if session_file is not None else None
+    
+    def iter_session_events(self, session_id: str, offset: int = 0,
+                            limit: Optional[int] = None) -> Iterator[Event]:
+        """세션 이벤트를 offset부터 하나씩 반환 (페이지 조회용)"""
+        reader = self.open_session(session_id)
+        if reader is None:
+            return
+        for data in reader.events(offset=offset, limit=limit):
+            yield Event.from_dict(data)
+    
+    def list_sessions(self, limit: int = 20, offset: int = 0, sort_by: str = "start_time",
+                      descending: bool = True, **filters) -> List[Dict[str, Any]]:
+        """세션 목록 조회 - 메타데이터 인덱스만 조회 (로그 파일을 읽지 않음)
         
+        filters: date_from, date_to, model, min_events, max_events (SessionIndex.query 참고)
+        """
         try:
-            for session_file in self.base_path.rglob("session_*.json"):
-                try:
-                    with open(session_file, 'r', encoding='utf-8') as f:
-                        session_data = json.load(f)
-                    
-                    # 기본 정보만 추출
-                    session_info = {
-                        'session_id': session_data['session_id'],
-                        'start_time': session_data['start_time'],
-                        'event_count': len(session_data.get('events', [])),
-                        'file_path': str(session_file)
-                    }
-                    
-                    # 모델 정보 추가 (있는 경우)
-                    if session_data.get('model'):
-                        session_info['model'] = session_data['model']
-                    
-                    # 첫 번째 사용자 입력으로 미리보기 생성
-                    events = session_data.get('events', [])
-                    preview = "No user input found"
-                    for event in events:
-                        if event.get('event_type') == 'user_input':
-                            preview = event.get('content', '')[:100]
-                            if len(preview) < len(event.get('content', '')):
-                                preview += "..."
-                            break
-                    
-                    session_info['preview'] = preview
-                    sessions.append(session_info)
-                    
-                except Exception as e:
-                    continue
-            
-            # 시간순 정렬 (최신 순)
-            sessions.sort(key=lambda x: x['start_time'], reverse=True)
-            
+            return self.index.query(limit=limit, offset=offset, sort_by=sort_by, descending=descending, **filters)
         except Exception as e:
             print(f"Error listing sessions: {e}")
+            return []
+    
+    def search_sessions(self, query: str, limit: int = 20, offset: int = 0) -> List[Dict[str, Any]]:
+        """전문 검색 - 관련도 순 세션 목록 (list_sessions 항목 + snippet, hit_count, score)"""
+        if not self.search_index or not query.strip():
+            return []
+        results = []
+        try:
+            for hit in self.search_index.search_sessions(query, limit=limit, offset=offset):
+                info = self.index.get(hit["session_id"])
+                if info is None:
+                    # 아직 저장(인덱스 갱신)되지 않은 현재 세션만 표시 (삭제된 세션의 남은 색인은 건너뜀)
+                    if self.current_session is None or self.current_session.session_id != hit["session_id"]:
+                        continue
+                    info = {
+                        "session_id": hit["session_id"],
+                        "start_time": self.current_session.start_time,
+                        "event_count": len(self.current_session.events)
+                    }
+                results.append({**info, **hit})
+        except Exception as e:
+            print(f"Error searching sessions: {e}")
+        return results
+    
+    def search_events(self, query: str, limit: int = 20, offset: int = 0, **filters) -> List[Dict[str, Any]]:
+        """전문 검색 - 관련도 순 이벤트 목록 (session_id, event_index, snippet 등)
         
-        return sessions[:limit]
+        filters: session_id, agent_name, tool_name
+        """
+        if not self.search_index or not query.strip():
+            return []
+        try:
+            return self.search_index.search(query, limit=limit, offset=offset, **filters)
+        except Exception as e:
+            print(f"Error searching events: {e}")
+            return []
+    
+    def get_session_stats(self, days_back: Optional[int] = None, top: int = 10) -> Dict[str, Any]:
+        """누적 통계 조회 - 인덱스/집계 테이블만 읽음 (세션 파일을 읽지 않음)
+        
+        Returns:
+            total_* 합계, 토큰 합계, models/days(세션 단위), agents/tools(이벤트 단위, 이벤트 수 순 상위 top개)
+        """
+        date_from = (datetime.now() - timedelta(days=days_back)).isoformat() if days_back else None
+        try:
+            sessions = self.index.aggregate(group_by=(), date_from=date_from)[0]
+            stats = self.bus.session_stats
+            events = stats.totals(date_from=date_from)
+            return {
+                "total_sessions": sessions["sessions"],
+                "total_events": sessions["events"],
+                "total_messages": sessions["messages"],
+                "total_tools_used": sessions["tools"],
+                "total_bytes": sessions["bytes"],
+                "avg_events_per_session": round(sessions["events"] / sessions["sessions"], 1) if sessions["sessions"] else 0,
+                "total_tokens": events["tokens"],
+                "input_tokens": events["input_tokens"],
+                "output_tokens": events["output_tokens"],
+                "models": self.index.aggregate(group_by=("model",), date_from=date_from),
+                "days": self.index.aggregate(group_by=("day",), date_from=date_from),
+                "agents": stats.query(group_by=("agent_name",), date_from=date_from, order_by="event_count", limit=top),
+                "tools": stats.query(group_by=("tool_name",), date_from=date_from, order_by="event_count", limit=top),
+            }
+        except Exception as e:
+            print(f"Error reading session stats: {e}")
+            return {}
+    
+    def count_sessions(self, **filters) -> int:
+        """조건에 맞는 세션 수"""
+        try:
+            return self.index.count(**filters)
+        except Exception as e:
+            print(f"Error counting sessions: {e}")
+            return 0
 
 # 전역 인스턴스
 _logger: Optional[Logger] = None
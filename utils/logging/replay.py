@@ -1,14 +1,32 @@
 """
 간단한 재현 시스템 - 기존 워크플로우와 동일한 방식으로 재생
+세션 이벤트는 한꺼번에 로드하지 않고 재생하면서 파일에서 하나씩 읽음
 """
 
 import streamlit as st
 import time
 import asyncio
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Iterator, Optional
 
-from src.utils.logging.logger import get_logger, Session
+from src.utils.events import ChatMessage, Event, EventType
+from src.utils.logging.logger import get_logger
+from src.utils.logging.session_log import SessionReader
+
+
+@dataclass
+class ReplaySession:
+    """재현할 세션 - 이벤트는 reader에서 필요할 때 읽음"""
+    session_id: str
+    start_time: str
+    event_count: int
+    reader: SessionReader
+    model: Optional[str] = None
+    
+    def iter_events(self) -> Iterator[Event]:
+        for data in self.reader.events():
+            yield Event.from_dict(data)
 
 class ReplaySystem:
     """재현 시스템 - 추가 UI 없이 기존 워크플로우처럼 재생"""
@@ -19,10 +37,19 @@ class ReplaySystem:
     def start_replay(self, session_id: str) -> bool:
         """재현 시작 - 중복 출력 방지를 위해 기존 메시지 완전히 교체"""
         try:
-            # 세션 로드
-            session = self.logger.load_session(session_id)
-            if not session:
+            # 세션 열기 (이벤트는 재생하면서 읽음)
+            reader = self.logger.open_session(session_id)
+            if not reader:
                 return False
+            info = self.logger.index.get(session_id)
+            header = reader.header
+            session = ReplaySession(
+                session_id=session_id,
+                start_time=header.get("start_time", ""),
+                event_count=info["event_count"] if info else reader.count(),
+                reader=reader,
+                model=header.get("model")
+            )
             
             # 재현 모드 설정
             st.session_state.replay_mode = True
@@ -91,7 +118,7 @@ class ReplaySystem:
     async def execute_replay(self, chat_area, agents_container, chat_ui):
         """재현 실행 - 전체 메시지를 한번에 처리 (순차 출력 제거)"""
         session = st.session_state.get("replay_session")
-        if not session or not session.events:
+        if not session or not session.event_count:
             return
         
         # 재현 시작 메시지
@@ -103,7 +130,7 @@ class ReplaySystem:
             agents_involved = set()
             
             # 전체 이벤트를 한번에 처리
-            for event in session.events:
+            for event in session.iter_events():
                 try:
                     # 이벤트를 프론트엔드 메시지로 변환
                     frontend_message = self._convert_to_frontend_message(event)
@@ -141,61 +168,51 @@ class ReplaySystem:
                 st.session_state.active_agent = active_agent
             
             # 완료
-            status.update(label=f"✅ Replay Complete! Loaded {len(replay_messages)} messages from {len(session.events)} events.", state="complete")
+            status.update(label=f"✅ Replay Complete! Loaded {len(replay_messages)} messages from {session.event_count} events.", state="complete")
     
-    def _convert_to_frontend_message(self, event) -> Optional[Dict[str, Any]]:
+    def _convert_to_frontend_message(self, event: Event) -> Optional[ChatMessage]:
         """이벤트를 프론트엔드 메시지로 변환 - 일반 워크플로우와 동일한 형식"""
         timestamp = datetime.now().isoformat()
         
-        if event.event_type.value == "user_input":
-            return {
-                "type": "user",
-                "content": event.content,
-                "timestamp": timestamp
-            }
+        if event.event_type is EventType.USER_INPUT:
+            return ChatMessage(
+                type="user",
+                content=event.content,
+                id=f"replay_user_{timestamp}"
+            )
         
-        elif event.event_type.value == "agent_response":
-            # 일반 워크플로우와 동일한 AI 메시지 형식
-            frontend_message = {
-                "type": "ai",  # 일반 워크플로우와 동일
-                "agent_id": event.agent_name.lower() if event.agent_name else "agent",
-                "display_name": event.agent_name or "Agent",
-                "avatar": self._get_agent_avatar(event.agent_name),
-                "content": event.content,  # 일반 형식과 동일
-                "timestamp": timestamp,
-                "id": f"replay_agent_{event.agent_name}_{timestamp}"
-            }
-            
-            # Tool calls 정보 복원 (이벤트에 저장되어 있는 경우)
-            if hasattr(event, 'tool_calls') and event.tool_calls:
-                frontend_message["tool_calls"] = event.tool_calls
-            
-            return frontend_message
+        elif event.event_type is EventType.AGENT_RESPONSE:
+            # 일반 워크플로우와 동일한 AI 메시지 형식 (tool calls 정보도 복원)
+            return ChatMessage(
+                type="ai",  # 일반 워크플로우와 동일
+                agent_id=event.agent_name.lower() if event.agent_name else "agent",
+                display_name=event.agent_name or "Agent",
+                avatar=self._get_agent_avatar(event.agent_name),
+                content=event.content,  # 일반 형식과 동일
+                id=f"replay_agent_{event.agent_name}_{timestamp}",
+                tool_calls=event.tool_calls
+            )
         
-        elif event.event_type.value == "tool_command":
+        elif event.event_type is EventType.TOOL_COMMAND:
             # 도구 명령 - 일반 tool 메시지 형식과 동일
-            return {
-                "type": "tool",
-                "tool_display_name": event.tool_name or "Tool",
-                "content": f"Command: {event.content}",
-                "timestamp": timestamp,
-                "id": f"replay_tool_cmd_{event.tool_name}_{timestamp}"
-            }
+            return ChatMessage(
+                type="tool",
+                tool_display_name=event.tool_name or "Tool",
+                content=f"Command: {event.content}",
+                id=f"replay_tool_cmd_{event.tool_name}_{timestamp}"
+            )
         
-        elif event.event_type.value == "tool_output":
+        elif event.event_type is EventType.TOOL_OUTPUT:
             # 도구 출력 - 일반 tool 메시지 형식과 동일
-            return {
-                "type": "tool",
-                "tool_display_name": event.tool_name or "Tool Output",
-                "content": event.content,
-                "timestamp": timestamp,
-                "id": f"replay_tool_out_{event.tool_name}_{timestamp}"
-            }
+            return ChatMessage(
+                type="tool",
+                tool_display_name=event.tool_name or "Tool Output",
+                content=event.content,
+                id=f"replay_tool_out_{event.tool_name}_{timestamp}"
+            )
         
         return None
     
-
-    
     def _get_agent_avatar(self, agent_name: str) -> str:
         """에이전트 아바타 반환"""
         if not agent_name:
@@ -0,0 +1,268 @@
+"""
+세션 로그 전문 검색 인덱스 (SQLite FTS5 역색인)
+이벤트 내용, 에이전트 이름, 도구 이름을 색인해 어떤 세션에서 특정 호스트/서비스가 나왔는지 바로 검색
+
+- 이벤트 버스 sink로 등록되어 writer 스레드에서 색인 (배치마다 한 트랜잭션으로 commit)
+- 순위는 bm25 (에이전트/도구 이름 일치에 가중치), 결과마다 일치 부분 snippet 포함
+- search(): 이벤트 단위 결과, search_sessions(): 세션별로 묶은 결과 (히스토리 페이지 / CLI)
+- 인덱스 파일이 새로 만들어지면 세션 인덱스에 있는 기존 로그로 한 번 채움
+
+    python -m src.utils.logging.search_index "192.168.1.10 ssh"
+
+환경변수:
+- LOG_SEARCH: 검색 인덱스 사용 여부 (기본 true)
+- LOG_SEARCH_PATH: 인덱스 파일 경로 (기본 <logs>/search.sqlite)
+- LOG_SEARCH_MAX_CHARS: 이벤트당 색인할 최대 글자 수 (기본 20000)
+"""
+
+import os
+import re
+import sqlite3
+import logging
+import argparse
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.logging.session_log import SessionReader
+from src.utils.logging.sinks import EventSink
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS events USING fts5(
+    content,
+    agent_name,
+    tool_name,
+    session_id UNINDEXED,
+    event_index UNINDEXED,
+    event_type UNINDEXED,
+    timestamp UNINDEXED,
+    tokenize = "unicode61 tokenchars '_-'"
+);
+"""
+
+# bm25 컬럼 가중치 (content, agent_name, tool_name)
+BM25_WEIGHTS = (1.0, 4.0, 4.0)
+SNIPPET_TOKENS = 16
+_TERM_RE = re.compile(r'"[^"]+"|\S+')
+
+
+def is_search_enabled() -> bool:
+    return os.getenv("LOG_SEARCH", "true").lower() == "true"
+
+
+def to_match_query(query: str) -> str:
+    """사용자 입력 → FTS5 MATCH 식 (각 단어를 구문으로 감싸 AND 검색, 끝에 *가 있으면 접두어 검색)
+    IP 주소나 경로처럼 구분자가 들어간 단어도 연속된 토큰으로 검색됨"""
+    terms = []
+    for term in _TERM_RE.findall(query):
+        prefix = term.endswith("*") and not term.startswith('"')
+        term = term.strip('"').rstrip("*").replace('"', '""')
+        if term:
+            terms.append(f'"{term}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+class SessionSearchIndex(EventSink):
+    """세션 이벤트 역색인 - EventBus sink로 등록해 기록과 함께 색인"""
+
+    def __init__(self, base_path: Path, path: Optional[str] = None, max_chars: Optional[int] = None):
+        self.base_path = Path(base_path)
+        self.path = Path(path or os.getenv("LOG_SEARCH_PATH") or self.base_path / "search.sqlite")
+        self.max_chars = max_chars or int(os.getenv("LOG_SEARCH_MAX_CHARS", "20000"))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.created = not self.path.exists()
+
+        self._lock = threading.RLock()
+        self._pending: List[Tuple[Any, ...]] = []
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    # ------------------------------------------------------------------
+    # 색인
+    # ------------------------------------------------------------------
+    def add(self, session_id: str, event_index: int, event: Dict[str, Any]):
+        """이벤트 하나를 색인 대기열에 추가 (flush() 시 한 번에 commit)"""
+        content = event.get("content") or ""
+        with self._lock:
+            self._pending.append((
+                content[:self.max_chars],
+                event.get("agent_name") or "",
+                event.get("tool_name") or "",
+                session_id,
+                event_index,
+                event.get("event_type"),
+                event.get("timestamp"),
+            ))
+
+    def flush(self):
+        with self._lock:
+            if not self._pending:
+                return
+            rows, self._pending = self._pending, []
+            self.conn.execute("BEGIN")
+            self.conn.executemany(
+                "INSERT INTO events (content, agent_name, tool_name, session_id, event_index, event_type, timestamp) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self.conn.execute("COMMIT")
+
+    def on_event(self, channel, index: int, record: Dict[str, Any], line: str):
+        self.add(channel.session_id, index, record)
+
+    def on_batch_end(self):
+        self.flush()
+
+    def on_session_removed(self, session_id: str):
+        self.remove(session_id)
+
+    def index_session(self, session_id: str, reader: SessionReader) -> int:
+        """저장된 세션 전체 색인 (기존 로그 채우기용)"""
+        self.remove(session_id)
+        count = 0
+        for event_index, event in enumerate(reader.events()):
+            self.add(session_id, event_index, event)
+            count += 1
+        self.flush()
+        return count
+
+    def remove(self, session_id: str):
+        with self._lock:
+            self._pending = [row for row in self._pending if row[3] != session_id]
+            self.conn.execute("DELETE FROM events WHERE session_id = ?", (session_id,))
+
+    def rebuild(self, session_index) -> int:
+        """세션 인덱스에 있는 모든 세션을 다시 색인"""
+        with self._lock:
+            self.conn.execute("DELETE FROM events")
+        indexed = 0
+        for row in session_index.oldest(limit=1 << 30):
+            try:
+                self.index_session(row["session_id"], SessionReader(row["file_path"]))
+                indexed += 1
+            except Exception as e:
+                logger.warning(f"Failed to index session {row['session_id']}: {e}")
+        logger.info(f"Search index rebuilt with {indexed} sessions")
+        return indexed
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+    def search(self, query: str, limit: int = 20, offset: int = 0, session_id: Optional[str] = None,
+               agent_name: Optional[str] = None, tool_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """이벤트 단위 검색 (관련도 순)"""
+        match = to_match_query(query)
+        if not match:
+            return []
+        clauses, params = ["events MATCH ?"], [match]
+        if session_id:
+            clauses.append("session_id = ?")
+            params.append(session_id)
+        if agent_name:
+            clauses.append("agent_name = ?")
+            params.append(agent_name)
+        if tool_name:
+            clauses.append("tool_name = ?")
+            params.append(tool_name)
+        sql = (
+            "SELECT session_id, event_index, event_type, agent_name, tool_name, timestamp, "
+            f"snippet(events, 0, '[', ']', ' … ', {SNIPPET_TOKENS}) AS snippet, "
+            f"bm25(events, {', '.join(map(str, BM25_WEIGHTS))}) AS rank "
+            f"FROM events WHERE {' AND '.join(clauses)} ORDER BY rank LIMIT ? OFFSET ?"
+        )
+        self.flush()
+        with self._lock:
+            rows = self.conn.execute(sql, (*params, limit, offset)).fetchall()
+        return [
+            {**{key: row[key] for key in row.keys() if key != "rank"}, "score": -row["rank"]}
+            for row in rows
+        ]
+
+    def search_sessions(self, query: str, limit: int = 20, offset: int = 0) -> List[Dict[str, Any]]:
+        """세션 단위 검색 - 세션별 일치 이벤트 수, 최고 점수, 가장 관련도 높은 snippet"""
+        match = to_match_query(query)
+        if not match:
+            return []
+        weights = ", ".join(map(str, BM25_WEIGHTS))
+        # 세션별 최고 순위 이벤트만 고른 뒤 그 이벤트들에 대해서만 snippet 생성
+        ranked_sql = (
+            "WITH hits AS ("
+            f"  SELECT rowid, session_id, event_index, bm25(events, {weights}) AS rank "
+            "  FROM events WHERE events MATCH ?"
+            "), ranked AS ("
+            "  SELECT *, ROW_NUMBER() OVER (PARTITION BY session_id ORDER BY rank) AS position, "
+            "  COUNT(*) OVER (PARTITION BY session_id) AS hit_count FROM hits"
+            ") SELECT rowid, session_id, event_index, rank, hit_count FROM ranked "
+            "WHERE position = 1 ORDER BY rank LIMIT ? OFFSET ?"
+        )
+        self.flush()
+        with self._lock:
+            rows = self.conn.execute(ranked_sql, (match, limit, offset)).fetchall()
+            snippets = {}
+            if rows:
+                placeholders = ", ".join("?" * len(rows))
+                snippets = dict(self.conn.execute(
+                    f"SELECT rowid, snippet(events, 0, '[', ']', ' … ', {SNIPPET_TOKENS}) FROM events "
+                    f"WHERE events MATCH ? AND rowid IN ({placeholders})",
+                    (match, *[row["rowid"] for row in rows]),
+                ).fetchall())
+        return [
+            {
+                "session_id": row["session_id"],
+                "event_index": row["event_index"],
+                "snippet": snippets.get(row["rowid"], ""),
+                "hit_count": row["hit_count"],
+                "score": -row["rank"],
+            }
+            for row in rows
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            events = self.conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+        return {"events": events, "pending": len(self._pending), "path": str(self.path)}
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self.conn.close()
+
+
+def main():
+    from src.utils.logging.session_index import SessionIndex
+
+    parser = argparse.ArgumentParser(description="Full-text search over session logs")
+    parser.add_argument("query", nargs="?", default="")
+    parser.add_argument("--logs", default="logs", help="session log directory")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--events", action="store_true", help="show matching events instead of sessions")
+    parser.add_argument("--rebuild", action="store_true", help="re-index every session first")
+    args = parser.parse_args()
+
+    session_index = SessionIndex(Path(args.logs))
+    search_index = SessionSearchIndex(Path(args.logs))
+    if args.rebuild or search_index.created:
+        print(f"Indexed {search_index.rebuild(session_index)} sessions")
+    if not args.query:
+        return
+
+    if args.events:
+        for hit in search_index.search(args.query, limit=args.limit):
+            source = hit["agent_name"] or hit["tool_name"] or hit["event_type"]
+            print(f"{hit['score']:6.2f}  {hit['session_id'][:8]} #{hit['event_index']:<5} {source}: {hit['snippet']}")
+        return
+
+    for hit in search_index.search_sessions(args.query, limit=args.limit):
+        info = session_index.get(hit["session_id"]) or {}
+        start_time = (info.get("start_time") or "")[:19].replace("T", " ")
+        print(f"{hit['score']:6.2f}  {hit['session_id'][:8]}  {start_time}  {hit['hit_count']} hits")
+        print(f"        {hit['snippet']}")
+
+
+if __name__ == "__main__":
+    main()
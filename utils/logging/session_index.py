@@ -0,0 +1,293 @@
+"""
+세션 메타데이터 인덱스 (SQLite, WAL)
+세션 목록 조회 때마다 logs/**/session_*.json*을 모두 읽어 파싱하는 대신
+저장 시점에 세션 요약 한 행을 갱신하고 목록/검색은 인덱스만 조회
+
+- sessions 테이블: 세션 ID → 파일 경로, 시작/종료 시각, 모델, 이벤트 수, 미리보기 등
+- query(): 날짜/모델/이벤트 수 필터 + 정렬 + 페이지 (limit/offset)
+- get_path(): 세션 ID → 파일 경로 O(1) (rglob 대체), find_path(): 인덱스에 없으면 디렉토리 검색
+- aggregate(): 날짜/모델별 세션 수, 이벤트 수 집계 (이벤트 단위 집계는 session_stats 참고)
+- 인덱스 파일이 새로 만들어지면 기존 로그 파일로 한 번 채움 (rebuild)
+
+환경변수:
+- SESSION_INDEX_PATH: 인덱스 파일 경로 (기본 <logs>/sessions.sqlite)
+"""
+
+import os
+import copy
+import json
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.utils.logging.session_log import (
+    SESSION_FILE_GLOB, is_session_file, read_session_file, session_id_from_path
+)
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    file_path TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT,
+    model TEXT,
+    event_count INTEGER NOT NULL DEFAULT 0,
+    message_count INTEGER NOT NULL DEFAULT 0,
+    tool_count INTEGER NOT NULL DEFAULT 0,
+    agents TEXT NOT NULL DEFAULT '[]',
+    preview TEXT,
+    file_size INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS sessions_start_time ON sessions (start_time);
+CREATE INDEX IF NOT EXISTS sessions_model ON sessions (model, start_time);
+"""
+# 이전 버전 인덱스에 없는 컬럼 (없으면 추가)
+MIGRATIONS = {
+    "file_size": "ALTER TABLE sessions ADD COLUMN file_size INTEGER NOT NULL DEFAULT 0",
+}
+
+SORT_COLUMNS = {"start_time", "end_time", "event_count", "message_count", "tool_count", "model"}
+# aggregate() group_by → SQL 식
+AGGREGATE_COLUMNS = {"day": "substr(start_time, 1, 10)", "model": "model"}
+PREVIEW_LENGTH = 100
+NO_PREVIEW = "No user input found"
+
+
+class SessionSummary:
+    """이벤트를 하나씩 받아 세션 요약(인덱스 한 행)을 누적"""
+
+    def __init__(self, session_id: str, start_time: str, model: Optional[str] = None):
+        self.session_id = session_id
+        self.start_time = start_time
+        self.end_time: Optional[str] = None
+        self.model = model
+        self.event_count = 0
+        self.message_count = 0
+        self.tool_count = 0
+        self.agents: List[str] = []
+        self.preview: Optional[str] = None
+
+    def add(self, event: Dict[str, Any]):
+        event_type = event.get("event_type")
+        self.event_count += 1
+        if event_type in ("user_input", "agent_response"):
+            self.message_count += 1
+        elif event_type in ("tool_command", "tool_output"):
+            self.tool_count += 1
+        agent_name = event.get("agent_name")
+        if agent_name and agent_name not in self.agents:
+            self.agents.append(agent_name)
+        if self.preview is None and event_type == "user_input":
+            content = event.get("content", "")
+            self.preview = content[:PREVIEW_LENGTH] + ("..." if len(content) > PREVIEW_LENGTH else "")
+
+    def copy(self) -> "SessionSummary":
+        """다른 스레드에서 기록할 스냅샷"""
+        snapshot = copy.copy(self)
+        snapshot.agents = list(self.agents)
+        return snapshot
+
+    @classmethod
+    def from_session_data(cls, data: Dict[str, Any]) -> "SessionSummary":
+        summary = cls(data["session_id"], data["start_time"], data.get("model"))
+        summary.end_time = data.get("end_time")
+        for event in data.get("events", []):
+            summary.add(event)
+        return summary
+
+
+def _row_to_info(row: sqlite3.Row) -> Dict[str, Any]:
+    info = dict(row)
+    info["agents"] = json.loads(info["agents"])
+    info["preview"] = info["preview"] or NO_PREVIEW
+    return info
+
+
+class SessionIndex:
+    """세션 메타데이터 SQLite 인덱스"""
+
+    def __init__(self, base_path: Path, path: Optional[str] = None):
+        self.base_path = Path(base_path)
+        self.path = Path(path or os.getenv("SESSION_INDEX_PATH") or self.base_path / "sessions.sqlite")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        created = not self.path.exists()
+
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(sessions)")}
+        for column, statement in MIGRATIONS.items():
+            if column not in columns:
+                self.conn.execute(statement)
+        if created:
+            self.rebuild()
+
+    def upsert(self, summary: SessionSummary, file_path: Path):
+        """세션 요약 저장 (저장/종료/압축 시 호출)"""
+        try:
+            file_size = Path(file_path).stat().st_size
+        except OSError:
+            file_size = 0
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sessions (session_id, file_path, start_time, end_time, model, "
+                "event_count, message_count, tool_count, agents, preview, file_size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    summary.session_id, str(file_path), summary.start_time, summary.end_time, summary.model,
+                    summary.event_count, summary.message_count, summary.tool_count,
+                    json.dumps(summary.agents, ensure_ascii=False), summary.preview, file_size,
+                ),
+            )
+
+    def remove(self, session_id: str):
+        with self._lock:
+            self.conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    def get_path(self, session_id: str) -> Optional[Path]:
+        """세션 ID → 파일 경로 (파일이 사라졌으면 인덱스에서도 제거)"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT file_path FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        file_path = Path(row["file_path"])
+        if not file_path.exists():
+            self.remove(session_id)
+            return None
+        return file_path
+
+    def find_path(self, session_id: str) -> Optional[Path]:
+        """세션 ID → 파일 경로 - 인덱스 조회, 인덱스에 없으면 (직접 복사해 넣은 로그, 이전 형식 등) 디렉토리 검색"""
+        file_path = self.get_path(session_id)
+        if file_path is not None:
+            return file_path
+        for file_path in self.base_path.rglob(f"session_{session_id}.json*"):
+            if is_session_file(file_path) and session_id_from_path(file_path) == session_id:
+                return file_path
+        return None
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM sessions WHERE session_id = ?", (session_id,)).fetchone()
+        return _row_to_info(row) if row else None
+
+    def _where(self, date_from: Optional[str], date_to: Optional[str], model: Optional[str],
+               min_events: Optional[int], max_events: Optional[int]):
+        clauses, params = [], []
+        if date_from:
+            clauses.append("start_time >= ?")
+            params.append(date_from)
+        if date_to:
+            clauses.append("start_time < ?")
+            params.append(date_to)
+        if model:
+            clauses.append("model = ?")
+            params.append(model)
+        if min_events is not None:
+            clauses.append("event_count >= ?")
+            params.append(min_events)
+        if max_events is not None:
+            clauses.append("event_count <= ?")
+            params.append(max_events)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, limit: int = 20, offset: int = 0, sort_by: str = "start_time", descending: bool = True,
+              date_from: Optional[str] = None, date_to: Optional[str] = None, model: Optional[str] = None,
+              min_events: Optional[int] = None, max_events: Optional[int] = None) -> List[Dict[str, Any]]:
+        """세션 목록 페이지 조회
+
+        Args:
+            date_from / date_to: ISO 시각 문자열 (start_time 기준, date_to는 미포함)
+            sort_by: start_time, end_time, event_count, message_count, tool_count, model
+        """
+        if sort_by not in SORT_COLUMNS:
+            raise ValueError(f"Unsupported sort column: {sort_by}")
+        where, params = self._where(date_from, date_to, model, min_events, max_events)
+        order = "DESC" if descending else "ASC"
+        sql = f"SELECT * FROM sessions{where} ORDER BY {sort_by} {order}, session_id LIMIT ? OFFSET ?"
+        with self._lock:
+            rows = self.conn.execute(sql, (*params, limit, offset)).fetchall()
+        return [_row_to_info(row) for row in rows]
+
+    def count(self, date_from: Optional[str] = None, date_to: Optional[str] = None, model: Optional[str] = None,
+              min_events: Optional[int] = None, max_events: Optional[int] = None) -> int:
+        where, params = self._where(date_from, date_to, model, min_events, max_events)
+        with self._lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM sessions{where}", params).fetchone()[0]
+
+    def aggregate(self, group_by=("day",), date_from: Optional[str] = None, date_to: Optional[str] = None,
+                  model: Optional[str] = None) -> List[Dict[str, Any]]:
+        """세션 단위 집계 (세션 수, 이벤트/메시지/도구 수, 파일 크기) - 인덱스 행만 읽음
+
+        Args:
+            group_by: day, model 중 0개 이상 (빈 값이면 전체 합계 한 행)
+        """
+        columns = []
+        for column in group_by:
+            if column not in AGGREGATE_COLUMNS:
+                raise ValueError(f"Unsupported group column: {column}")
+            columns.append(f"{AGGREGATE_COLUMNS[column]} AS {column}")
+        where, params = self._where(date_from, date_to, model, None, None)
+        sql = (
+            f"SELECT {''.join(c + ', ' for c in columns)}COUNT(*) AS sessions, "
+            "COALESCE(SUM(event_count), 0) AS events, COALESCE(SUM(message_count), 0) AS messages, "
+            "COALESCE(SUM(tool_count), 0) AS tools, COALESCE(SUM(file_size), 0) AS bytes "
+            f"FROM sessions{where}"
+        )
+        if group_by:
+            sql += f" GROUP BY {', '.join(group_by)} ORDER BY {', '.join(group_by)}"
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def total_size(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COALESCE(SUM(file_size), 0) FROM sessions").fetchone()[0]
+
+    def oldest(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """오래된 세션부터 (보존 정책용)"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT session_id, file_path, start_time, end_time, file_size FROM sessions "
+                "ORDER BY start_time LIMIT ?", (limit,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def models(self) -> List[str]:
+        with self._lock:
+            rows = self.conn.execute("SELECT DISTINCT model FROM sessions WHERE model IS NOT NULL ORDER BY model")
+            return [row[0] for row in rows]
+
+    def rebuild(self) -> int:
+        """로그 디렉토리를 한 번 훑어 인덱스를 다시 채움 (인덱스가 없거나 손상된 경우)"""
+        indexed = 0
+        with self._lock:
+            self.conn.execute("BEGIN")
+            self.conn.execute("DELETE FROM sessions")
+            for session_file in self.base_path.rglob(SESSION_FILE_GLOB):
+                if not is_session_file(session_file):
+                    continue
+                try:
+                    summary = SessionSummary.from_session_data(read_session_file(session_file, resolve=False))
+                except Exception as e:
+                    logger.warning(f"Skipping unreadable session file {session_file}: {e}")
+                    continue
+                if summary.event_count:
+                    self.upsert(summary, session_file)
+                    indexed += 1
+            self.conn.execute("COMMIT")
+        logger.info(f"Session index rebuilt with {indexed} sessions")
+        return indexed
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
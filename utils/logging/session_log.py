@@ -0,0 +1,340 @@
+"""
+Append-only JSONL 세션 로그
+한 줄에 레코드 하나 - 첫 줄은 헤더, 이후 이벤트, 세션 종료 시 푸터
+
+    {"record": "header", "format": "decepticon-session", "version": 2, "session_id": ..., "start_time": ..., "model": ...}
+    {"event_type": "user_input", "timestamp": ..., "content": ...}
+    ...
+    {"record": "footer", "end_time": ..., "event_count": ...}
+
+- 이벤트마다 한 줄을 추가하므로 기록 비용이 세션 길이와 무관 (O(1))
+- 프로세스가 중간에 죽어도 이미 기록된 줄은 그대로 남고, 잘린 마지막 줄은 읽을 때 무시
+- 푸터는 한 번의 write + fsync로 기록 (푸터가 없으면 종료되지 않은 세션)
+- 이전 형식(session_*.json, indent=2 JSON)도 그대로 읽음
+- 종료된 세션은 gzip(.jsonl.gz) 또는 zstd(.jsonl.zst)로 압축 가능 - 읽기는 확장자로 판단해 투명하게 처리
+  압축 파일도 헤더를 포함한 같은 JSONL이므로 그대로 공유하고 다른 사람의 logs/에 넣어 재현 가능
+- 큰 도구 출력은 content 대신 blob 참조(content_ref)로 기록될 수 있음 - 읽을 때 해당 이벤트의 blob만 읽어 채움 (blob_store 참고)
+"""
+
+import io
+import os
+import gzip
+import json
+import logging
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional
+
+try:
+    import zstandard
+except ImportError:  # zstd는 선택 의존성
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+SESSION_FORMAT = "decepticon-session"
+SESSION_FORMAT_VERSION = 2
+JSONL_SUFFIX = ".jsonl"
+LEGACY_SUFFIX = ".json"
+# 헤더/푸터 줄은 항상 "record" 키로 시작 (_dumps가 키 순서를 유지)
+RECORD_PREFIX = b'{"record":'
+# 압축 방식 → 확장자
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+# rglob 패턴 - 새 형식(.jsonl), 이전 형식(.json), 압축 파일(.jsonl.gz/.jsonl.zst) 모두 포함
+SESSION_FILE_GLOB = "session_*.json*"
+
+
+def _split_compression(path: Path):
+    """(압축 해제 후 파일 이름, 압축 방식)"""
+    name = Path(path).name
+    for method, suffix in COMPRESSION_SUFFIXES.items():
+        if name.endswith(suffix):
+            return name[:-len(suffix)], method
+    return name, None
+
+
+def is_session_file(path: Path) -> bool:
+    """세션 로그 파일인지 (압축 중인 임시 파일 등 제외)"""
+    name = _split_compression(path)[0]
+    return name.startswith("session_") and name.endswith((JSONL_SUFFIX, LEGACY_SUFFIX))
+
+
+def is_compressed(path: Path) -> bool:
+    return _split_compression(path)[1] is not None
+
+
+def _open_binary(path: Path) -> IO[bytes]:
+    method = _split_compression(path)[1]
+    if method == "gzip":
+        return gzip.open(path, "rb")
+    if method == "zstd":
+        if zstandard is None:
+            raise RuntimeError(f"zstandard is required to read {path}")
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True))
+    return open(path, "rb")
+
+
+def open_session_file(path: Path) -> IO[str]:
+    """세션 파일을 텍스트로 열기 (압축 여부는 확장자로 판단)"""
+    method = _split_compression(path)[1]
+    if method == "gzip":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if method == "zstd":
+        return io.TextIOWrapper(_open_binary(path), encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def compress_session_file(path: Path, method: str = "gzip", level: Optional[int] = None) -> Path:
+    """종료된 세션 파일 압축 - 임시 파일에 쓴 뒤 rename하고 원본 삭제 (중간에 실패해도 원본 유지)"""
+    path = Path(path)
+    if method not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported log compression: {method}")
+    if method == "zstd" and zstandard is None:
+        raise RuntimeError("zstandard is required for zstd log compression")
+    target = path.with_name(path.name + COMPRESSION_SUFFIXES[method])
+    temp = target.with_name(target.name + ".tmp")
+    with open(path, "rb") as src, open(temp, "wb") as raw:
+        if method == "gzip":
+            with gzip.GzipFile(filename="", mode="wb", fileobj=raw, compresslevel=level or 6, mtime=0) as dst:
+                while chunk := src.read(1 << 20):
+                    dst.write(chunk)
+        else:
+            zstandard.ZstdCompressor(level=level or 10).copy_stream(src, raw)
+        raw.flush()
+        os.fsync(raw.fileno())
+    os.replace(temp, target)
+    path.unlink()
+    return target
+
+
+def session_id_from_path(path: Path) -> str:
+    """파일 이름에서 세션 ID 추출 (session_<id>.jsonl / session_<id>.json / 압축 확장자 포함)"""
+    name = _split_compression(path)[0]
+    for suffix in (JSONL_SUFFIX, LEGACY_SUFFIX):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+            break
+    return name[len("session_"):] if name.startswith("session_") else name
+
+
+def _dumps(record: Dict[str, Any]) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+
+
+def encode_record(record: Dict[str, Any]) -> str:
+    """레코드 → JSONL 한 줄 (줄바꿈 포함)"""
+    return _dumps(record) + "\n"
+
+
+class SessionLogWriter:
+    """세션 하나의 JSONL 파일에 레코드를 추가하는 writer (첫 이벤트 때 파일 생성)"""
+
+    def __init__(self, path: Path, header: Dict[str, Any]):
+        self.path = Path(path)
+        self.header = header
+        self.event_count = 0
+        self.finalized = False
+        self._file = None
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        if self._file.tell() == 0:
+            self._file.write(_dumps({
+                "record": "header",
+                "format": SESSION_FORMAT,
+                "version": SESSION_FORMAT_VERSION,
+                **self.header,
+            }) + "\n")
+
+    def append(self, record: Dict[str, Any], flush: bool = True):
+        """이벤트 한 줄 추가 - flush=True면 바로 OS 버퍼까지 (배치 기록 시에는 flush()를 따로 호출)"""
+        self.append_line(encode_record(record), flush=flush)
+
+    def append_line(self, line: str, flush: bool = True):
+        """이미 직렬화된 이벤트 한 줄 추가 (encode_record 결과)"""
+        if self.finalized:
+            raise ValueError(f"Session log {self.path} is already finalized")
+        if self._file is None:
+            self._open()
+        self._file.write(line)
+        if flush:
+            self._file.flush()
+        self.event_count += 1
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def sync(self):
+        """디스크까지 기록 (fsync)"""
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def finalize(self, footer: Dict[str, Any]) -> bool:
+        """푸터를 기록하고 파일을 닫음 - 이벤트가 없던 세션은 파일을 만들지 않음"""
+        if self.finalized:
+            return False
+        self.finalized = True
+        if self._file is None:
+            return False
+        self._file.write(_dumps({"record": "footer", "event_count": self.event_count, **footer}) + "\n")
+        self.sync()
+        self._file.close()
+        self._file = None
+        return True
+
+
+def iter_session_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """JSONL 세션 파일의 레코드를 순서대로 반환 (잘리거나 깨진 줄은 건너뜀)"""
+    with open_session_file(path) as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping malformed line {line_number} in {path}")
+
+
+def _blob_store(path: Path):
+    # blob_store는 sinks를 통해 이 모듈을 import하므로 필요할 때 import
+    from src.utils.logging.blob_store import BlobStore
+    return BlobStore.for_session_file(path)
+
+
+def read_session_file(path: Path, resolve: bool = True) -> Optional[Dict[str, Any]]:
+    """세션 파일을 이전 형식과 같은 dict({"session_id", "start_time", "events", ...})로 읽음
+
+    resolve=False면 blob 참조(content_ref)를 그대로 둠 (요약/인덱스처럼 도구 출력 내용이 필요 없을 때)
+    """
+    path = Path(path)
+    blobs = None
+    if _split_compression(path)[0].endswith(LEGACY_SUFFIX):
+        with open_session_file(path) as f:
+            return json.load(f)
+
+    session: Dict[str, Any] = {"session_id": session_id_from_path(path), "start_time": "", "events": []}
+    for record in iter_session_records(path):
+        kind = record.pop("record", None)
+        if kind == "header":
+            record.pop("format", None)
+            record.pop("version", None)
+            session.update(record)
+        elif kind == "footer":
+            session["end_time"] = record.get("end_time")
+        else:
+            if resolve and "content_ref" in record:
+                blobs = blobs or _blob_store(path)
+                blobs.resolve(record)
+            session["events"].append(record)
+    return session
+
+
+class SessionReader:
+    """세션 이벤트를 필요할 때만 읽는 스트리밍 reader (세션 전체를 메모리에 올리지 않음)
+
+    - events(offset, limit): offset번째 이벤트부터 차례로 반환 - 건너뛰는 줄은 JSON 파싱하지 않음
+    - 순차로 읽는 동안 SEEK_EVERY개 이벤트마다 파일 위치를 기억해 두고 이후 offset 조회에서 바로 seek
+      (gzip은 압축 해제 스트림 위치로 seek, zstd는 seek 없이 처음부터 건너뜀)
+    - 이전 형식(.json)은 스트리밍할 수 없어 처음 읽을 때 한 번 전부 로드
+    - blob 참조는 그 이벤트를 반환할 때 읽음 (blobs를 넘기지 않으면 <logs>/blobs)
+    """
+
+    SEEK_EVERY = 1024
+
+    def __init__(self, path: Path, blobs=None):
+        self.path = Path(path)
+        self._blobs = blobs
+        name, method = _split_compression(self.path)
+        self.legacy = name.endswith(LEGACY_SUFFIX)
+        self.seekable = method != "zstd"
+        self._header: Optional[Dict[str, Any]] = None
+        self._legacy_data: Optional[Dict[str, Any]] = None
+        # _positions[i] = (i * SEEK_EVERY)번째 이벤트 줄의 시작 위치
+        self._positions: List[int] = []
+
+    def _load_legacy(self) -> Dict[str, Any]:
+        if self._legacy_data is None:
+            self._legacy_data = read_session_file(self.path)
+        return self._legacy_data
+
+    @property
+    def header(self) -> Dict[str, Any]:
+        """세션 정보 (session_id, start_time, model) - 첫 줄만 읽음"""
+        if self._header is None:
+            if self.legacy:
+                data = self._load_legacy()
+                self._header = {key: value for key, value in data.items() if key != "events"}
+            else:
+                self._header = {"session_id": session_id_from_path(self.path), "start_time": ""}
+                with _open_binary(self.path) as f:
+                    line = f.readline()
+                if line.startswith(RECORD_PREFIX):
+                    record = json.loads(line)
+                    for key in ("record", "format", "version"):
+                        record.pop(key, None)
+                    self._header.update(record)
+        return self._header
+
+    @property
+    def blobs(self):
+        if self._blobs is None:
+            self._blobs = _blob_store(self.path)
+        return self._blobs
+
+    def events(self, offset: int = 0, limit: Optional[int] = None,
+               resolve: bool = True) -> Iterator[Dict[str, Any]]:
+        """offset번째 이벤트부터 최대 limit개 이벤트 dict를 차례로 반환 (resolve=False면 blob 참조를 그대로 둠)"""
+        if limit is not None and limit <= 0:
+            return
+        if self.legacy:
+            events = self._load_legacy().get("events", [])
+            end = None if limit is None else offset + limit
+            yield from events[offset:end]
+            return
+
+        yielded = 0
+        with _open_binary(self.path) as f:
+            index = 0
+            slot = min(offset // self.SEEK_EVERY, len(self._positions) - 1) if self.seekable else -1
+            if slot > 0:
+                f.seek(self._positions[slot])
+                index = slot * self.SEEK_EVERY
+            while True:
+                position = f.tell() if self.seekable else 0
+                line = f.readline()
+                if not line:
+                    return
+                if line.startswith(RECORD_PREFIX) or not line.strip():
+                    continue
+                if self.seekable and index == len(self._positions) * self.SEEK_EVERY:
+                    self._positions.append(position)
+                if index >= offset:
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping malformed event {index} in {self.path}")
+                    else:
+                        if resolve and "content_ref" in event:
+                            self.blobs.resolve(event)
+                        yield event
+                        yielded += 1
+                        if limit is not None and yielded >= limit:
+                            return
+                index += 1
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.events()
+
+    def count(self) -> int:
+        """이벤트 수 (JSON 파싱 없이 줄 수만 셈)"""
+        if self.legacy:
+            return len(self._load_legacy().get("events", []))
+        count = 0
+        with _open_binary(self.path) as f:
+            for line in f:
+                if line.strip() and not line.startswith(RECORD_PREFIX):
+                    count += 1
+        return count
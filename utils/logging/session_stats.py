@@ -0,0 +1,222 @@
+"""
+세션 이벤트 통계 (날짜/모델/에이전트/도구별 누적 집계)
+이벤트를 받을 때마다 집계를 갱신해 세션 인덱스와 같은 SQLite 파일(sessions.sqlite)에 저장
+통계 화면/CLI는 세션 파일을 읽지 않고 집계 행만 조회
+
+- event_stats 테이블: (날짜, 모델, 에이전트, 도구, 이벤트 타입) → 이벤트 수, 내용 글자 수, 토큰, 소요 시간
+- 토큰: 모델이 보고한 사용량(usage)이 있으면 그 합, 없으면 내용 글자 수 / 4 추정치
+  (input_tokens / output_tokens는 보고된 사용량만)
+- 소요 시간: 같은 세션의 직전 이벤트(없으면 세션 시작)부터 이 이벤트까지
+  에이전트 응답 ≈ 모델 응답 시간, 도구 출력 ≈ 도구 실행 시간 (사용자 입력은 0)
+- 배치마다 한 트랜잭션으로 UPSERT, 보존 정책으로 세션이 삭제되어도 집계는 유지 (이력 통계)
+- 테이블이 새로 만들어지면 인덱스에 있는 기존 세션으로 한 번 채움
+"""
+
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.logging.session_index import SessionIndex
+from src.utils.logging.session_log import SessionReader
+from src.utils.logging.sinks import EventSink
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS event_stats (
+    day TEXT NOT NULL,
+    model TEXT NOT NULL,
+    agent_name TEXT NOT NULL,
+    tool_name TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    event_count INTEGER NOT NULL DEFAULT 0,
+    content_chars INTEGER NOT NULL DEFAULT 0,
+    tokens INTEGER NOT NULL DEFAULT 0,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    duration_ms INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, model, agent_name, tool_name, event_type)
+) WITHOUT ROWID;
+"""
+
+GROUP_COLUMNS = ("day", "model", "agent_name", "tool_name", "event_type")
+VALUE_COLUMNS = ("event_count", "content_chars", "tokens", "input_tokens", "output_tokens", "duration_ms")
+# 사용량 보고가 없는 이벤트의 토큰 추정 (count_tokens_approximately 기본값과 동일)
+CHARS_PER_TOKEN = 4
+
+_UPSERT = (
+    f"INSERT INTO event_stats ({', '.join(GROUP_COLUMNS + VALUE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * (len(GROUP_COLUMNS) + len(VALUE_COLUMNS)))}) "
+    f"ON CONFLICT ({', '.join(GROUP_COLUMNS)}) DO UPDATE SET "
+    + ", ".join(f"{column} = {column} + excluded.{column}" for column in VALUE_COLUMNS)
+)
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+class SessionStats(EventSink):
+    """이벤트 통계 집계 - EventBus sink로 등록해 기록과 함께 갱신"""
+
+    def __init__(self, index: SessionIndex):
+        self.index = index
+        self._lock = threading.RLock()
+        # 아직 기록하지 않은 집계 증분 / 세션별 직전 이벤트 시각
+        self._pending: Dict[Tuple[str, ...], List[int]] = {}
+        self._last_time: Dict[str, datetime] = {}
+        self.conn = sqlite3.connect(str(index.path), check_same_thread=False, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.created = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'event_stats'"
+        ).fetchone() is None
+        self.conn.executescript(SCHEMA)
+
+    # ------------------------------------------------------------------
+    # 집계
+    # ------------------------------------------------------------------
+    def add(self, session_id: str, start_time: str, model: Optional[str], record: Dict[str, Any]):
+        """이벤트 하나를 집계 증분에 반영 (flush() 시 기록)"""
+        event_type = record.get("event_type") or ""
+        timestamp = _parse_time(record.get("timestamp"))
+        previous = self._last_time.get(session_id) or _parse_time(start_time)
+        duration_ms = 0
+        if timestamp is not None:
+            if previous is not None and event_type != "user_input":
+                duration_ms = max(int((timestamp - previous).total_seconds() * 1000), 0)
+            self._last_time[session_id] = timestamp
+
+        content = record.get("content") or ""
+        usage = record.get("usage") or {}
+        input_tokens = int(usage.get("input_tokens") or 0)
+        output_tokens = int(usage.get("output_tokens") or 0)
+        tokens = input_tokens + output_tokens if usage else len(content) // CHARS_PER_TOKEN
+
+        key = (
+            (record.get("timestamp") or start_time or "")[:10],
+            model or "",
+            record.get("agent_name") or "",
+            record.get("tool_name") or "",
+            event_type,
+        )
+        with self._lock:
+            values = self._pending.get(key)
+            if values is None:
+                values = self._pending[key] = [0] * len(VALUE_COLUMNS)
+            values[0] += 1
+            values[1] += len(content)
+            values[2] += tokens
+            values[3] += input_tokens
+            values[4] += output_tokens
+            values[5] += duration_ms
+
+    def flush(self):
+        with self._lock:
+            if not self._pending:
+                return
+            rows, self._pending = self._pending, {}
+            self.conn.execute("BEGIN")
+            self.conn.executemany(_UPSERT, [(*key, *values) for key, values in rows.items()])
+            self.conn.execute("COMMIT")
+
+    def on_session_start(self, channel):
+        self._last_time.pop(channel.session_id, None)
+
+    def on_event(self, channel, index: int, record: Dict[str, Any], line: str):
+        self.add(channel.session_id, channel.start_time, channel.model, record)
+
+    def on_batch_end(self):
+        self.flush()
+
+    def on_session_end(self, channel, footer: Dict[str, Any]):
+        self._last_time.pop(channel.session_id, None)
+
+    def rebuild(self) -> int:
+        """인덱스에 있는 모든 세션으로 집계를 다시 계산"""
+        with self._lock:
+            self.conn.execute("DELETE FROM event_stats")
+        rebuilt = 0
+        for row in self.index.query(limit=-1, sort_by="start_time", descending=False):
+            try:
+                for record in SessionReader(row["file_path"]).events():
+                    self.add(row["session_id"], row["start_time"], row["model"], record)
+                self._last_time.pop(row["session_id"], None)
+                self.flush()
+                rebuilt += 1
+            except Exception as e:
+                logger.warning(f"Failed to aggregate session {row['session_id']}: {e}")
+        logger.info(f"Session stats rebuilt from {rebuilt} sessions")
+        return rebuilt
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def query(self, group_by=("day",), date_from: Optional[str] = None, date_to: Optional[str] = None,
+              model: Optional[str] = None, agent_name: Optional[str] = None, tool_name: Optional[str] = None,
+              event_type: Optional[str] = None, order_by: Optional[str] = None,
+              limit: int = -1) -> List[Dict[str, Any]]:
+        """이벤트 집계 조회
+
+        Args:
+            group_by: day, model, agent_name, tool_name, event_type 중 0개 이상 (빈 값이면 전체 합계 한 행)
+                      agent_name/tool_name으로 묶으면 해당 이름이 있는 이벤트만 포함
+            date_from / date_to: 날짜 (YYYY-MM-DD 또는 ISO 시각, date_to는 미포함)
+            order_by: 정렬할 값 컬럼 (내림차순, 기본은 group_by 순)
+        """
+        for column in group_by:
+            if column not in GROUP_COLUMNS:
+                raise ValueError(f"Unsupported group column: {column}")
+        if order_by is not None and order_by not in VALUE_COLUMNS:
+            raise ValueError(f"Unsupported order column: {order_by}")
+
+        clauses, params = [], []
+        for column, value in (("model", model), ("agent_name", agent_name),
+                              ("tool_name", tool_name), ("event_type", event_type)):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        for column in ("agent_name", "tool_name"):
+            if column in group_by:
+                clauses.append(f"{column} != ''")
+        if date_from:
+            clauses.append("day >= ?")
+            params.append(date_from[:10])
+        if date_to:
+            clauses.append("day < ?")
+            params.append(date_to[:10])
+
+        sql = "SELECT " + "".join(f"{column}, " for column in group_by)
+        sql += ", ".join(f"COALESCE(SUM({column}), 0) AS {column}" for column in VALUE_COLUMNS)
+        sql += " FROM event_stats"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        if group_by:
+            sql += f" GROUP BY {', '.join(group_by)}"
+            sql += f" ORDER BY {order_by} DESC" if order_by else f" ORDER BY {', '.join(group_by)}"
+        sql += " LIMIT ?"
+
+        self.flush()
+        with self._lock:
+            rows = self.conn.execute(sql, (*params, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def totals(self, **filters) -> Dict[str, Any]:
+        """필터에 맞는 전체 합계"""
+        return self.query(group_by=(), **filters)[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = self.conn.execute("SELECT COUNT(*) FROM event_stats").fetchone()[0]
+        return {"rows": rows, "pending": len(self._pending)}
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self.conn.close()
@@ -0,0 +1,296 @@
+"""
+이벤트 버스 sink
+EventBus가 이벤트 하나를 한 번 직렬화한 뒤 등록된 sink들에 전달 (모든 hook은 writer 스레드에서 호출)
+
+- JsonlLogSink: 세션 로그 파일 (append-only JSONL, 직렬화된 줄을 그대로 기록)
+- SessionIndexSink: 세션 메타데이터 인덱스 + 종료된 세션 압축/보존 정책
+- MetricsSink: 이벤트 수/바이트 카운터 (이벤트 타입, 에이전트, 도구별)
+- TraceExportSink: 이벤트를 trace span으로 내보냄 (JSONL 파일 또는 OpenTelemetry)
+- 검색 색인은 SessionSearchIndex (search_index 참고), 통계 집계는 SessionStats (session_stats 참고),
+  큰 도구 출력 저장은 BlobStore (blob_store 참고)
+
+sink를 추가해도 이벤트 직렬화나 세션 파일 기록이 늘어나지 않음
+
+환경변수:
+- LOG_TRACE_EXPORT: none (기본) / jsonl / otel - trace 내보내기 방식
+- LOG_TRACE_PATH: jsonl trace 파일 디렉토리 (기본 <logs>/traces)
+"""
+
+import os
+import json
+import logging
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set
+
+from src.utils.logging.session_log import SessionLogWriter
+from src.utils.logging.session_index import SessionIndex, SessionSummary
+from src.utils.logging.archive import LogArchivePolicy, apply_retention, archive_session
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:  # OpenTelemetry는 선택 의존성
+    otel_trace = None
+
+logger = logging.getLogger(__name__)
+
+TRACE_EXPORTERS = ("none", "jsonl", "otel")
+
+
+class EventSink:
+    """sink 기본 클래스 - 필요한 hook만 구현"""
+
+    def on_session_start(self, channel):
+        """세션 시작 (첫 이벤트 전)"""
+
+    def on_event(self, channel, index: int, record: Dict[str, Any], line: str):
+        """이벤트 하나 - record는 이벤트 dict, line은 기록되는 JSONL 한 줄 (큰 도구 출력은 blob 참조, 수정하지 말 것)"""
+
+    def on_batch_end(self):
+        """writer 스레드 배치 끝 - 모아둔 기록 flush/commit"""
+
+    def sync(self) -> int:
+        """디스크까지 기록 (fsync) - fsync한 파일 수"""
+        return 0
+
+    def on_checkpoint(self, channel):
+        """세션 저장 요청 (워크플로우 한 번이 끝날 때 등)"""
+
+    def on_session_end(self, channel, footer: Dict[str, Any]):
+        """세션 종료"""
+
+    def on_session_removed(self, session_id: str):
+        """보존 정책 등으로 세션이 삭제됨"""
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {}
+
+    def close(self):
+        pass
+
+
+class JsonlLogSink(EventSink):
+    """세션마다 append-only JSONL 파일 (session_log 형식)"""
+
+    def __init__(self):
+        self._writers: Dict[str, SessionLogWriter] = {}
+        # flush해야 하는 writer / flush는 했지만 아직 fsync하지 않은 writer
+        self._dirty: Set[SessionLogWriter] = set()
+        self._unsynced: Set[SessionLogWriter] = set()
+
+    def on_session_start(self, channel):
+        self._writers[channel.session_id] = SessionLogWriter(channel.path, channel.header)
+
+    def on_event(self, channel, index: int, record: Dict[str, Any], line: str):
+        writer = self._writers.get(channel.session_id)
+        if writer is None:
+            writer = self._writers[channel.session_id] = SessionLogWriter(channel.path, channel.header)
+        writer.append_line(line, flush=False)
+        self._dirty.add(writer)
+
+    def on_batch_end(self):
+        for writer in self._dirty:
+            writer.flush()
+            self._unsynced.add(writer)
+        self._dirty.clear()
+
+    def sync(self) -> int:
+        synced = 0
+        for writer in self._unsynced:
+            try:
+                writer.sync()
+                synced += 1
+            except Exception as e:
+                logger.warning(f"Session log fsync failed for {writer.path}: {e}")
+        self._unsynced.clear()
+        return synced
+
+    def on_session_end(self, channel, footer: Dict[str, Any]):
+        writer = self._writers.pop(channel.session_id, None)
+        if writer is None:
+            return
+        self._dirty.discard(writer)
+        self._unsynced.discard(writer)
+        writer.finalize(footer)
+
+    def close(self):
+        for writer in list(self._writers.values()):
+            writer.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"open_files": len(self._writers)}
+
+
+class SessionIndexSink(EventSink):
+    """세션 메타데이터 인덱스 갱신 + 종료된 세션 압축/보존 정책 적용
+
+    요약은 이벤트를 받으면서 누적하고 인덱스에는 저장 요청/세션 종료 때만 기록
+    """
+
+    def __init__(self, index: SessionIndex, policy: LogArchivePolicy,
+                 on_remove: Optional[Callable[[str], None]] = None):
+        self.index = index
+        self.policy = policy
+        self.on_remove = on_remove
+        self._summaries: Dict[str, SessionSummary] = {}
+
+    def on_session_start(self, channel):
+        self._summaries[channel.session_id] = SessionSummary(channel.session_id, channel.start_time, channel.model)
+
+    def on_event(self, channel, index: int, record: Dict[str, Any], line: str):
+        summary = self._summaries.get(channel.session_id)
+        if summary is None:
+            summary = self._summaries[channel.session_id] = SessionSummary(
+                channel.session_id, channel.start_time, channel.model
+            )
+        summary.add(record)
+
+    def on_checkpoint(self, channel):
+        """이벤트가 있는 세션만 인덱스에 기록"""
+        summary = self._summaries.get(channel.session_id)
+        if summary is not None and summary.event_count:
+            self.index.upsert(summary, channel.path)
+
+    def on_session_end(self, channel, footer: Dict[str, Any]):
+        summary = self._summaries.pop(channel.session_id, None)
+        if summary is None or not summary.event_count:
+            return
+        summary.end_time = footer.get("end_time")
+        try:
+            archive_session(self.index, summary, channel.path, self.policy)
+        except Exception as e:
+            logger.warning(f"Failed to compress session log {channel.path}: {e}")
+            self.index.upsert(summary, channel.path)
+        self.apply_retention()
+
+    def apply_retention(self):
+        """보존 정책 적용 - 기록 중인 세션은 제외"""
+        try:
+            apply_retention(self.index, self.policy, protect=set(self._summaries), on_remove=self.on_remove)
+        except Exception as e:
+            logger.warning(f"Failed to apply log retention: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"open_sessions": len(self._summaries)}
+
+
+class MetricsSink(EventSink):
+    """이벤트 카운터 - 이벤트 타입/에이전트/도구별 이벤트 수, 기록 바이트"""
+
+    def __init__(self):
+        self.sessions_started = 0
+        self.sessions_ended = 0
+        self.events = 0
+        self.bytes = 0
+        self.by_type: Counter = Counter()
+        self.by_agent: Counter = Counter()
+        self.by_tool: Counter = Counter()
+
+    def on_session_start(self, channel):
+        self.sessions_started += 1
+
+    def on_event(self, channel, index: int, record: Dict[str, Any], line: str):
+        self.events += 1
+        self.bytes += len(line)
+        self.by_type[record.get("event_type")] += 1
+        if record.get("agent_name"):
+            self.by_agent[record["agent_name"]] += 1
+        if record.get("tool_name"):
+            self.by_tool[record["tool_name"]] += 1
+
+    def on_session_end(self, channel, footer: Dict[str, Any]):
+        self.sessions_ended += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "sessions_started": self.sessions_started,
+            "sessions_ended": self.sessions_ended,
+            "events": self.events,
+            "bytes": self.bytes,
+            "by_type": dict(self.by_type),
+            "by_agent": dict(self.by_agent),
+            "by_tool": dict(self.by_tool),
+        }
+
+
+def get_trace_exporter() -> str:
+    exporter = os.getenv("LOG_TRACE_EXPORT", "none").lower()
+    if exporter not in TRACE_EXPORTERS:
+        raise ValueError(f"Unsupported LOG_TRACE_EXPORT: {exporter}")
+    if exporter == "otel" and otel_trace is None:
+        logger.warning("opentelemetry not installed, falling back to jsonl trace export")
+        exporter = "jsonl"
+    return exporter
+
+
+class TraceExportSink(EventSink):
+    """세션 = trace, 이벤트 = span
+
+    - jsonl: 하루에 파일 하나 (traces/trace_<날짜>.jsonl), span 줄에 직렬화된 이벤트 줄을 그대로 포함
+    - otel: OpenTelemetry tracer로 span 생성 (exporter 설정은 OpenTelemetry SDK 쪽에서)
+    """
+
+    def __init__(self, base_path: Path, exporter: str = "jsonl", path: Optional[str] = None):
+        self.exporter = exporter
+        self.directory = Path(path or os.getenv("LOG_TRACE_PATH") or Path(base_path) / "traces")
+        self.spans = 0
+        self._file = None
+        self._file_date: Optional[str] = None
+        self._tracer = otel_trace.get_tracer("decepticon.session") if exporter == "otel" else None
+        self._session_spans: Dict[str, Any] = {}
+
+    def _trace_file(self):
+        date = datetime.now().strftime("%Y-%m-%d")
+        if self._file is None or self._file_date != date:
+            if self._file is not None:
+                self._file.close()
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.directory / f"trace_{date}.jsonl", "a", encoding="utf-8")
+            self._file_date = date
+        return self._file
+
+    def on_session_start(self, channel):
+        if self._tracer is not None:
+            self._session_spans[channel.session_id] = self._tracer.start_span(
+                "session", attributes={"session.id": channel.session_id, "session.model": channel.model or ""}
+            )
+
+    def on_event(self, channel, index: int, record: Dict[str, Any], line: str):
+        name = record.get("event_type") or "event"
+        if self._tracer is not None:
+            parent = self._session_spans.get(channel.session_id)
+            context = otel_trace.set_span_in_context(parent) if parent is not None else None
+            attributes = {"session.id": channel.session_id, "event.index": index}
+            if record.get("agent_name"):
+                attributes["agent.name"] = record["agent_name"]
+            if record.get("tool_name"):
+                attributes["tool.name"] = record["tool_name"]
+            self._tracer.start_span(name, context=context, attributes=attributes).end()
+        else:
+            # 이벤트는 이미 직렬화된 줄을 그대로 붙임 (다시 직렬화하지 않음)
+            span = json.dumps({
+                "trace_id": channel.trace_id,
+                "span_id": os.urandom(8).hex(),
+                "name": name,
+                "index": index,
+            }, ensure_ascii=False, separators=(",", ":"))
+            self._trace_file().write(f'{span[:-1]},"event":{line[:-1]}}}\n')
+        self.spans += 1
+
+    def on_batch_end(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def on_session_end(self, channel, footer: Dict[str, Any]):
+        span = self._session_spans.pop(channel.session_id, None)
+        if span is not None:
+            span.end()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"exporter": self.exporter, "spans": self.spans}
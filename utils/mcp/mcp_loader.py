@@ -1,12 +1,18 @@
 import json
 import asyncio
 
+from src.utils.mcp.tool_memo import memoize_tool
+from src.utils.mcp.standin import is_standin_enabled, load_standin_tools
+
 try:
     from langchain_mcp_adapters.client import MultiServerMCPClient
 except ModuleNotFoundError:
     MultiServerMCPClient = None
 
 async def load_mcp_tools(agent_name=None, max_retries=3, delay=2):
+    if is_standin_enabled():
+        # 벤치마크용 stand-in 도구 (MCP 서버/컨테이너 없이 실행)
+        return [memoize_tool(tool) for tool in load_standin_tools(agent_name)]
     if MultiServerMCPClient is None:
         return []
     with open("mcp_config.json", "r") as f:
@@ -33,7 +39,8 @@ async def load_mcp_tools(agent_name=None, max_retries=3, delay=2):
                 try:
                     current_tools = await client.get_tools() if client else []
                     if current_tools:
-                        tools.extend(current_tools)
+                        # 읽기 전용 도구는 실행 단위 메모이제이션 적용
+                        tools.extend(memoize_tool(tool) for tool in current_tools)
                     break  # Success, exit retry loop
                 except Exception as e:
                     if attempt < max_retries - 1:
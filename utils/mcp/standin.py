@@ -0,0 +1,62 @@
+"""
+Stand-in 도구 실행기 - 컨테이너/MCP 서버 없이 swarm을 벤치마크하기 위한 가짜 도구
+tools/mcp의 도구와 같은 이름과 인자를 가지며 설정한 지연 후 결정적인 출력을 반환
+
+MCP_STANDIN=true 일 때 load_mcp_tools가 실제 MCP 서버 대신 사용
+- STANDIN_TOOL_LATENCY: 호출당 지연 (초, 기본 0)
+- STANDIN_TOOL_OUTPUT_LINES: 출력 줄 수 (기본 20)
+"""
+
+import os
+import asyncio
+import hashlib
+from typing import Dict, List, Optional
+
+from langchain_core.tools import BaseTool, StructuredTool
+
+# 에이전트별 stand-in 도구 (tools/mcp/*.py와 동일한 이름)
+STANDIN_TOOLS: Dict[str, Dict[str, str]] = {
+    "reconnaissance": {
+        "nmap": "Network discovery and port scanning",
+        "curl": "Web service analysis and content retrieval",
+        "dig": "DNS information gathering",
+        "whois": "Domain registration and ownership lookup",
+    },
+    "initial_access": {
+        "hydra": "Brute-force authentication attacks",
+        "searchsploit": "Search exploit database for vulnerabilities",
+    },
+}
+
+
+def is_standin_enabled() -> bool:
+    return os.getenv("MCP_STANDIN", "false").lower() == "true"
+
+
+def _make_output(tool_name: str, target: str, options: str) -> str:
+    """입력에 대해 결정적인 출력 생성"""
+    lines = int(os.getenv("STANDIN_TOOL_OUTPUT_LINES", "20"))
+    seed = hashlib.sha256(f"{tool_name}:{target}:{options}".encode("utf-8")).hexdigest()
+    header = f"$ {tool_name} {options} {target}".replace("  ", " ").strip()
+    body = [f"{tool_name}[{i:03d}] {seed[(i * 4) % 60:(i * 4) % 60 + 4]} {target}" for i in range(lines)]
+    return "\n".join([header] + body)
+
+
+def _make_tool(tool_name: str, description: str) -> BaseTool:
+    async def run(target: str, options: Optional[str] = None) -> str:
+        latency = float(os.getenv("STANDIN_TOOL_LATENCY", "0"))
+        if latency:
+            await asyncio.sleep(latency)
+        return _make_output(tool_name, target, options or "")
+
+    return StructuredTool.from_function(coroutine=run, name=tool_name, description=description)
+
+
+def load_standin_tools(agent_name: Optional[List[str]] = None) -> List[BaseTool]:
+    """에이전트별 stand-in 도구 목록 (load_mcp_tools와 같은 인자)"""
+    selected = agent_name if agent_name else list(STANDIN_TOOLS)
+    return [
+        _make_tool(tool_name, description)
+        for agent in selected
+        for tool_name, description in STANDIN_TOOLS.get(agent, {}).items()
+    ]
@@ -0,0 +1,162 @@
+"""
+실행 단위 도구 호출 메모이제이션
+handoff 이후 다른 에이전트가 같은 MCP 도구를 같은 인자로 다시 호출하면
+컨테이너에서 재실행하지 않고 저장된 결과를 [cached] 표시와 함께 반환
+(결정적이고 읽기 전용인 도구만 allowlist로 지정, freshness window 이내 결과만 사용)
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool, StructuredTool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ALLOWLIST = "nmap,dig,whois,searchsploit"
+CACHED_TAG = "[cached result - identical call already executed in this run {age:.0f}s ago]"
+
+
+@dataclass
+class _MemoEntry:
+    result: Any
+    created_at: float
+    elapsed: float
+
+
+def get_memo_allowlist() -> set:
+    value = os.getenv("TOOL_MEMO_ALLOWLIST", DEFAULT_ALLOWLIST)
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+def get_memo_ttl(tool_name: str) -> float:
+    """freshness window (초) - TOOL_MEMO_TTL_<TOOL>로 도구별 override"""
+    return float(os.getenv(f"TOOL_MEMO_TTL_{tool_name.upper()}", os.getenv("TOOL_MEMO_TTL", "600")))
+
+
+def is_tool_memo_enabled() -> bool:
+    return os.getenv("TOOL_MEMO", "true").lower() == "true"
+
+
+def _tag_result(result: Any, age: float) -> Any:
+    """캐시된 결과임을 표시 (content_and_artifact 튜플이면 content에만)"""
+    tag = CACHED_TAG.format(age=age)
+    if isinstance(result, tuple) and len(result) == 2:
+        return (_tag_result(result[0], age), result[1])
+    if isinstance(result, str):
+        return f"{tag}\n{result}"
+    if isinstance(result, list):
+        return [{"type": "text", "text": tag}] + result
+    return result
+
+
+class ToolMemo:
+    """thread(실행)별 도구 호출 결과 테이블"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tables: Dict[str, Dict[str, _MemoEntry]] = {}
+        self._pending: Dict[Tuple[str, str], asyncio.Future] = {}
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "saved_seconds": 0.0}
+
+    def start_run(self, thread_id: str):
+        """새 실행 시작 - 해당 thread의 메모 테이블 초기화"""
+        with self._lock:
+            self._tables.pop(thread_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._tables.clear()
+
+    def _lookup(self, thread_id: str, key: str, ttl: float) -> Optional[_MemoEntry]:
+        with self._lock:
+            entry = self._tables.get(thread_id, {}).get(key)
+            if entry is None:
+                return None
+            if time.time() - entry.created_at > ttl:
+                del self._tables[thread_id][key]
+                return None
+            return entry
+
+    def _store(self, thread_id: str, key: str, entry: _MemoEntry):
+        with self._lock:
+            self._tables.setdefault(thread_id, {})[key] = entry
+
+    async def call(self, tool_name: str, args: Dict[str, Any], thread_id: str, execute):
+        """메모 테이블 조회 후 없으면 실행 (동시에 들어온 동일 호출은 하나로 합침)"""
+        key = f"{tool_name}:{json.dumps(args, sort_keys=True, default=str)}"
+        entry = self._lookup(thread_id, key, get_memo_ttl(tool_name))
+        if entry is not None:
+            self.stats["hits"] += 1
+            self.stats["saved_seconds"] += entry.elapsed
+            logger.info(f"Tool memo hit: {tool_name} (thread {thread_id})")
+            return _tag_result(entry.result, time.time() - entry.created_at)
+
+        pending = self._pending.get((thread_id, key))
+        if pending is not None:
+            self.stats["coalesced"] += 1
+            result = await asyncio.shield(pending)
+            return _tag_result(result, 0)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[(thread_id, key)] = future
+        self.stats["misses"] += 1
+        started = time.time()
+        try:
+            result = await execute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            # 실패한 호출은 저장하지 않음
+            future.set_exception(e)
+            future.exception()  # 대기자가 없을 때 경고 방지
+            raise
+        else:
+            self._store(thread_id, key, _MemoEntry(result=result, created_at=time.time(),
+                                                   elapsed=time.time() - started))
+            future.set_result(result)
+            return result
+        finally:
+            self._pending.pop((thread_id, key), None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = sum(len(table) for table in self._tables.values())
+        return {**self.stats, "entries": entries, "allowlist": sorted(get_memo_allowlist())}
+
+
+# 전역 인스턴스 (싱글톤)
+_tool_memo: Optional[ToolMemo] = None
+
+
+def get_tool_memo() -> ToolMemo:
+    """전역 도구 메모 인스턴스 반환"""
+    global _tool_memo
+    if _tool_memo is None:
+        _tool_memo = ToolMemo()
+    return _tool_memo
+
+
+def memoize_tool(tool: BaseTool) -> BaseTool:
+    """allowlist에 있는 비동기 StructuredTool을 메모이제이션 래퍼로 교체"""
+    if (not isinstance(tool, StructuredTool) or tool.coroutine is None
+            or tool.name not in get_memo_allowlist()):
+        return tool
+
+    original = tool.coroutine
+    memo = get_tool_memo()
+
+    async def memoized(config: RunnableConfig, **kwargs):
+        if not is_tool_memo_enabled():
+            return await original(**kwargs)
+        thread_id = str((config.get("configurable") or {}).get("thread_id", "default"))
+        return await memo.call(tool.name, kwargs, thread_id, lambda: original(**kwargs))
+
+    return tool.model_copy(update={"coroutine": memoized})
@@ -6,7 +6,7 @@ LangGraph Persistence Configuration
 import os
 import logging
 from typing import Optional
-from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.store.memory import InMemoryStore
 
 from langchain_openai import OpenAIEmbeddings
@@ -14,7 +14,7 @@ from langchain_openai import OpenAIEmbeddings
 logger = logging.getLogger(__name__)
 
 # 전역 인스턴스들
-_checkpointer: Optional[InMemorySaver] = None
+_checkpointer: Optional[BaseCheckpointSaver] = None
 _store: Optional[InMemoryStore] = None
 
 
@@ -44,18 +44,36 @@ def _create_openrouter_embeddings() -> OpenAIEmbeddings:
         },
     )
 
-def get_checkpointer() -> InMemorySaver:
+def get_checkpointer() -> BaseCheckpointSaver:
     """
     중앙 집중식 Checkpointer 인스턴스 반환
     
+    CHECKPOINTER 환경변수로 선택: "sqlite" (기본, CHECKPOINT_DB_PATH 파일) 또는 "memory"
+    보존 정책(최근 K개, 유휴 TTL, 용량 한도)은 백그라운드 compactor가 적용
+    
     Returns:
-        InMemorySaver: 메모리 기반 체크포인터
+        BaseCheckpointSaver: SQLite(WAL) 또는 메모리 기반 체크포인터
     """
     global _checkpointer
     
     if _checkpointer is None:
-        _checkpointer = InMemorySaver()
-        logger.info("InMemorySaver checkpointer initialized")
+        backend = os.getenv("CHECKPOINTER", "sqlite").lower()
+        if backend == "sqlite":
+            try:
+                from src.utils.checkpoint.delta import DeltaCheckpointSaver, is_delta_enabled
+                from src.utils.checkpoint.sqlite import SqliteCheckpointSaver
+                # messages 리스트는 부모 대비 delta로 저장 (CHECKPOINT_DELTA=false면 전체 직렬화)
+                _checkpointer = DeltaCheckpointSaver() if is_delta_enabled() else SqliteCheckpointSaver()
+            except Exception as e:
+                logger.warning(f"SQLite checkpointer unavailable, falling back to InMemorySaver: {e}")
+        if _checkpointer is None:
+            from src.utils.checkpoint.retention import RetainingMemorySaver
+            _checkpointer = RetainingMemorySaver()
+            logger.info("InMemorySaver checkpointer initialized")
+        
+        # 오래된 체크포인트/유휴 thread 정리 (CHECKPOINT_RETENTION)
+        from src.utils.checkpoint.retention import start_compactor
+        start_compactor(_checkpointer)
     
     return _checkpointer
 
@@ -64,21 +82,44 @@ def get_store() -> InMemoryStore:
     중앙 집중식 Store 인스턴스 반환
     
     Returns:
-        InMemoryStore: 메모리 기반 스토어 (벡터 인덱스 포함)
+        InMemoryStore: 메모리 기반 스토어 (OpenRouter 또는 로컬 임베딩 벡터 인덱스 포함)
     """
     global _store
     
     if _store is None:
+        from src.utils.llm.local_embeddings import HashedNgramEmbeddings, get_embedding_backend
+        
         api_key = _get_openrouter_api_key()
-        if api_key:
-            _store = InMemoryStore(
+        # EMBEDDING_BACKEND: openrouter / local / auto (API 키가 없으면 로컬 임베딩)
+        backend = get_embedding_backend(has_api_key=bool(api_key))
+        if backend == "local":
+            from src.utils.store.indexed import IndexedStore
+            
+            embeddings = HashedNgramEmbeddings()
+            _store = IndexedStore(
                 index={
-                    "dims": 1536,
-                    "embed": _create_openrouter_embeddings(),
+                    "dims": embeddings.dims,
+                    "embed": embeddings,
                     "fields": ["text"],
                 }
             )
-            logger.info("InMemoryStore initialized with vector index")
+            logger.info(f"IndexedStore initialized with local vector index ({embeddings.model_key})")
+        elif api_key:
+            from src.utils.llm.embeddings import CachedEmbeddings, is_embedding_cache_enabled
+            from src.utils.store.indexed import IndexedStore, WriteBehindStore, is_async_index_enabled
+            
+            embeddings = _create_openrouter_embeddings()
+            if is_embedding_cache_enabled():
+                # 같은 텍스트는 다시 임베딩하지 않고 동시 요청은 한 번에 묶어서 전송
+                embeddings = CachedEmbeddings(embeddings, model_key="openrouter:openai/text-embedding-3-small")
+            index = {
+                "dims": 1536,
+                "embed": embeddings,
+                "fields": ["text"],
+            }
+            # 색인은 백그라운드에서 처리하여 메모리 도구 호출이 임베딩을 기다리지 않도록 함
+            _store = WriteBehindStore(index=index) if is_async_index_enabled() else IndexedStore(index=index)
+            logger.info(f"{type(_store).__name__} initialized with vector index")
         else:
             _store = InMemoryStore()
             logger.info("InMemoryStore initialized without vector index")
@@ -91,6 +132,12 @@ def reset_persistence():
     """
     global _checkpointer, _store
     
+    from src.utils.checkpoint.retention import stop_compactor
+    stop_compactor()
+    
+    # 파일 기반 체크포인터는 보류 중인 쓰기를 commit 후 닫음
+    if _checkpointer is not None and hasattr(_checkpointer, "close"):
+        _checkpointer.close()
     _checkpointer = None
     _store = None
     logger.info("Persistence instances reset")
@@ -138,18 +185,25 @@ def create_thread_config(user_id: str, conversation_id: Optional[str] = None) ->
     return config
 
 # 개발 편의를 위한 헬퍼 함수들
-def create_memory_namespace(user_id: str, namespace_type: str = "memories") -> tuple:
+def create_memory_namespace(user_id: Optional[str] = None, namespace_type: str = "memories", *,
+                            conversation_id: Optional[str] = None) -> tuple:
     """
-    메모리 네임스페이스 생성
+    메모리 네임스페이스 생성 (사용자/engagement별)
+    
+    thread_id가 "user_{user_id}_conv_{conversation_id}" 형식이므로 engagement마다 별도 namespace가 되어
+    검색 비용이 현재 engagement의 크기에만 비례
     
     Args:
-        user_id: 사용자 ID
+        user_id: 사용자 ID (없으면 실행 시 config의 thread_id로 채워지는 LangMem 템플릿 반환 - 에이전트가 사용)
         namespace_type: 네임스페이스 타입 (memories, preferences, etc.)
+        conversation_id: 대화 ID (옵션, create_thread_config에 넘긴 값과 같아야 에이전트가 쓰는 namespace와 일치)
     
     Returns:
         tuple: LangMem 네임스페이스 튜플
     """
-    return (namespace_type, user_id)
+    if user_id is None:
+        return (namespace_type, "{thread_id}")
+    return (namespace_type, create_thread_config(user_id, conversation_id)["configurable"]["thread_id"])
 
 def get_debug_info() -> dict:
     """
@@ -166,6 +220,12 @@ def get_debug_info() -> dict:
     if _checkpointer:
         # InMemorySaver는 내부 상태 접근이 제한적이므로 기본 정보만
         debug_info["checkpointer_class"] = str(type(_checkpointer))
+        if hasattr(_checkpointer, "get_stats"):
+            debug_info["checkpointer_stats"] = _checkpointer.get_stats()
+        
+        # 체크포인트 보존 정책 (eviction) 통계
+        from src.utils.checkpoint.retention import get_retention_stats
+        debug_info["checkpoint_retention"] = get_retention_stats()
     
     if _store:
         debug_info["store_class"] = str(type(_store))
@@ -174,5 +234,27 @@ def get_debug_info() -> dict:
             debug_info["store_has_index"] = hasattr(_store, 'index')
         except:
             debug_info["store_has_index"] = False
+        if hasattr(_store, "get_stats"):
+            debug_info["store_stats"] = _store.get_stats()
+    
+    # 에이전트별 컨텍스트 관리 (토큰 절감) 통계
+    from src.utils.context import get_context_stats
+    debug_info["context_stats"] = get_context_stats()
+    
+    # provider 프롬프트 캐시 hit/miss 토큰 통계
+    from src.utils.llm.prompt_cache import get_prompt_cache_stats
+    debug_info["prompt_cache_stats"] = get_prompt_cache_stats().get_stats()
+    
+    # 실행 감독 지표 (에이전트별 LLM 호출, 낭비된 호출, 개입/조기 종료 횟수)
+    from src.utils.supervisor import get_run_supervisor
+    debug_info["supervisor_metrics"] = get_run_supervisor().get_metrics()
+    
+    # 도구 호출 메모이제이션 통계
+    from src.utils.mcp.tool_memo import get_tool_memo
+    debug_info["tool_memo_stats"] = get_tool_memo().get_stats()
+    
+    # LLM record/replay 카세트 상태
+    from src.utils.llm.cassette import get_cassette_stats
+    debug_info["llm_cassette"] = get_cassette_stats()
     
     return debug_info
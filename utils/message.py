@@ -3,6 +3,8 @@ from rich import markup
 import json
 from typing import Dict, Any, List, Optional
 
+from src.utils.swarm.handoff import BRANCH_NODE_SUFFIX
+
 # 도구 이름 
 def parse_tool_name(tool_name: str) -> str:
     """Parse tool name simply (no hardcoding)"""
@@ -93,7 +95,8 @@ def get_agent_name(namespace):
     if len(namespace) > 0:
         namespace_str = namespace[0]
         if ':' in namespace_str:
-            return namespace_str.split(':')[0]
+            # 병렬 분기 노드(<agent>_branch)는 원래 에이전트 이름으로 표시
+            return namespace_str.split(':')[0].removesuffix(BRANCH_NODE_SUFFIX)
     
     return "Unknown"
 
@@ -165,3 +168,17 @@ def extract_tool_calls(message, event_data: Optional[Dict[str, Any]] = None) ->
     
     
     return tool_calls
+
+# 토큰 사용량 추출 함수
+def extract_token_usage(message) -> Optional[Dict[str, int]]:
+    """
+    AI 메시지의 토큰 사용량(usage_metadata)을 반환합니다.
+    모델이 사용량을 보고하지 않으면 None
+    """
+    usage = getattr(message, 'usage_metadata', None)
+    if not usage:
+        return None
+    return {
+        "input_tokens": int(usage.get('input_tokens', 0) or 0),
+        "output_tokens": int(usage.get('output_tokens', 0) or 0)
+    }
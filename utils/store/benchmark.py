@@ -0,0 +1,111 @@
+"""
+메모리 벡터 인덱스 벤치마크 - 1k ~ 1M 벡터에서 VectorIndex 삽입/삭제/검색 시간 측정
+기준선으로 항목별 파이썬 코사인 계산(InMemoryStore 기본 검색 방식)을 작은 크기에서 함께 측정하고
+hnswlib가 설치되어 있으면 근사 인덱스의 지연 시간과 recall@k도 측정
+
+사용법:
+    python -m src.utils.store.benchmark --sizes 1000,10000,100000,1000000 --dims 256
+"""
+
+import json
+import time
+import math
+import argparse
+import statistics
+from typing import Any, Dict, List
+
+import numpy as np
+
+from src.utils.store.vector_index import VectorIndex, hnswlib
+
+
+def _random_vectors(rng: np.random.Generator, count: int, dims: int) -> np.ndarray:
+    return rng.standard_normal((count, dims), dtype=np.float32)
+
+
+def _python_search(vectors: List[List[float]], query: List[float], k: int) -> List[int]:
+    """항목마다 파이썬에서 코사인 유사도를 계산하는 기준선"""
+    query_norm = math.sqrt(sum(value * value for value in query))
+    scores = []
+    for row, vector in enumerate(vectors):
+        dot = sum(a * b for a, b in zip(query, vector))
+        norm = math.sqrt(sum(value * value for value in vector))
+        scores.append((dot / (norm * query_norm) if norm and query_norm else 0.0, row))
+    return [row for _, row in sorted(scores, reverse=True)[:k]]
+
+
+def _bench_size(size: int, args: argparse.Namespace, rng: np.random.Generator) -> Dict[str, Any]:
+    index = VectorIndex(args.dims, ann_threshold=0)
+    started = time.perf_counter()
+    for start in range(0, size, args.chunk):
+        count = min(args.chunk, size - start)
+        index.add(list(range(start, start + count)), _random_vectors(rng, count, args.dims))
+    insert_seconds = time.perf_counter() - started
+
+    queries = index.normalize(_random_vectors(rng, args.queries, args.dims))
+    started = time.perf_counter()
+    exact = index.search(queries, args.k)
+    batched_ms = (time.perf_counter() - started) * 1000
+
+    single = []
+    for query in queries[:16]:
+        started = time.perf_counter()
+        index.search(query[None, :], args.k)
+        single.append((time.perf_counter() - started) * 1000)
+
+    result: Dict[str, Any] = {
+        "size": size,
+        "insert_per_second": size / insert_seconds if insert_seconds else 0.0,
+        "batched_query_ms": batched_ms,
+        "batched_query_ms_per_query": batched_ms / len(queries),
+        "single_query_ms": statistics.median(single),
+        "index_bytes": index.get_stats()["bytes"],
+    }
+
+    if size <= args.python_max:
+        vectors = index.flat.matrix[:size].tolist()
+        query = queries[0].tolist()
+        started = time.perf_counter()
+        _python_search(vectors, query, args.k)
+        result["python_loop_query_ms"] = (time.perf_counter() - started) * 1000
+        result["speedup_vs_python"] = result["python_loop_query_ms"] / max(result["single_query_ms"], 1e-9)
+
+    if hnswlib is not None and size >= args.ann_min:
+        started = time.perf_counter()
+        index.build_graph()
+        result["ann_build_seconds"] = time.perf_counter() - started
+        started = time.perf_counter()
+        approximate = index.search(queries, args.k)
+        result["ann_query_ms_per_query"] = (time.perf_counter() - started) * 1000 / len(queries)
+        hits = sum(
+            len({item_id for item_id, _ in approx_row} & {item_id for item_id, _ in exact_row})
+            for approx_row, exact_row in zip(approximate, exact)
+        )
+        result[f"ann_recall_at_{args.k}"] = hits / (len(queries) * args.k)
+
+    removed = list(range(0, size, 100))
+    started = time.perf_counter()
+    index.remove(removed)
+    result["delete_per_second"] = len(removed) / max(time.perf_counter() - started, 1e-9)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the memory store vector index")
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000")
+    parser.add_argument("--dims", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=64)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--chunk", type=int, default=10000, help="vectors per insert call")
+    parser.add_argument("--python-max", type=int, default=10000, help="largest size for the Python-loop baseline")
+    parser.add_argument("--ann-min", type=int, default=100000, help="smallest size to build the approximate index")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    results = [_bench_size(int(size), args, rng) for size in args.sizes.split(",")]
+    print(json.dumps({"dims": args.dims, "approximate_available": hnswlib is not None, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
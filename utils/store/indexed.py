@@ -0,0 +1,315 @@
+"""
+벡터 인덱스 메모리 스토어
+InMemoryStore의 기본 검색은 질의마다 namespace의 모든 항목을 파이썬에서 점수 계산함.
+IndexedStore는 값 저장/조회/필터는 InMemoryStore에 맡기고 임베딩과 검색만 namespace별
+VectorIndex(NumPy float32 행렬, 배치 내적 top-k)로 처리
+
+- IndexedStore: put 시 한 번의 배치 요청으로 임베딩 후 인덱스에 증분 삽입/삭제
+- namespace별 항목 수/전체 namespace 수 할당량을 넘으면 LRU 순서로 제거 (utils/store/quota.py)
+- WriteBehindStore: put 값은 즉시 저장(검색 결과에 점수 없이 포함)하고 임베딩/색인은 워커 스레드에서 처리
+  (manage_memory 호출이 임베딩 네트워크 지연을 기다리지 않음)
+
+MEMORY_ASYNC_INDEX=false 이면 get_store가 원격 임베딩에도 IndexedStore 사용
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from langgraph.store.base import GetOp, Item, Op, PutOp, Result, SearchItem, SearchOp
+from langgraph.store.base.embed import get_text_at_path, tokenize_path
+from langgraph.store.memory import InMemoryStore
+
+from src.utils.llm.embeddings import get_embedding_worker
+from src.utils.store.quota import UsageTracker
+from src.utils.store.vector_index import VectorIndex
+
+logger = logging.getLogger(__name__)
+
+Namespace = Tuple[str, ...]
+# 인덱스 행 ID: (key, 필드 경로)
+RowId = Tuple[str, str]
+
+
+def is_async_index_enabled() -> bool:
+    return os.getenv("MEMORY_ASYNC_INDEX", "true").lower() == "true"
+
+
+class IndexedStore(InMemoryStore):
+    """namespace별 VectorIndex로 의미 검색을 처리하는 InMemoryStore"""
+
+    def __init__(self, *, index: Dict[str, Any], **kwargs: Any):
+        # 상위 클래스는 색인 없이 값만 저장 (임베딩/점수 계산은 이 클래스에서)
+        super().__init__(**kwargs)
+        self.embeddings = index["embed"]
+        self.dims = int(index["dims"])
+        self.fields = index.get("fields") or ["$"]
+        self._lock = threading.RLock()
+        self._indexes: Dict[Namespace, VectorIndex] = {}
+        self._rows: Dict[Namespace, Dict[str, List[RowId]]] = {}
+        self._max_rows_per_item = 1
+        self._usage = UsageTracker()
+
+    # ------------------------------------------------------------------
+    # 임베딩 대상
+    # ------------------------------------------------------------------
+    def _texts(self, op: PutOp) -> List[Tuple[str, str]]:
+        """put 값에서 임베딩할 (필드 경로, 텍스트) 목록"""
+        fields = self.fields if op.index is None else op.index
+        texts: List[Tuple[str, str]] = []
+        for field in fields:
+            if field == "$":
+                texts.append((field, json.dumps(op.value, ensure_ascii=False)))
+                continue
+            values = [text for text in get_text_at_path(op.value, tokenize_path(field)) if text]
+            texts.extend((field if len(values) == 1 else f"{field}:{i}", text) for i, text in enumerate(values))
+        return texts
+
+    def _put_texts(self, ops: List[Op]) -> Dict[int, List[Tuple[str, str]]]:
+        return {
+            position: self._texts(op)
+            for position, op in enumerate(ops)
+            if isinstance(op, PutOp) and op.value is not None and op.index is not False
+        }
+
+    @staticmethod
+    def _queries(ops: List[Op]) -> Dict[int, str]:
+        return {position: op.query for position, op in enumerate(ops) if isinstance(op, SearchOp) and op.query}
+
+    @staticmethod
+    def _split(put_texts: Dict[int, List[Tuple[str, str]]], vectors: List[List[float]]):
+        result, cursor = {}, 0
+        for position, texts in put_texts.items():
+            result[position] = [(path, vectors[cursor + i]) for i, (path, _) in enumerate(texts)]
+            cursor += len(texts)
+        return result
+
+    def _put_vectors(self, put_texts: Dict[int, List[Tuple[str, str]]]) -> Dict[int, List[Tuple[str, Any]]]:
+        texts = [text for entries in put_texts.values() for _, text in entries]
+        return self._split(put_texts, self.embeddings.embed_documents(texts)) if texts else {}
+
+    async def _aput_vectors(self, put_texts: Dict[int, List[Tuple[str, str]]]) -> Dict[int, List[Tuple[str, Any]]]:
+        texts = [text for entries in put_texts.values() for _, text in entries]
+        return self._split(put_texts, await self.embeddings.aembed_documents(texts)) if texts else {}
+
+    # ------------------------------------------------------------------
+    # 인덱스 갱신
+    # ------------------------------------------------------------------
+    def _index_vectors(self, namespace: Namespace, key: str, vectors: List[Tuple[str, Any]]):
+        self._unindex(namespace, key)
+        if not vectors:
+            return
+        index = self._indexes.get(namespace)
+        if index is None:
+            index = self._indexes[namespace] = VectorIndex(self.dims)
+        rows = [(key, path) for path, _ in vectors]
+        index.add(rows, [vector for _, vector in vectors])
+        self._rows.setdefault(namespace, {})[key] = rows
+        self._max_rows_per_item = max(self._max_rows_per_item, len(rows))
+
+    def _unindex(self, namespace: Namespace, key: str):
+        rows = self._rows.get(namespace, {}).pop(key, None)
+        if rows:
+            self._indexes[namespace].remove(rows)
+
+    # ------------------------------------------------------------------
+    # 할당량
+    # ------------------------------------------------------------------
+    def _touch(self, result: Result):
+        """조회/검색된 항목을 최근 사용으로 기록"""
+        for item in result if isinstance(result, list) else [result]:
+            if isinstance(item, Item) and (item.namespace, item.key) in self._usage:
+                self._usage.touch(item.namespace, item.key)
+
+    def _record_put(self, op: PutOp, vectors: Optional[List[Tuple[str, Any]]]):
+        """적용된 put을 인덱스와 사용 기록에 반영"""
+        if op.value is None:
+            self._unindex(op.namespace, op.key)
+            self._usage.discard(op.namespace, op.key)
+            return
+        if vectors is not None:
+            self._index_vectors(op.namespace, op.key, vectors)
+        self._usage.touch(op.namespace, op.key)
+        self._enforce_quota(op.namespace)
+
+    def _evict(self, namespace: Namespace, keys: List[str]):
+        if keys:
+            InMemoryStore.batch(self, [PutOp(namespace, key, None) for key in keys])
+            for key in keys:
+                self._unindex(namespace, key)
+
+    def _enforce_quota(self, namespace: Namespace):
+        """put 후 namespace 항목 한도와 전체 namespace 한도 적용"""
+        self._evict(namespace, self._usage.over_quota(namespace))
+        for idle_namespace, keys in self._usage.idle_namespaces().items():
+            self._evict(idle_namespace, keys)
+            self._indexes.pop(idle_namespace, None)
+            self._rows.pop(idle_namespace, None)
+            logger.info(f"Evicted idle memory namespace {idle_namespace} ({len(keys)} items)")
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+    def _normalize_query(self, vector: Any) -> np.ndarray:
+        query = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        return query / norm if norm > 0 else query
+
+    def _search(self, op: SearchOp, query: np.ndarray) -> List[SearchItem]:
+        prefix = tuple(op.namespace_prefix)
+        wanted = op.offset + op.limit
+        namespaces = [namespace for namespace in self._indexes if namespace[:len(prefix)] == prefix]
+        scores: Dict[Tuple[Namespace, str], float] = {}
+        unscored: List[Tuple[Namespace, str]] = []
+
+        if op.filter:
+            # 필터 조건은 InMemoryStore에 맡기고 통과한 항목만 점수 계산
+            candidates = InMemoryStore.batch(self, [op._replace(query=None, offset=0, limit=sys.maxsize)])[0]
+            for item in candidates:
+                rows = self._rows.get(item.namespace, {}).get(item.key)
+                if not rows:
+                    unscored.append((item.namespace, item.key))
+                    continue
+                row_scores = self._indexes[item.namespace].score(query, rows)
+                scores[(item.namespace, item.key)] = max(row_scores.values())
+        else:
+            k = wanted * self._max_rows_per_item
+            for namespace in namespaces:
+                for (key, _), score in self._indexes[namespace].search(query[None, :], k)[0]:
+                    item_key = (namespace, key)
+                    if score > scores.get(item_key, -np.inf):
+                        scores[item_key] = score
+            if len(scores) < wanted:
+                # 아직 색인되지 않은 항목은 점수 없이 뒤에 포함 (InMemoryStore와 동일)
+                listed = InMemoryStore.batch(
+                    self, [op._replace(query=None, offset=0, limit=wanted + len(scores))]
+                )[0]
+                unscored = [(item.namespace, item.key) for item in listed if (item.namespace, item.key) not in scores]
+
+        ranked = sorted(scores.items(), key=lambda entry: entry[1], reverse=True)
+        selected = (ranked + [(item_key, None) for item_key in unscored])[op.offset:wanted]
+        items = InMemoryStore.batch(self, [GetOp(namespace, key) for (namespace, key), _ in selected])
+        return [
+            SearchItem(
+                namespace=item.namespace, key=item.key, value=item.value,
+                created_at=item.created_at, updated_at=item.updated_at, score=score,
+            )
+            for item, (_, score) in zip(items, selected)
+            if item is not None
+        ]
+
+    # ------------------------------------------------------------------
+    # BaseStore
+    # ------------------------------------------------------------------
+    def _apply(self, ops: List[Op], put_vectors: Dict[int, List[Tuple[str, Any]]],
+               query_vectors: Dict[int, Any]) -> List[Result]:
+        results: List[Result] = []
+        with self._lock:
+            for position, op in enumerate(ops):
+                if isinstance(op, PutOp):
+                    results.extend(InMemoryStore.batch(self, [op._replace(index=False)]))
+                    self._record_put(op, put_vectors.get(position))
+                    continue
+                if isinstance(op, SearchOp) and position in query_vectors:
+                    results.append(self._search(op, self._normalize_query(query_vectors[position])))
+                else:
+                    results.extend(InMemoryStore.batch(self, [op]))
+                self._touch(results[-1])
+        return results
+
+    def batch(self, ops: Iterable[Op]) -> List[Result]:
+        ops = list(ops)
+        queries = self._queries(ops)
+        query_vectors = dict(zip(queries, self.embeddings.embed_documents(list(queries.values())))) if queries else {}
+        return self._apply(ops, self._put_vectors(self._put_texts(ops)), query_vectors)
+
+    async def abatch(self, ops: Iterable[Op]) -> List[Result]:
+        ops = list(ops)
+        queries = self._queries(ops)
+        query_vectors = (
+            dict(zip(queries, await self.embeddings.aembed_documents(list(queries.values())))) if queries else {}
+        )
+        return self._apply(ops, await self._aput_vectors(self._put_texts(ops)), query_vectors)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            indexes = {"/".join(namespace): index.get_stats() for namespace, index in self._indexes.items()}
+        stats = {
+            "namespaces": len(indexes),
+            "vectors": sum(index["vectors"] for index in indexes.values()),
+            "index_bytes": sum(index["bytes"] for index in indexes.values()),
+            "indexes": indexes,
+            "quota": self._usage.get_stats(),
+        }
+        if hasattr(self.embeddings, "get_stats"):
+            stats["embeddings"] = self.embeddings.get_stats()
+        return stats
+
+
+class WriteBehindStore(IndexedStore):
+    """임베딩/색인을 백그라운드 워커로 미루는 IndexedStore"""
+
+    def __init__(self, *, index: Dict[str, Any], **kwargs: Any):
+        super().__init__(index=index, **kwargs)
+        self._versions: Dict[Tuple[Namespace, str], int] = {}
+        self._pending = 0
+        self.write_stats = {"deferred_puts": 0, "indexed": 0, "superseded": 0, "index_errors": 0}
+
+    def _put_vectors(self, put_texts):
+        return {}
+
+    async def _aput_vectors(self, put_texts):
+        return {}
+
+    def _apply(self, ops, put_vectors, query_vectors):
+        deferred: List[Tuple[PutOp, List[Tuple[str, str]], int]] = []
+        with self._lock:
+            put_texts = self._put_texts(ops)
+            for position, op in enumerate(ops):
+                if isinstance(op, PutOp):
+                    item_key = (op.namespace, op.key)
+                    self._versions[item_key] = self._versions.get(item_key, 0) + 1
+                    if position in put_texts:
+                        deferred.append((op, put_texts[position], self._versions[item_key]))
+            results = super()._apply(ops, put_vectors, query_vectors)
+            self._pending += len(deferred)
+            self.write_stats["deferred_puts"] += len(deferred)
+
+        worker = get_embedding_worker()
+        for op, texts, version in deferred:
+            worker.submit(self._index(op, texts, version))
+        return results
+
+    async def _index(self, op: PutOp, texts: List[Tuple[str, str]], version: int):
+        """워커 루프에서 실행 - 임베딩 후 그 사이 값이 바뀌지 않았을 때만 인덱스에 반영"""
+        try:
+            vectors = await self.embeddings.aembed_documents([text for _, text in texts]) if texts else []
+            with self._lock:
+                item_key = (op.namespace, op.key)
+                # 그 사이 값이 바뀌었거나 할당량으로 제거된 항목은 색인하지 않음
+                if self._versions.get(item_key) != version or item_key not in self._usage:
+                    self.write_stats["superseded"] += 1
+                    return
+                self._index_vectors(op.namespace, op.key, [(path, vector) for (path, _), vector in zip(texts, vectors)])
+                self.write_stats["indexed"] += 1
+        except Exception as e:
+            self.write_stats["index_errors"] += 1
+            logger.warning(f"Background indexing of {op.namespace}/{op.key} failed: {e}")
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def wait_for_indexing(self, timeout: float = 30.0) -> bool:
+        """보류 중인 색인이 끝날 때까지 대기 (벤치마크/종료 시)"""
+        deadline = time.monotonic() + timeout
+        while self._pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return not self._pending
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**super().get_stats(), "pending_index": self._pending, **self.write_stats}
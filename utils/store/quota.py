@@ -0,0 +1,91 @@
+"""
+메모리 namespace 할당량
+에이전트 메모리는 사용자/engagement(thread)별 namespace에 저장되며 (create_memory_namespace)
+namespace마다 항목 수 한도를, 전체에는 namespace 수 한도를 두고 넘으면 가장 오래전에 사용한 것부터 제거
+
+환경변수:
+- MEMORY_NAMESPACE_MAX_ITEMS: namespace당 최대 항목 수 (기본 1000, 0이면 무제한)
+- MEMORY_MAX_NAMESPACES: 최대 namespace 수 (기본 256, 0이면 무제한)
+"""
+
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+Namespace = Tuple[str, ...]
+
+
+@dataclass
+class MemoryQuota:
+    """namespace 할당량"""
+    max_items: int = 1000
+    max_namespaces: int = 256
+
+
+def get_memory_quota() -> MemoryQuota:
+    return MemoryQuota(
+        max_items=int(os.getenv("MEMORY_NAMESPACE_MAX_ITEMS", "1000")),
+        max_namespaces=int(os.getenv("MEMORY_MAX_NAMESPACES", "256")),
+    )
+
+
+class UsageTracker:
+    """namespace/항목 사용 순서 (LRU) 기록 - 호출하는 쪽에서 lock 보호"""
+
+    def __init__(self, quota: Optional[MemoryQuota] = None):
+        self.quota = quota or get_memory_quota()
+        self.namespaces: "OrderedDict[Namespace, OrderedDict[str, None]]" = OrderedDict()
+        self.stats = {"evicted_items": 0, "evicted_namespaces": 0}
+
+    def __contains__(self, item: Tuple[Namespace, str]) -> bool:
+        namespace, key = item
+        return key in self.namespaces.get(namespace, ())
+
+    def touch(self, namespace: Namespace, key: str):
+        keys = self.namespaces.get(namespace)
+        if keys is None:
+            keys = self.namespaces[namespace] = OrderedDict()
+        keys[key] = None
+        keys.move_to_end(key)
+        self.namespaces.move_to_end(namespace)
+
+    def discard(self, namespace: Namespace, key: str):
+        keys = self.namespaces.get(namespace)
+        if keys is not None:
+            keys.pop(key, None)
+            if not keys:
+                del self.namespaces[namespace]
+
+    def over_quota(self, namespace: Namespace) -> List[str]:
+        """namespace 항목 한도를 넘는 가장 오래된 키 (추적에서도 제거)"""
+        keys = self.namespaces.get(namespace)
+        if not keys or not self.quota.max_items:
+            return []
+        evicted = []
+        while len(keys) > self.quota.max_items:
+            key, _ = keys.popitem(last=False)
+            evicted.append(key)
+        self.stats["evicted_items"] += len(evicted)
+        return evicted
+
+    def idle_namespaces(self) -> Dict[Namespace, List[str]]:
+        """namespace 수 한도를 넘는 가장 오래 사용하지 않은 namespace와 그 키 (추적에서도 제거)"""
+        evicted: Dict[Namespace, List[str]] = {}
+        if not self.quota.max_namespaces:
+            return evicted
+        while len(self.namespaces) > self.quota.max_namespaces:
+            namespace, keys = self.namespaces.popitem(last=False)
+            evicted[namespace] = list(keys)
+        self.stats["evicted_namespaces"] += len(evicted)
+        return evicted
+
+    def get_stats(self) -> Dict[str, int]:
+        sizes = [len(keys) for keys in self.namespaces.values()]
+        return {
+            "max_items": self.quota.max_items,
+            "max_namespaces": self.quota.max_namespaces,
+            "namespaces": len(sizes),
+            "largest_namespace": max(sizes, default=0),
+            **self.stats,
+        }
@@ -0,0 +1,208 @@
+"""
+메모리 스토어용 벡터 인덱스
+- FlatIndex: 연속된 NumPy float32 행렬 + 배치 내적(top-k는 argpartition) - 정확한 검색
+  삽입은 용량을 두 배씩 늘려 amortized O(1), 삭제는 마지막 행과 교체하여 O(1)
+- GraphIndex: hnswlib(선택 의존성)가 설치되어 있으면 VECTOR_INDEX_ANN_THRESHOLD 이상에서 사용하는 근사 그래프 인덱스
+- VectorIndex: namespace 하나의 인덱스 (항상 FlatIndex 유지, 크기가 커지면 GraphIndex로 top-k 검색)
+
+벡터는 삽입 시 L2 정규화하므로 내적 = 코사인 유사도
+
+환경변수:
+- VECTOR_INDEX_ANN_THRESHOLD: 근사 인덱스를 사용하기 시작하는 벡터 수 (기본 100000, 0이면 사용 안 함)
+- VECTOR_INDEX_ANN_EF: 근사 검색 후보 크기 (기본 128)
+"""
+
+import os
+import logging
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import hnswlib
+except ImportError:  # 근사 인덱스는 선택 의존성
+    hnswlib = None
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(vectors: Any, dims: int) -> np.ndarray:
+    matrix = np.asarray(vectors, dtype=np.float32).reshape(-1, dims)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """행별 상위 k개 열 인덱스 (점수 내림차순)"""
+    if k >= scores.shape[1]:
+        return np.argsort(-scores, axis=1)
+    candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, candidates, axis=1), axis=1)
+    return np.take_along_axis(candidates, order, axis=1)
+
+
+class FlatIndex:
+    """정확한 내적 top-k 인덱스"""
+
+    def __init__(self, dims: int, capacity: int = 1024):
+        self.dims = dims
+        self.matrix = np.zeros((capacity, dims), dtype=np.float32)
+        self.ids: List[Hashable] = []
+        self.rows: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _reserve(self, size: int):
+        if size <= self.matrix.shape[0]:
+            return
+        capacity = max(self.matrix.shape[0] * 2, size)
+        grown = np.zeros((capacity, self.dims), dtype=np.float32)
+        grown[:len(self.ids)] = self.matrix[:len(self.ids)]
+        self.matrix = grown
+
+    def add(self, ids: Sequence[Hashable], vectors: np.ndarray):
+        """벡터 추가 (이미 있는 ID는 덮어씀) - vectors는 정규화된 (n, dims)"""
+        self._reserve(len(self.ids) + len(ids))
+        for item_id, vector in zip(ids, vectors):
+            row = self.rows.get(item_id)
+            if row is None:
+                row = len(self.ids)
+                self.ids.append(item_id)
+                self.rows[item_id] = row
+            self.matrix[row] = vector
+
+    def remove(self, ids: Sequence[Hashable]):
+        """삭제할 행에 마지막 행을 옮겨 행렬을 연속으로 유지"""
+        for item_id in ids:
+            row = self.rows.pop(item_id, None)
+            if row is None:
+                continue
+            last = len(self.ids) - 1
+            if row != last:
+                moved = self.ids[last]
+                self.matrix[row] = self.matrix[last]
+                self.ids[row] = moved
+                self.rows[moved] = row
+            self.ids.pop()
+
+    def search(self, queries: np.ndarray, k: int) -> List[List[Tuple[Hashable, float]]]:
+        """정규화된 (q, dims) 질의 배치에 대한 top-k (ID, 점수)"""
+        if not self.ids or k <= 0:
+            return [[] for _ in range(len(queries))]
+        scores = queries @ self.matrix[:len(self.ids)].T
+        top = _top_k(scores, k)
+        return [
+            [(self.ids[column], float(scores[row, column])) for column in top[row]]
+            for row in range(len(queries))
+        ]
+
+    def score(self, query: np.ndarray, ids: Sequence[Hashable]) -> Dict[Hashable, float]:
+        """지정한 ID만 점수 계산 (필터가 있는 검색)"""
+        present = [item_id for item_id in ids if item_id in self.rows]
+        if not present:
+            return {}
+        rows = np.fromiter((self.rows[item_id] for item_id in present), dtype=np.int64, count=len(present))
+        scores = self.matrix[rows] @ query
+        return dict(zip(present, scores.tolist()))
+
+
+class GraphIndex:
+    """hnswlib HNSW 근사 인덱스 (내적 공간)"""
+
+    def __init__(self, dims: int, capacity: int, ef: int):
+        self.dims = dims
+        self.ef = ef
+        self.index = hnswlib.Index(space="ip", dim=dims)
+        self.index.init_index(max_elements=max(capacity, 1024), ef_construction=200, M=16, allow_replace_deleted=True)
+        self.labels: Dict[Hashable, int] = {}
+        self.ids: Dict[int, Hashable] = {}
+        self._next_label = 0
+
+    def add(self, ids: Sequence[Hashable], vectors: np.ndarray):
+        self.remove([item_id for item_id in ids if item_id in self.labels])
+        needed = self.index.get_current_count() + len(ids)
+        if needed > self.index.get_max_elements():
+            self.index.resize_index(max(needed, self.index.get_max_elements() * 2))
+        labels = np.arange(self._next_label, self._next_label + len(ids))
+        self._next_label += len(ids)
+        for item_id, label in zip(ids, labels.tolist()):
+            self.labels[item_id] = label
+            self.ids[label] = item_id
+        self.index.add_items(vectors, labels, replace_deleted=True)
+
+    def remove(self, ids: Sequence[Hashable]):
+        for item_id in ids:
+            label = self.labels.pop(item_id, None)
+            if label is not None:
+                self.ids.pop(label, None)
+                self.index.mark_deleted(label)
+
+    def search(self, queries: np.ndarray, k: int) -> List[List[Tuple[Hashable, float]]]:
+        k = min(k, len(self.labels))
+        if k <= 0:
+            return [[] for _ in range(len(queries))]
+        self.index.set_ef(max(self.ef, k))
+        labels, distances = self.index.knn_query(queries, k=k)
+        # ip 공간의 거리 = 1 - 내적
+        return [
+            [(self.ids[label], 1.0 - float(distance)) for label, distance in zip(row_labels, row_distances)]
+            for row_labels, row_distances in zip(labels.tolist(), distances.tolist())
+        ]
+
+
+class VectorIndex:
+    """namespace 하나의 벡터 인덱스 (정확 + 선택적 근사)"""
+
+    def __init__(self, dims: int, ann_threshold: Optional[int] = None, ann_ef: Optional[int] = None):
+        self.dims = dims
+        self.flat = FlatIndex(dims)
+        self.graph: Optional[GraphIndex] = None
+        self.ann_threshold = ann_threshold if ann_threshold is not None else int(
+            os.getenv("VECTOR_INDEX_ANN_THRESHOLD", "100000")
+        )
+        self.ann_ef = ann_ef or int(os.getenv("VECTOR_INDEX_ANN_EF", "128"))
+
+    def __len__(self) -> int:
+        return len(self.flat)
+
+    def normalize(self, vectors: Any) -> np.ndarray:
+        return _normalize(vectors, self.dims)
+
+    def add(self, ids: Sequence[Hashable], vectors: Any):
+        if not ids:
+            return
+        matrix = self.normalize(vectors)
+        self.flat.add(ids, matrix)
+        if self.graph is not None:
+            self.graph.add(ids, matrix)
+        elif hnswlib is not None and self.ann_threshold and len(self.flat) >= self.ann_threshold:
+            self.build_graph()
+
+    def build_graph(self):
+        logger.info(f"Building approximate vector index for {len(self.flat)} vectors")
+        self.graph = GraphIndex(self.dims, len(self.flat) * 2, self.ann_ef)
+        self.graph.add(list(self.flat.ids), self.flat.matrix[:len(self.flat)])
+
+    def remove(self, ids: Sequence[Hashable]):
+        self.flat.remove(ids)
+        if self.graph is not None:
+            self.graph.remove(ids)
+
+    def search(self, queries: np.ndarray, k: int, exact: bool = False) -> List[List[Tuple[Hashable, float]]]:
+        """정규화된 질의 배치의 top-k"""
+        if self.graph is not None and not exact:
+            return self.graph.search(queries, k)
+        return self.flat.search(queries, k)
+
+    def score(self, query: np.ndarray, ids: Sequence[Hashable]) -> Dict[Hashable, float]:
+        return self.flat.score(query, ids)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "vectors": len(self.flat),
+            "capacity": int(self.flat.matrix.shape[0]),
+            "bytes": int(self.flat.matrix.nbytes),
+            "approximate": self.graph is not None,
+        }
@@ -0,0 +1,236 @@
+"""
+Run Supervisor - 에이전트별 스텝 예산과 반복/루프 감지
+전역 RECURSION_LIMIT에 도달하기 전에 동일한 도구 호출 반복, 같은 에이전트 간 ping-pong handoff,
+에이전트별 스텝 예산 초과를 감지하여 교정 메시지를 주입하거나 실행을 조기 종료
+"""
+
+import os
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+
+logger = logging.getLogger(__name__)
+
+SUPERVISOR_PREFIX = "[Supervisor]"
+
+
+@dataclass
+class SupervisorConfig:
+    """에이전트별 감독 설정"""
+    max_steps: int = 25              # 한 실행(사용자 입력 1회)에서 에이전트당 최대 LLM 호출 수
+    repeat_threshold: int = 3        # 동일한 도구 호출(이름+인자)이 이 횟수 이상이면 반복으로 판단
+    pingpong_threshold: int = 3      # 같은 두 에이전트 간 왕복 handoff 횟수
+    max_interventions: int = 2       # 교정 메시지 후에도 계속되면 실행 종료
+
+
+@dataclass
+class Verdict:
+    """감독 판단 결과"""
+    action: str = "continue"         # "continue" | "correct" | "stop"
+    reason: str = ""
+
+
+def get_supervisor_config(agent_name: str) -> SupervisorConfig:
+    """환경변수에서 설정 로드 - SUPERVISOR_MAX_STEPS_<AGENT>로 에이전트별 override"""
+    suffix = agent_name.upper()
+
+    def _read(key: str, default: int) -> int:
+        return int(os.getenv(f"{key}_{suffix}", os.getenv(key, str(default))))
+
+    defaults = SupervisorConfig()
+    return SupervisorConfig(
+        max_steps=_read("SUPERVISOR_MAX_STEPS", defaults.max_steps),
+        repeat_threshold=_read("SUPERVISOR_REPEAT_THRESHOLD", defaults.repeat_threshold),
+        pingpong_threshold=_read("SUPERVISOR_PINGPONG_THRESHOLD", defaults.pingpong_threshold),
+        max_interventions=_read("SUPERVISOR_MAX_INTERVENTIONS", defaults.max_interventions),
+    )
+
+
+def is_supervisor_enabled() -> bool:
+    return os.getenv("RUN_SUPERVISOR", "true").lower() == "true"
+
+
+def _current_run(messages: List[BaseMessage]) -> List[BaseMessage]:
+    """마지막 사용자 입력 이후의 메시지 (현재 실행 범위)"""
+    for index in range(len(messages) - 1, -1, -1):
+        if isinstance(messages[index], HumanMessage):
+            return messages[index:]
+    return messages
+
+
+def _tool_call_signature(tool_call: Dict[str, Any]) -> str:
+    return f"{tool_call['name']}:{json.dumps(tool_call.get('args', {}), sort_keys=True, default=str)}"
+
+
+def _is_handoff_call(tool_call: Dict[str, Any]) -> bool:
+    return tool_call["name"].startswith("transfer_to_")
+
+
+@dataclass
+class _AgentMetrics:
+    llm_calls: int = 0
+    wasted_llm_calls: int = 0
+    interventions: int = 0
+    early_stops: int = 0
+
+
+class RunSupervisor:
+    """실행 단위 감독자 (프로세스 전역, 에이전트 hook에서 공유)"""
+
+    def __init__(self, max_runs: int = 256):
+        self._lock = threading.Lock()
+        self._max_runs = max_runs
+        # (thread_id, run anchor id) -> {"interventions": {agent: n}, "seen": set(ai message ids)}
+        self._runs: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._metrics: Dict[str, _AgentMetrics] = {}
+
+    def _get_run(self, key: Tuple[str, str]) -> Dict[str, Any]:
+        run = self._runs.get(key)
+        if run is None:
+            run = {"interventions": {}, "seen": set()}
+            self._runs[key] = run
+            while len(self._runs) > self._max_runs:
+                self._runs.popitem(last=False)
+        else:
+            self._runs.move_to_end(key)
+        return run
+
+    # ------------------------------------------------------------------
+    # 감지
+    # ------------------------------------------------------------------
+    def _detect_repeat(self, ai_messages: List[AIMessage], config: SupervisorConfig) -> Optional[str]:
+        """가장 최근 도구 호출이 이전과 동일하게 반복되는지"""
+        if not ai_messages or not ai_messages[-1].tool_calls:
+            return None
+        counts: Dict[str, int] = {}
+        for message in ai_messages:
+            for tool_call in message.tool_calls:
+                if _is_handoff_call(tool_call):
+                    continue
+                signature = _tool_call_signature(tool_call)
+                counts[signature] = counts.get(signature, 0) + 1
+        for tool_call in ai_messages[-1].tool_calls:
+            if _is_handoff_call(tool_call):
+                continue
+            if counts.get(_tool_call_signature(tool_call), 0) >= config.repeat_threshold:
+                return (
+                    f"the tool call `{tool_call['name']}` with identical arguments has been repeated "
+                    f"{counts[_tool_call_signature(tool_call)]} times in this run"
+                )
+        return None
+
+    def _detect_pingpong(self, ai_messages: List[AIMessage], config: SupervisorConfig) -> Optional[str]:
+        """같은 두 에이전트가 번갈아가며 handoff 하는지 (handoff 직후에만 판단)"""
+        if not ai_messages or not any(_is_handoff_call(c) for c in ai_messages[-1].tool_calls):
+            return None
+        transfers: List[Tuple[str, str]] = []
+        for message in ai_messages:
+            for tool_call in message.tool_calls:
+                if _is_handoff_call(tool_call):
+                    source = message.name or ""
+                    destination = tool_call["name"].removeprefix("transfer_to_")
+                    transfers.append((source.lower(), destination.lower()))
+        window = config.pingpong_threshold * 2
+        if len(transfers) < window:
+            return None
+        recent = transfers[-window:]
+        pair = {recent[0][0], recent[0][1]}
+        if len(pair) != 2 or any({source, destination} != pair for source, destination in recent):
+            return None
+        return (
+            f"control has been handed back and forth between {' and '.join(sorted(pair))} "
+            f"{config.pingpong_threshold} times without progress"
+        )
+
+    def _detect_budget(self, agent_name: str, ai_messages: List[AIMessage], config: SupervisorConfig) -> Optional[str]:
+        steps = sum(1 for message in ai_messages if message.name in (None, agent_name))
+        if steps >= config.max_steps:
+            return f"{agent_name} has used {steps} of its {config.max_steps} step budget for this run"
+        return None
+
+    # ------------------------------------------------------------------
+    # 판단
+    # ------------------------------------------------------------------
+    def check(self, agent_name: str, messages: List[BaseMessage], thread_id: str = "default",
+              config: Optional[SupervisorConfig] = None) -> Verdict:
+        """LLM 호출 직전 상태 점검"""
+        config = config or get_supervisor_config(agent_name)
+        run_messages = _current_run(messages)
+        ai_messages = [m for m in run_messages if isinstance(m, AIMessage)]
+        key = (thread_id, (run_messages[0].id or "") if run_messages else "")
+
+        with self._lock:
+            metrics = self._metrics.setdefault(agent_name, _AgentMetrics())
+            metrics.llm_calls += 1
+            run = self._get_run(key)
+
+            loop = self._detect_repeat(ai_messages, config) or self._detect_pingpong(ai_messages, config)
+            # 직전 응답이 반복 호출/ping-pong이었다면 그 LLM 호출은 낭비로 집계 (응답당 1회)
+            if loop and ai_messages[-1].id not in run["seen"]:
+                source = ai_messages[-1].name or agent_name
+                self._metrics.setdefault(source, _AgentMetrics()).wasted_llm_calls += 1
+            if ai_messages:
+                run["seen"].add(ai_messages[-1].id)
+
+            reason = loop or self._detect_budget(agent_name, ai_messages, config)
+            if not reason:
+                return Verdict()
+
+            interventions = run["interventions"].get(agent_name, 0) + 1
+            run["interventions"][agent_name] = interventions
+            if interventions > config.max_interventions:
+                metrics.early_stops += 1
+                logger.warning(f"[{agent_name}] stopping run: {reason}")
+                return Verdict(action="stop", reason=reason)
+            metrics.interventions += 1
+            logger.info(f"[{agent_name}] corrective intervention {interventions}: {reason}")
+            return Verdict(action="correct", reason=reason)
+
+    def get_metrics(self) -> Dict[str, Dict[str, int]]:
+        """에이전트별 감독 지표"""
+        with self._lock:
+            return {
+                agent: {
+                    "llm_calls": m.llm_calls,
+                    "wasted_llm_calls": m.wasted_llm_calls,
+                    "interventions": m.interventions,
+                    "early_stops": m.early_stops,
+                }
+                for agent, m in self._metrics.items()
+            }
+
+
+def build_corrective_message(verdict: Verdict) -> HumanMessage:
+    """교정 메시지 - 대화 중간의 system 메시지를 허용하지 않는 provider가 있어 HumanMessage로 전달"""
+    return HumanMessage(content=(
+        f"{SUPERVISOR_PREFIX} Warning: {verdict.reason}. "
+        "Do not repeat the same action. Use the results you already have, try a different approach, "
+        "or hand off to the Summary agent if the objective cannot be advanced."
+    ))
+
+
+class RunStoppedError(Exception):
+    """감독자가 실행을 조기 종료할 때 발생 (executor에서 정상 종료로 처리)"""
+
+    def __init__(self, agent_name: str, reason: str):
+        self.agent_name = agent_name
+        self.reason = reason
+        super().__init__(f"{SUPERVISOR_PREFIX} Run stopped early by {agent_name}: {reason}")
+
+
+# 전역 인스턴스 (싱글톤)
+_run_supervisor: Optional[RunSupervisor] = None
+
+
+def get_run_supervisor() -> RunSupervisor:
+    """전역 실행 감독자 인스턴스 반환"""
+    global _run_supervisor
+    if _run_supervisor is None:
+        _run_supervisor = RunSupervisor()
+    return _run_supervisor
+
@@ -4,11 +4,15 @@ from langchain_core.messages import ToolMessage
 from langchain_core.tools import BaseTool, InjectedToolCallId, tool
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.prebuilt import InjectedState, ToolNode
-from langgraph.types import Command
-from typing_extensions import Annotated
+from langgraph.types import Command, Send
+from typing_extensions import Annotated, TypedDict
 
 WHITESPACE_RE = re.compile(r"\s+")
 METADATA_KEY_HANDOFF_DESTINATION = "__handoff_destination"
+METADATA_KEY_BRANCH_DESTINATIONS = "__branch_destinations"
+BRANCH_NODE_SUFFIX = "_branch"
+BRANCH_JOIN_NODE = "branch_join"
+PARALLEL_DISPATCH_TOOL_NAME = "dispatch_parallel_tasks"
 
 
 def _normalize_agent_name(agent_name: str) -> str:
@@ -59,6 +63,88 @@ def create_handoff_tool(
     return handoff_to_agent
 
 
+def get_branch_node_name(agent_name: str) -> str:
+    """Name of the graph node that runs `agent_name` as an isolated parallel branch."""
+    return f"{agent_name}{BRANCH_NODE_SUFFIX}"
+
+
+class BranchTask(TypedDict):
+    """A single independent work item for a parallel branch."""
+
+    agent: str
+    """Name of the agent that should run the task."""
+    task: str
+    """Self-contained task description, including the target and all required context."""
+
+
+def create_parallel_dispatch_tool(
+    *,
+    agent_name: str,
+    destinations: list[str],
+    name: str = PARALLEL_DISPATCH_TOOL_NAME,
+    description: str | None = None,
+    max_tasks: int = 8,
+) -> BaseTool:
+    """Create a tool that fans independent tasks out to several agents at once.
+
+    Every task is sent to the `<agent>_branch` node of the swarm with LangGraph `Send`,
+    so all branches run in the same superstep. The swarm's `branch_join` node merges the
+    branch results into a single tool response and hands control back to `agent_name`.
+
+    Args:
+        agent_name: Name of the agent that owns the tool; control returns to it after the join.
+        destinations: Agents that may run branches.
+        name: Tool name.
+        description: Optional tool description.
+        max_tasks: Maximum number of tasks accepted by a single dispatch.
+    """
+    if description is None:
+        description = (
+            "Run several independent tasks in parallel, e.g. reconnaissance of multiple hosts. "
+            f"Each task goes to one of: {', '.join(destinations)}. "
+            "Results of all tasks are returned together when every branch has finished."
+        )
+
+    @tool(name, description=description)
+    def dispatch_parallel_tasks(
+        tasks: list[BranchTask],
+        state: Annotated[dict, InjectedState],
+        tool_call_id: Annotated[str, InjectedToolCallId],
+    ):
+        if not tasks:
+            return "No tasks were provided. Provide at least one task."
+        invalid = sorted({task["agent"] for task in tasks if task["agent"] not in destinations})
+        if invalid:
+            return f"Unknown agents {invalid}. Parallel tasks can only go to: {destinations}"
+        if len(tasks) > max_tasks:
+            return f"Too many tasks ({len(tasks)}). Dispatch at most {max_tasks} tasks at once."
+
+        sends = [
+            Send(
+                get_branch_node_name(task["agent"]),
+                {
+                    "branch_agent": task["agent"],
+                    "branch_task": task["task"],
+                    "branch_index": index,
+                    "branch_origin": agent_name,
+                    "branch_tool_call_id": tool_call_id,
+                },
+            )
+            for index, task in enumerate(tasks)
+        ]
+        # The tool call is answered by the join node once all branches have finished.
+        return Command(
+            goto=sends,
+            graph=Command.PARENT,
+            update={"messages": state["messages"], "active_agent": agent_name},
+        )
+
+    dispatch_parallel_tasks.metadata = {
+        METADATA_KEY_BRANCH_DESTINATIONS: [get_branch_node_name(dest) for dest in destinations]
+    }
+    return dispatch_parallel_tasks
+
+
 def get_handoff_destinations(agent: CompiledStateGraph, tool_node_name: str = "tools") -> list[str]:
     """Get a list of destinations from agent's handoff tools."""
     nodes = agent.get_graph().nodes
@@ -70,8 +156,12 @@ def get_handoff_destinations(agent: CompiledStateGraph, tool_node_name: str = "t
         return []
 
     tools = tool_node.tools_by_name.values()
-    return [
+    destinations = [
         tool.metadata[METADATA_KEY_HANDOFF_DESTINATION]
         for tool in tools
         if tool.metadata is not None and METADATA_KEY_HANDOFF_DESTINATION in tool.metadata
-    ]
\ No newline at end of file
+    ]
+    for handoff_tool in tools:
+        if handoff_tool.metadata is not None and METADATA_KEY_BRANCH_DESTINATIONS in handoff_tool.metadata:
+            destinations.extend(handoff_tool.metadata[METADATA_KEY_BRANCH_DESTINATIONS])
+    return destinations
\ No newline at end of file
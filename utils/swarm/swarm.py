@@ -1,8 +1,29 @@
+import asyncio
+import os
+import time
+import weakref
+
+from langchain_core.messages import HumanMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.errors import ParentCommand
 from langgraph.graph import START, MessagesState, StateGraph
 from langgraph.pregel import Pregel
-from typing_extensions import Any, Literal, Optional, Type, TypeVar, Union, get_args, get_origin
+from langgraph.types import Command
+from typing_extensions import Annotated, Any, Literal, Optional, Type, TypeVar, Union, get_args, get_origin
 
-from src.utils.swarm.handoff import get_handoff_destinations
+from src.utils.swarm.handoff import (
+    BRANCH_JOIN_NODE,
+    PARALLEL_DISPATCH_TOOL_NAME,
+    get_branch_node_name,
+    get_handoff_destinations,
+)
+
+
+def _merge_branch_results(left: Optional[list[dict]], right: Optional[list[dict]]) -> list[dict]:
+    """Accumulate parallel branch results; a `None` update clears them after the join."""
+    if right is None:
+        return []
+    return (left or []) + right
 
 
 class SwarmState(MessagesState):
@@ -13,6 +34,94 @@ class SwarmState(MessagesState):
     # If active agent is typed as a `str`, we turn it into enum of all active agent names.
     active_agent: Optional[str]
 
+    # Results of parallel branches dispatched with `dispatch_parallel_tasks`,
+    # collected until the `branch_join` node merges them back into `messages`.
+    branch_results: Annotated[list[dict], _merge_branch_results]
+
+
+def get_max_parallel_branches() -> int:
+    """Maximum number of concurrently running parallel branches (0 disables fan-out)."""
+    return int(os.getenv("SWARM_MAX_PARALLEL_BRANCHES", "4"))
+
+
+# Semaphores per event loop: Streamlit and the CLI may run workflows on different loops.
+_branch_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[int, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_branch_semaphore(limit: int) -> asyncio.Semaphore:
+    semaphores = _branch_semaphores.setdefault(asyncio.get_running_loop(), {})
+    if limit not in semaphores:
+        semaphores[limit] = asyncio.Semaphore(limit)
+    return semaphores[limit]
+
+
+def _make_branch_node(agent: Pregel, max_parallel_branches: int):
+    """Create a node that runs `agent` on a single task with an isolated message history."""
+
+    async def run_branch(branch: dict, config: RunnableConfig) -> dict:
+        messages: list = []
+        error = None
+        async with _get_branch_semaphore(max_parallel_branches):
+            started = time.monotonic()
+            try:
+                result = await agent.ainvoke(
+                    {"messages": [HumanMessage(content=branch["branch_task"])]}, config
+                )
+                messages = result.get("messages", [])
+            except ParentCommand as bubble:
+                # A handoff inside a branch ends the branch; keep what it produced so far.
+                command = bubble.args[0]
+                if isinstance(command.update, dict):
+                    messages = command.update.get("messages", [])
+            except Exception as e:
+                error = str(e)
+            elapsed = time.monotonic() - started
+
+        final = next((m for m in reversed(messages) if m.type == "ai" and m.text()), None)
+        return {
+            "branch_results": [
+                {
+                    "index": branch["branch_index"],
+                    "agent": branch["branch_agent"],
+                    "task": branch["branch_task"],
+                    "origin": branch["branch_origin"],
+                    "tool_call_id": branch["branch_tool_call_id"],
+                    "result": final.text() if final is not None else "",
+                    "error": error,
+                    "elapsed": round(elapsed, 3),
+                }
+            ]
+        }
+
+    return run_branch
+
+
+def _join_branches(state: dict) -> Command:
+    """Merge all branch results into one tool response and return control to the dispatcher."""
+    results = sorted(state.get("branch_results") or [], key=lambda r: r["index"])
+    if not results:
+        return Command(update={"branch_results": None})
+
+    sections = []
+    for result in results:
+        body = f"ERROR: {result['error']}" if result["error"] else (result["result"] or "(no output)")
+        sections.append(
+            f"### Task {result['index'] + 1} - {result['agent']} ({result['elapsed']}s)\n"
+            f"Task: {result['task']}\n\n{body}"
+        )
+    origin = results[0]["origin"]
+    tool_message = ToolMessage(
+        content="\n\n".join(sections),
+        name=PARALLEL_DISPATCH_TOOL_NAME,
+        tool_call_id=results[0]["tool_call_id"],
+    )
+    return Command(
+        goto=origin,
+        update={"messages": [tool_message], "active_agent": origin, "branch_results": None},
+    )
+
 
 StateSchema = TypeVar("StateSchema", bound=SwarmState)
 StateSchemaType = Type[StateSchema]
@@ -158,6 +267,7 @@ def create_swarm(
     default_active_agent: str,
     state_schema: StateSchemaType = SwarmState,
     config_schema: Type[Any] | None = None,
+    max_parallel_branches: int = 0,
 ) -> StateGraph:
     """Create a multi-agent swarm.
 
@@ -170,6 +280,9 @@ def create_swarm(
         state_schema: State schema to use for the multi-agent graph.
         config_schema: An optional schema for configuration.
             Use this to expose configurable parameters via `swarm.config_specs`.
+        max_parallel_branches: When greater than 0, add an `<agent>_branch` node per agent and a
+            `branch_join` node so that `dispatch_parallel_tasks` can fan tasks out concurrently.
+            At most this many branches run at the same time; the rest wait for a free slot.
 
     Returns:
         A multi-agent swarm StateGraph.
@@ -235,4 +348,11 @@ def create_swarm(
             destinations=tuple(get_handoff_destinations(agent)),
         )
 
+    if max_parallel_branches > 0:
+        for agent in agents:
+            branch_node = get_branch_node_name(agent.name)
+            builder.add_node(branch_node, _make_branch_node(agent, max_parallel_branches))
+            builder.add_edge(branch_node, BRANCH_JOIN_NODE)
+        builder.add_node(BRANCH_JOIN_NODE, _join_branches, destinations=tuple(agent_names))
+
     return builder
\ No newline at end of file